@@ -8,7 +8,7 @@ checklist completion workflows.
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Response
 from fastapi.responses import JSONResponse
 import structlog
 
@@ -19,7 +19,7 @@ from app.models.production import (
     ChecklistCompletionCreate, ChecklistCompletionResponse
 )
 from app.utils.exceptions import NotFoundError, ValidationError, BusinessLogicError
-from app.services.checklist_service import ChecklistService
+from app.services.checklist_service import ChecklistService, encode_page_cursor
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = structlog.get_logger()
@@ -64,10 +64,13 @@ async def create_checklist_template(
 
 @router.get("/templates", response_model=List[ChecklistTemplateResponse], status_code=status.HTTP_200_OK)
 async def list_checklist_templates(
+    response: Response,
     equipment_codes: Optional[str] = Query(None, description="Comma-separated equipment codes to filter by"),
     enabled_only: bool = Query(True, description="Only return enabled templates"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    min_items: Optional[int] = Query(None, ge=1, description="Only return templates with at least this many items"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (deprecated, use cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> List[ChecklistTemplateResponse]:
@@ -90,14 +93,14 @@ async def list_checklist_templates(
             equipment_codes=equipment_list,
             enabled_only=enabled_only,
             skip=skip,
-            limit=limit
+            limit=limit,
+            cursor=cursor,
+            min_items=min_items
         )
         
-        logger.debug(
-            "Checklist templates listed via API",
-            count=len(templates),
-            user_id=current_user.user_id
-        )
+        if len(templates) == limit:
+            last = templates[-1]
+            response.headers["X-Next-Cursor"] = encode_page_cursor(last.created_at, last.id)
         
         return templates
         
@@ -126,8 +129,6 @@ async def get_checklist_template(
         # Get template
         template = await checklist_service.get_checklist_template(template_id)
         
-        logger.debug("Checklist template retrieved via API", template_id=template_id, user_id=current_user.user_id)
-        
         return template
         
     except NotFoundError as e:
@@ -194,12 +195,6 @@ async def get_checklist_template_for_equipment(
         # Get template
         template = await checklist_service.get_checklist_template_for_equipment(equipment_list)
         
-        logger.debug(
-            "Checklist template for equipment retrieved via API", 
-            equipment_codes=equipment_list, 
-            user_id=current_user.user_id
-        )
-        
         return template
         
     except HTTPException:
@@ -263,8 +258,6 @@ async def get_checklist_completion(
         # Get completion
         completion = await checklist_service.get_checklist_completion(completion_id)
         
-        logger.debug("Checklist completion retrieved via API", completion_id=completion_id, user_id=current_user.user_id)
-        
         return completion
         
     except NotFoundError as e:
@@ -278,10 +271,14 @@ async def get_checklist_completion(
 
 @router.get("/completions", response_model=List[ChecklistCompletionResponse], status_code=status.HTTP_200_OK)
 async def list_checklist_completions(
+    response: Response,
     job_assignment_id: Optional[UUID] = Query(None, description="Filter by job assignment ID"),
     user_id: Optional[UUID] = Query(None, description="Filter by user ID"),
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (deprecated, use cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return"),
+    include_template: bool = Query(False, description="Include the checklist template for each completion"),
+    include_assignment: bool = Query(False, description="Include the job assignment for each completion"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     current_user: UserContext = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> List[ChecklistCompletionResponse]:
@@ -299,14 +296,15 @@ async def list_checklist_completions(
             job_assignment_id=job_assignment_id,
             user_id=user_id,
             skip=skip,
-            limit=limit
+            limit=limit,
+            include_template=include_template,
+            include_assignment=include_assignment,
+            cursor=cursor
         )
         
-        logger.debug(
-            "Checklist completions listed via API",
-            count=len(completions),
-            user_id=current_user.user_id
-        )
+        if len(completions) == limit:
+            last = completions[-1]
+            response.headers["X-Next-Cursor"] = encode_page_cursor(last.completed_at, last.id)
         
         return completions
         
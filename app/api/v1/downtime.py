@@ -11,6 +11,7 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
 
 from app.auth.permissions import Permission, get_current_user, require_permission
 from app.database import get_db
@@ -20,9 +21,8 @@ from app.models.production import (
 )
 from app.services.downtime_tracker import DowntimeTracker
 from app.utils.exceptions import ValidationError, BusinessLogicError, NotFoundError
-from app.utils.logger import get_logger
 
-logger = get_logger(__name__)
+logger = structlog.get_logger()
 router = APIRouter()
 
 
@@ -433,7 +433,8 @@ async def detect_downtime_events(
             line_id=line_id,
             equipment_code=equipment_code,
             current_status=current_status,
-            timestamp=timestamp
+            timestamp=timestamp,
+            wait_for_persist=True
         )
         
         logger.info(
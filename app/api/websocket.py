@@ -7,6 +7,7 @@ including production status, OEE data, and Andon events.
 
 import json
 import asyncio
+from datetime import datetime
 from typing import Dict, List, Set, Optional
 from uuid import UUID
 
@@ -18,8 +19,21 @@ from app.auth.jwt_handler import verify_access_token, JWTError
 from app.utils.exceptions import AuthenticationError
 from app.services.websocket_manager import websocket_manager
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger()
 
+
+def _dumps(value) -> str:
+    """Serialize a message payload to JSON text, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
 router = APIRouter()
 
 
@@ -340,6 +354,42 @@ async def broadcast_downtime_event(downtime_event: dict):
         await websocket_manager.send_to_equipment(message, equipment_code)
 
 
+async def broadcast_downtime_events_bulk(downtime_events: List[dict]):
+    """
+    Broadcast a batch of downtime events with one frame per subscriber.
+    
+    Each event is serialized once and the pieces are concatenated per connection.
+    A single event is sent as a regular ``downtime_event`` message; larger batches
+    are sent as one ``downtime_events`` message whose data is the list of events.
+    """
+    if not downtime_events:
+        return
+    
+    if len(downtime_events) == 1:
+        await broadcast_downtime_event(downtime_events[0])
+        return
+    
+    # Serialize each event once, then group by recipient connection
+    per_connection: Dict[str, List[str]] = {}
+    for downtime_event in downtime_events:
+        serialized = _dumps(downtime_event)
+        recipients = websocket_manager.get_downtime_recipients(
+            downtime_event.get("line_id"), downtime_event.get("equipment_code")
+        )
+        for connection_id in recipients:
+            per_connection.setdefault(connection_id, []).append(serialized)
+    
+    timestamp = datetime.utcnow().isoformat() + "Z"
+    await asyncio.gather(*(
+        websocket_manager.send_text(
+            '{"type":"downtime_events","data":[' + ",".join(events)
+            + '],"timestamp":"' + timestamp + '"}',
+            connection_id
+        )
+        for connection_id, events in per_connection.items()
+    ))
+
+
 async def broadcast_downtime_statistics_update(statistics_data: dict, line_id: str = None, equipment_code: str = None):
     """Broadcast downtime statistics update to relevant subscribers."""
     from datetime import datetime
@@ -44,6 +44,8 @@ class Settings(BaseSettings):
     DATABASE_POOL_SIZE: int = Field(default=10, env="DATABASE_POOL_SIZE")
     DATABASE_MAX_OVERFLOW: int = Field(default=20, env="DATABASE_MAX_OVERFLOW")
     DATABASE_ECHO: bool = Field(default=False, env="DATABASE_ECHO")
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(default=500, env="DATABASE_STATEMENT_CACHE_SIZE")
+    DATABASE_REPLICA_URL: Optional[str] = Field(default=None, env="DATABASE_REPLICA_URL")
     
     # Redis Settings (for caching and sessions)
     REDIS_URL: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -110,6 +112,9 @@ class Settings(BaseSettings):
     MAINTENANCE_REMINDER_DAYS: int = Field(default=7, env="MAINTENANCE_REMINDER_DAYS")
     MAINTENANCE_OVERDUE_DAYS: int = Field(default=3, env="MAINTENANCE_OVERDUE_DAYS")
     
+    # Performance Settings
+    NUMBA_WARMUP: bool = Field(default=False, env="NUMBA_WARMUP")  # Precompile JIT kernels at startup
+    
     @validator("ALLOWED_ORIGINS", pre=True)
     def parse_allowed_origins(cls, v):
         """Parse comma-separated origins string."""
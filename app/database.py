@@ -7,10 +7,11 @@ and integrates with the existing factory telemetry database schema.
 """
 
 import asyncio
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, Callable, List, Optional, Union
 from contextlib import asynccontextmanager
 
 from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 from sqlalchemy.pool import NullPool, QueuePool
@@ -31,10 +32,15 @@ sync_engine = None
 async_engine = None
 async_session_factory = None
 
+# Optional read replica (falls back to the primary when not configured)
+replica_engine = None
+replica_session_factory = None
+
 
 async def init_db() -> None:
     """Initialize database connections and create tables."""
     global sync_engine, async_engine, async_session_factory
+    global replica_engine, replica_session_factory
     
     try:
         # Create sync engine for migrations and admin operations
@@ -54,7 +60,9 @@ async def init_db() -> None:
             pool_size=settings.DATABASE_POOL_SIZE,
             max_overflow=settings.DATABASE_MAX_OVERFLOW,
             echo=settings.DATABASE_ECHO,
-            future=True
+            future=True,
+            # Per-connection cache of prepared statements, keyed by SQL text
+            connect_args={"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE}
         )
         
         # Create async session factory
@@ -64,6 +72,24 @@ async def init_db() -> None:
             expire_on_commit=False
         )
         
+        # Create read replica engine for read-only queries, if configured
+        if settings.DATABASE_REPLICA_URL:
+            replica_engine = create_async_engine(
+                settings.DATABASE_REPLICA_URL,
+                poolclass=QueuePool,
+                pool_size=settings.DATABASE_POOL_SIZE,
+                max_overflow=settings.DATABASE_MAX_OVERFLOW,
+                echo=settings.DATABASE_ECHO,
+                future=True,
+                connect_args={"prepared_statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE}
+            )
+            replica_session_factory = async_sessionmaker(
+                replica_engine,
+                class_=AsyncSession,
+                expire_on_commit=False
+            )
+            logger.info("Database read replica configured")
+        
         # Test database connectivity
         await test_database_connection()
         
@@ -77,17 +103,24 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database connections."""
     global sync_engine, async_engine, async_session_factory
+    global replica_engine, replica_session_factory
     
     try:
         if async_engine:
             await async_engine.dispose()
             logger.info("Async database engine disposed")
         
+        if replica_engine:
+            await replica_engine.dispose()
+            replica_engine = None
+            logger.info("Replica database engine disposed")
+        
         if sync_engine:
             sync_engine.dispose()
             logger.info("Sync database engine disposed")
             
         async_session_factory = None
+        replica_session_factory = None
         
     except Exception as e:
         logger.error("Error closing database connections", error=str(e))
@@ -129,21 +162,95 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 # Database utility functions
-async def execute_query(query: str, params: Optional[dict] = None) -> list:
+# Each helper opens its own session unless one is passed in, in which case the
+# statement runs on that session's connection and the caller owns the transaction.
+async def execute_query(
+    query: Union[str, TextClause], 
+    params: Optional[dict] = None, 
+    session: Optional[AsyncSession] = None
+) -> list:
     """Execute a raw SQL query and return results."""
+    statement = text(query) if isinstance(query, str) else query
     try:
+        if session is not None:
+            result = await session.execute(statement, params or {})
+            return result.fetchall()
+        
         async with get_db_session() as session:
-            result = await session.execute(text(query), params or {})
+            result = await session.execute(statement, params or {})
             return result.fetchall()
     except Exception as e:
         logger.error("Database query execution failed", 
+                    query=str(query)[:100], params=params, error=str(e))
+        raise
+
+
+async def execute_single_row(
+    query: Union[str, TextClause], 
+    params: Optional[dict] = None, 
+    session: Optional[AsyncSession] = None
+):
+    """Execute a raw SQL query and return its first row, or None if there are no rows."""
+    statement = text(query) if isinstance(query, str) else query
+    try:
+        if session is not None:
+            result = await session.execute(statement, params or {})
+            return result.first()
+        
+        async with get_db_session() as session:
+            result = await session.execute(statement, params or {})
+            return result.first()
+    except Exception as e:
+        logger.error("Database single row query failed", 
+                    query=str(query)[:100], params=params, error=str(e))
+        raise
+
+
+async def execute_query_ro(query: str, params: Optional[dict] = None) -> list:
+    """Execute a read-only SQL query on the read replica, or the primary if none is configured."""
+    if not replica_session_factory:
+        return await execute_query(query, params)
+    
+    try:
+        async with replica_session_factory() as session:
+            result = await session.execute(text(query), params or {})
+            return result.fetchall()
+    except Exception as e:
+        logger.error("Database replica query execution failed", 
+                    query=query[:100], params=params, error=str(e))
+        raise
+
+
+async def execute_query_stream(
+    query: str, 
+    params: Optional[dict] = None, 
+    batch_size: int = 1000
+) -> AsyncGenerator:
+    """Execute a raw SQL query and yield rows from a server-side cursor in batches."""
+    try:
+        async with get_db_session() as session:
+            result = await session.stream(
+                text(query).execution_options(yield_per=batch_size), params or {}
+            )
+            async for row in result:
+                yield row
+    except Exception as e:
+        logger.error("Database streaming query failed", 
                     query=query[:100], params=params, error=str(e))
         raise
 
 
-async def execute_scalar(query: str, params: Optional[dict] = None):
+async def execute_scalar(
+    query: str, 
+    params: Optional[dict] = None, 
+    session: Optional[AsyncSession] = None
+):
     """Execute a raw SQL query and return a single scalar result."""
     try:
+        if session is not None:
+            result = await session.execute(text(query), params or {})
+            return result.scalar()
+        
         async with get_db_session() as session:
             result = await session.execute(text(query), params or {})
             return result.scalar()
@@ -153,19 +260,71 @@ async def execute_scalar(query: str, params: Optional[dict] = None):
         raise
 
 
-async def execute_update(query: str, params: Optional[dict] = None) -> int:
-    """Execute an update/insert/delete query and return affected rows."""
+async def execute_update(
+    query: Union[str, TextClause], 
+    params: Optional[dict] = None, 
+    session: Optional[AsyncSession] = None
+) -> int:
+    """Execute an update/insert/delete query and return affected rows.
+    
+    Hot statements can be passed as a module-level text() clause so the SQL is
+    only parsed for bind parameters once per process.
+    """
+    statement = text(query) if isinstance(query, str) else query
     try:
+        if session is not None:
+            result = await session.execute(statement, params or {})
+            return result.rowcount
+        
         async with get_db_session() as session:
-            result = await session.execute(text(query), params or {})
+            result = await session.execute(statement, params or {})
             await session.commit()
             return result.rowcount
     except Exception as e:
         logger.error("Database update execution failed", 
-                    query=query[:100], params=params, error=str(e))
+                    query=str(query)[:100], params=params, error=str(e))
         raise
 
 
+async def execute_many(query: str, params_list: List[dict]) -> int:
+    """Execute a statement for each parameter set in one transaction (driver executemany)."""
+    if not params_list:
+        return 0
+    
+    try:
+        async with get_db_session() as session:
+            result = await session.execute(text(query), params_list)
+            await session.commit()
+            return result.rowcount
+    except Exception as e:
+        logger.error("Database batch execution failed", 
+                    query=query[:100], batch_size=len(params_list), error=str(e))
+        raise
+
+
+async def listen_for_notifications(channel: str, callback: Callable[[str], None]) -> None:
+    """Hold a dedicated connection LISTENing on a channel, passing each payload to callback until cancelled."""
+    if not async_engine:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
+    
+    def listener(connection, pid, channel_name, payload):
+        try:
+            callback(payload)
+        except Exception as e:
+            logger.error("Database notification handler failed", channel=channel_name, error=str(e))
+    
+    async with async_engine.connect() as conn:
+        raw_connection = await conn.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        await driver_connection.add_listener(channel, listener)
+        logger.info("Listening for database notifications", channel=channel)
+        try:
+            # Notifications are delivered to the listener while this waits to be cancelled
+            await asyncio.Future()
+        finally:
+            await driver_connection.remove_listener(channel, listener)
+
+
 # Database health check
 async def check_database_health() -> dict:
     """Check database health and return status information."""
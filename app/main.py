@@ -27,6 +27,7 @@ from app.api.v1 import enhanced_production, enhanced_oee_analytics, enhanced_pro
 from app.api.websocket import websocket_router
 from app.api.enhanced_websocket import router as enhanced_websocket_router
 from app.services.andon_escalation_monitor import start_escalation_monitor, stop_escalation_monitor
+from app.services.downtime_tracker import warmup_fault_scan
 from app.services.real_time_integration_service import RealTimeIntegrationService
 from app.services.enhanced_websocket_manager import EnhancedWebSocketManager
 from app.utils.exceptions import (
@@ -71,6 +72,10 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("Database initialized successfully")
     
+    if settings.NUMBA_WARMUP:
+        warmup_fault_scan()
+        logger.info("Fault scan kernel warmed up")
+    
     # Start escalation monitor
     await start_escalation_monitor()
     logger.info("Andon escalation monitor started")
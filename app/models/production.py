@@ -188,7 +188,7 @@ class ProductionScheduleUpdate(BaseProductionModel):
     status: Optional[ScheduleStatus] = None
     notes: Optional[str] = Field(None, max_length=1000)
     
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def validate_schedule_times(cls, values):
         """Validate schedule times if both are provided."""
         start = values.get('scheduled_start')
@@ -292,6 +292,8 @@ class ChecklistCompletionResponse(BaseProductionModel):
     responses: Dict[str, Any]
     signature_data: Optional[Dict[str, Any]]
     status: str
+    template: Optional[ChecklistTemplateResponse] = None
+    job_assignment: Optional[JobAssignmentResponse] = None
 
 
 # Downtime Event Models
@@ -482,7 +484,7 @@ class PaginationParams(BaseProductionModel):
     page: int = Field(1, ge=1, description="Page number")
     size: int = Field(20, ge=1, le=100, description="Page size")
     sort_by: Optional[str] = Field(None, description="Sort field")
-    sort_order: Optional[str] = Field("asc", regex="^(asc|desc)$", description="Sort order")
+    sort_order: Optional[str] = Field("asc", pattern="^(asc|desc)$", description="Sort order")
 
 
 class PaginatedResponse(BaseProductionModel):
@@ -5,6 +5,7 @@ This module provides Andon system services for handling machine stoppages,
 quality issues, and other production alerts with escalation management.
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
@@ -152,6 +153,116 @@ class AndonService:
             logger.error("Failed to create Andon event", error=str(e))
             raise BusinessLogicError("Failed to create Andon event")
     
+    @staticmethod
+    async def create_andon_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create auto-generated Andon events in bulk.
+        
+        Events for disabled or unknown lines, and events that duplicate an active
+        event (or an earlier event in the batch), are skipped rather than raising.
+        If the batch INSERT fails, events are retried one at a time so a single bad
+        event is dropped on its own.
+        
+        Args:
+            events: Dicts with line_id, equipment_code, event_type, priority and description
+            
+        Returns:
+            The created events
+        """
+        if not events:
+            return []
+        
+        try:
+            try:
+                created = await AndonService._insert_andon_events(events)
+            except Exception as e:
+                if len(events) == 1:
+                    raise
+                logger.warning(
+                    "Batched Andon event insert failed, retrying row by row",
+                    error=str(e),
+                    batch_size=len(events)
+                )
+                created = []
+                for event in events:
+                    try:
+                        created.extend(await AndonService._insert_andon_events([event]))
+                    except Exception as row_error:
+                        logger.error(
+                            "Failed to create Andon event",
+                            error=str(row_error),
+                            equipment_code=event.get("equipment_code"),
+                            event_type=event.get("event_type")
+                        )
+            
+            # Both helpers log and swallow their own failures, so the follow-ups for
+            # every created event run concurrently instead of one round trip at a time
+            await asyncio.gather(*(
+                follow_up
+                for event in created
+                for follow_up in (
+                    AndonService._start_escalation_process(event["id"], AndonPriority(event["priority"])),
+                    AndonService._send_andon_notification(event)
+                )
+            ))
+            
+            logger.info(
+                "Andon events created",
+                requested=len(events),
+                created=len(created)
+            )
+            
+            return created
+            
+        except Exception as e:
+            logger.error("Failed to create Andon events", error=str(e), batch_size=len(events))
+            raise BusinessLogicError("Failed to create Andon events")
+    
+    @staticmethod
+    async def _insert_andon_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert a batch of Andon events in one statement and return the created rows."""
+        # text has no assignment cast to an enum, nor an equality operator against
+        # one, so the arrays are cast to the enum column types before unnesting.
+        # In-batch duplicates keep the earliest event, as sequential creation did.
+        create_query = """
+        INSERT INTO factory_telemetry.andon_events 
+        (line_id, equipment_code, event_type, priority, description, 
+         reported_by, reported_at, status)
+        SELECT DISTINCT ON (e.line_id, e.equipment_code, e.event_type)
+               e.line_id, e.equipment_code, e.event_type, e.priority, e.description,
+               NULL, :reported_at, :status
+        FROM unnest(
+            CAST(:line_ids AS uuid[]), CAST(:equipment_codes AS text[]),
+            CAST(:event_types AS factory_telemetry.andon_event_type[]),
+            CAST(:priorities AS factory_telemetry.andon_priority[]),
+            CAST(:descriptions AS text[])
+        ) WITH ORDINALITY AS e(line_id, equipment_code, event_type, priority, description, ord)
+        JOIN factory_telemetry.production_lines pl 
+            ON pl.id = e.line_id AND pl.enabled = true
+        WHERE NOT EXISTS (
+            SELECT 1 FROM factory_telemetry.andon_events ae
+            WHERE ae.line_id = e.line_id
+            AND ae.equipment_code = e.equipment_code
+            AND ae.event_type = e.event_type
+            AND ae.status IN ('open', 'acknowledged')
+        )
+        ORDER BY e.line_id, e.equipment_code, e.event_type, e.ord
+        RETURNING id, line_id, equipment_code, event_type, priority, description, 
+                 reported_by, reported_at, status
+        """
+        
+        result = await execute_query(create_query, {
+            "line_ids": [event["line_id"] for event in events],
+            "equipment_codes": [event["equipment_code"] for event in events],
+            "event_types": [event["event_type"] for event in events],
+            "priorities": [event["priority"] for event in events],
+            "descriptions": [event["description"] for event in events],
+            "reported_at": datetime.utcnow(),
+            "status": AndonStatus.OPEN.value
+        })
+        
+        return [dict(row._mapping) for row in result]
+    
     @staticmethod
     async def get_andon_event(event_id: UUID) -> AndonEventResponse:
         """Get an Andon event by ID."""
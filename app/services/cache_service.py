@@ -18,12 +18,58 @@ except ImportError:
     redis = None
 
 # In-memory cache fallback
-from collections import defaultdict, OrderedDict
+from collections import defaultdict, deque, OrderedDict
 import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Serialized values smaller than this are kept as standalone bytes objects
+MEMORY_ARENA_MIN_VALUE_SIZE = 64
+
+
+class _MemoryArena:
+    """
+    Single bytearray backing store for in-memory cache values.
+    
+    Values are kept as serialized bytes in power-of-two slabs so the cache
+    holds plain (offset, length, capacity) tuples instead of live object
+    graphs the garbage collector has to traverse. Freed slabs are recycled
+    through per-size-class free lists; the arena grows by doubling.
+    """
+    
+    def __init__(self, initial_size: int = 1024 * 1024):
+        self.buffer = bytearray(initial_size)
+        self.used = 0
+        self.free_lists = defaultdict(list)
+    
+    @staticmethod
+    def _size_class(length: int) -> int:
+        return 1 << max(length - 1, 0).bit_length()
+    
+    def store(self, data: bytes) -> tuple:
+        """Copy data into a slab and return (offset, capacity)."""
+        capacity = self._size_class(len(data))
+        free_list = self.free_lists[capacity]
+        if free_list:
+            offset = free_list.pop()
+        else:
+            offset = self.used
+            self.used += capacity
+            if self.used > len(self.buffer):
+                self.buffer.extend(bytes(max(len(self.buffer), self.used - len(self.buffer))))
+        self.buffer[offset:offset + len(data)] = data
+        return offset, capacity
+    
+    def read(self, offset: int, length: int) -> bytes:
+        """Return a copy of the stored bytes."""
+        return bytes(self.buffer[offset:offset + length])
+    
+    def free(self, offset: int, capacity: int) -> None:
+        """Return a slab to its size-class free list."""
+        self.free_lists[capacity].append(offset)
+
+
 class CacheService:
     """
     Comprehensive caching service for MS5.0 Floor Dashboard API optimization.
@@ -45,8 +91,9 @@ class CacheService:
         # In-memory cache fallback
         self.memory_cache = OrderedDict()
         self.cache_ttl = {}
-        self.cache_lock = threading.RLock()
+        self.cache_lock = threading.Lock()  # memory helpers never re-enter
         self.max_memory_size = 1000  # Maximum number of items in memory cache
+        self.memory_arena = _MemoryArena()
         
         # Cache statistics
         self.stats = {
@@ -69,47 +116,63 @@ class CacheService:
         else:
             logger.info("Cache service initialized with in-memory cache")
     
-    async def _get_from_memory(self, key: str) -> Optional[Any]:
+    def _drop_from_memory(self, key: str) -> None:
+        """Remove a key and release its arena slab. Caller must hold cache_lock."""
+        entry = self.memory_cache.pop(key)
+        self.cache_ttl.pop(key, None)
+        if isinstance(entry, tuple):
+            self.memory_arena.free(entry[0], entry[2])
+    
+    def _get_from_memory(self, key: str) -> Optional[Any]:
         """Get value from in-memory cache."""
         with self.cache_lock:
             if key in self.memory_cache:
                 # Check TTL
                 if key in self.cache_ttl and time.time() > self.cache_ttl[key]:
                     # Expired
-                    del self.memory_cache[key]
-                    del self.cache_ttl[key]
+                    self._drop_from_memory(key)
                     self.stats['expired'] += 1
                     return None
                 
                 # Move to end (LRU)
-                value = self.memory_cache.pop(key)
-                self.memory_cache[key] = value
-                return value
-            return None
+                self.memory_cache.move_to_end(key)
+                entry = self.memory_cache[key]
+                if isinstance(entry, tuple):
+                    entry = self.memory_arena.read(entry[0], entry[1])
+            else:
+                return None
+        
+        return json.loads(entry)
     
-    async def _set_to_memory(self, key: str, value: Any, ttl: int = None) -> bool:
+    def _set_to_memory(self, key: str, value: Any, ttl: int = None) -> bool:
         """Set value in in-memory cache."""
+        # Serialize outside the lock; mirrors the Redis path so both backends
+        # hand back the same JSON round-tripped values
+        data = json.dumps(value, default=str).encode()
+        
         with self.cache_lock:
+            if key in self.memory_cache:
+                self._drop_from_memory(key)
+            
             # Remove oldest items if cache is full
             while len(self.memory_cache) >= self.max_memory_size:
-                oldest_key = next(iter(self.memory_cache))
-                del self.memory_cache[oldest_key]
-                if oldest_key in self.cache_ttl:
-                    del self.cache_ttl[oldest_key]
+                self._drop_from_memory(next(iter(self.memory_cache)))
             
-            # Set value
-            self.memory_cache[key] = value
+            # Small payloads stay as standalone bytes; larger ones go to the arena
+            if len(data) < MEMORY_ARENA_MIN_VALUE_SIZE:
+                self.memory_cache[key] = data
+            else:
+                offset, capacity = self.memory_arena.store(data)
+                self.memory_cache[key] = (offset, len(data), capacity)
             if ttl:
                 self.cache_ttl[key] = time.time() + ttl
             return True
     
-    async def _delete_from_memory(self, key: str) -> bool:
+    def _delete_from_memory(self, key: str) -> bool:
         """Delete value from in-memory cache."""
         with self.cache_lock:
             if key in self.memory_cache:
-                del self.memory_cache[key]
-                if key in self.cache_ttl:
-                    del self.cache_ttl[key]
+                self._drop_from_memory(key)
                 return True
             return False
     
@@ -133,7 +196,7 @@ class CacheService:
                     self.stats['misses'] += 1
                     return None
             else:
-                value = await self._get_from_memory(key)
+                value = self._get_from_memory(key)
                 if value is not None:
                     self.stats['hits'] += 1
                     return value
@@ -163,7 +226,7 @@ class CacheService:
             if self.use_redis:
                 await self.redis_client.setex(key, ttl, json.dumps(value, default=str))
             else:
-                await self._set_to_memory(key, value, ttl)
+                self._set_to_memory(key, value, ttl)
             
             self.stats['sets'] += 1
             return True
@@ -185,7 +248,7 @@ class CacheService:
             if self.use_redis:
                 result = await self.redis_client.delete(key)
             else:
-                result = await self._delete_from_memory(key)
+                result = self._delete_from_memory(key)
             
             self.stats['deletes'] += 1
             return result
@@ -211,8 +274,7 @@ class CacheService:
                     if key in self.memory_cache:
                         # Check TTL
                         if key in self.cache_ttl and time.time() > self.cache_ttl[key]:
-                            del self.memory_cache[key]
-                            del self.cache_ttl[key]
+                            self._drop_from_memory(key)
                             return False
                         return True
                     return False
@@ -244,9 +306,7 @@ class CacheService:
                             keys_to_delete.append(key)
                     
                     for key in keys_to_delete:
-                        del self.memory_cache[key]
-                        if key in self.cache_ttl:
-                            del self.cache_ttl[key]
+                        self._drop_from_memory(key)
                     
                     return len(keys_to_delete)
         except Exception as e:
@@ -694,28 +754,23 @@ async def warm_common_cache():
 class PerformanceMonitor:
     """Monitor API performance metrics."""
     
-    def __init__(self):
-        self.metrics = defaultdict(list)
+    def __init__(self, max_samples: int = 1000):
+        # Per-endpoint ring buffer of (duration, status_code) tuples
+        self.max_samples = max_samples
+        self.metrics = defaultdict(lambda: deque(maxlen=self.max_samples))
         self.lock = asyncio.Lock()
     
     async def record_request(self, endpoint: str, duration: float, status_code: int):
         """Record request metrics."""
         async with self.lock:
-            self.metrics[endpoint].append({
-                'duration': duration,
-                'status_code': status_code,
-                'timestamp': time.time()
-            })
-            
-            # Keep only last 1000 requests per endpoint
-            if len(self.metrics[endpoint]) > 1000:
-                self.metrics[endpoint] = self.metrics[endpoint][-1000:]
+            # Bounded deque drops the oldest sample once max_samples is reached
+            self.metrics[endpoint].append((duration, status_code))
     
     async def get_metrics(self, endpoint: str = None) -> Dict[str, Any]:
         """Get performance metrics."""
         async with self.lock:
             if endpoint:
-                metrics = self.metrics.get(endpoint, [])
+                metrics = list(self.metrics.get(endpoint, ()))
             else:
                 metrics = []
                 for ep_metrics in self.metrics.values():
@@ -724,18 +779,19 @@ class PerformanceMonitor:
             if not metrics:
                 return {}
             
-            durations = [m['duration'] for m in metrics]
-            status_codes = [m['status_code'] for m in metrics]
+            durations = sorted(m[0] for m in metrics)
+            total = len(metrics)
+            errors = sum(1 for m in metrics if m[1] >= 400)
             
             return {
-                'total_requests': len(metrics),
-                'avg_duration': sum(durations) / len(durations),
-                'min_duration': min(durations),
-                'max_duration': max(durations),
-                'p95_duration': sorted(durations)[int(len(durations) * 0.95)],
-                'p99_duration': sorted(durations)[int(len(durations) * 0.99)],
-                'success_rate': len([s for s in status_codes if s < 400]) / len(status_codes) * 100,
-                'error_rate': len([s for s in status_codes if s >= 400]) / len(status_codes) * 100
+                'total_requests': total,
+                'avg_duration': sum(durations) / total,
+                'min_duration': durations[0],
+                'max_duration': durations[-1],
+                'p95_duration': durations[int(total * 0.95)],
+                'p99_duration': durations[int(total * 0.99)],
+                'success_rate': (total - errors) / total * 100,
+                'error_rate': errors / total * 100
             }
 
 
@@ -758,23 +814,21 @@ def monitor_performance(endpoint: str = None):
         Decorated function
     """
     def decorator(func):
+        # Resolve the endpoint name once at decoration time, not per request
+        ep_name = endpoint or f"{func.__module__}:{func.__name__}"
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
+            status_code = 500
             
             try:
                 result = await func(*args, **kwargs)
                 status_code = 200
                 return result
-            except Exception as e:
-                status_code = 500
-                raise
             finally:
-                duration = time.time() - start_time
-                ep_name = endpoint or f"{func.__module__}:{func.__name__}"
-                
-                monitor = get_performance_monitor()
-                await monitor.record_request(ep_name, duration, status_code)
+                duration = time.perf_counter() - start_time
+                await _performance_monitor.record_request(ep_name, duration, status_code)
         
         return wrapper
     return decorator
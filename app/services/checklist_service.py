@@ -5,12 +5,28 @@ This module contains the business logic for checklist management,
 including template management and checklist completion workflows.
 """
 
+import asyncio
+import base64
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple
 from uuid import UUID
 import structlog
 
-from app.database import execute_query, execute_scalar, execute_update, get_db_session
+# JSON Schema validator compiler (if available)
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+    fastjsonschema = None
+
+from app.config import settings
+from app.database import (
+    execute_many, execute_query, execute_query_ro, execute_scalar, execute_update, get_db_session
+)
 from app.models.production import (
     ChecklistTemplateCreate, ChecklistTemplateUpdate, ChecklistTemplateResponse,
     ChecklistCompletionCreate, ChecklistCompletionResponse,
@@ -21,14 +37,263 @@ from app.utils.exceptions import (
 )
 from app.services.job_assignment_service import JobAssignmentService
 
-logger = structlog.get_logger()
+# Lazily bound so service context is attached once, not passed on every call
+logger = structlog.get_logger(service="checklist")
+
+# Templates change rarely; cached lookups are reused for this many seconds
+TEMPLATE_CACHE_TTL = 60
+
+# Prefetched list pages: how many to keep and how long they stay usable (seconds)
+PAGE_PREFETCH_MAX_ENTRIES = 8
+PAGE_PREFETCH_MAX_AGE = 30
+
+# Hot write statements are kept as constants so the driver's prepared
+# statement cache (keyed by SQL text) is hit on every call
+_INSERT_TEMPLATE_SQL = """
+INSERT INTO factory_telemetry.checklist_templates 
+(name, equipment_codes, checklist_items, enabled)
+VALUES (:name, :equipment_codes, :checklist_items, :enabled)
+RETURNING id, name, equipment_codes, checklist_items, enabled, created_at
+"""
+
+# Everything complete_checklist needs to validate a submission, in one query
+_COMPLETION_CONTEXT_SQL = """
+SELECT ja.user_id, t.checklist_items
+FROM factory_telemetry.job_assignments ja
+LEFT JOIN factory_telemetry.checklist_templates t ON t.id = :template_id
+WHERE ja.id = :job_assignment_id
+"""
+
+_COMPLETE_CHECKLIST_SQL = """
+WITH completion AS (
+    INSERT INTO factory_telemetry.checklist_completions 
+    (job_assignment_id, template_id, completed_by, completed_at, responses, signature_data, status)
+    VALUES (:job_assignment_id, :template_id, :completed_by, NOW(), :responses, :signature_data, :status)
+    RETURNING id, job_assignment_id, template_id, completed_by, completed_at, 
+             responses, signature_data, status
+), assignment AS (
+    UPDATE factory_telemetry.job_assignments 
+    SET status = :job_status, updated_at = NOW()
+    WHERE id = :job_assignment_id
+)
+SELECT * FROM completion
+"""
+
+_UPDATE_TEMPLATE_SQL = """
+UPDATE factory_telemetry.checklist_templates 
+SET name = COALESCE(:name, name),
+    equipment_codes = COALESCE(:equipment_codes, equipment_codes),
+    checklist_items = COALESCE(:checklist_items, checklist_items),
+    enabled = COALESCE(:enabled, enabled),
+    updated_at = NOW()
+WHERE id = :template_id
+RETURNING id, name, equipment_codes, checklist_items, enabled, created_at
+"""
+
+# Listing statements use NULL-guarded filters instead of per-call SQL building
+_LIST_TEMPLATES_SQL = """
+SELECT id, name, equipment_codes, checklist_items, enabled, created_at
+FROM factory_telemetry.checklist_templates 
+WHERE (NOT CAST(:enabled_only AS boolean) OR enabled = true)
+  AND (CAST(:equipment_codes AS text[]) IS NULL OR equipment_codes && CAST(:equipment_codes AS text[]))
+  AND (CAST(:min_items AS integer) IS NULL
+       OR jsonb_array_length(checklist_items) >= CAST(:min_items AS integer))
+  AND (CAST(:cursor_ts AS timestamptz) IS NULL
+       OR (created_at, id) < (CAST(:cursor_ts AS timestamptz), CAST(:cursor_id AS uuid)))
+ORDER BY created_at DESC, id DESC
+LIMIT :limit OFFSET :skip
+"""
+
+
+def _build_list_completions_sql(include_template: bool, include_assignment: bool) -> str:
+    """Build the completion listing statement for one combination of joins."""
+    select_columns = [
+        "c.id, c.job_assignment_id, c.template_id, c.completed_by, c.completed_at, "
+        "c.responses, c.signature_data, c.status"
+    ]
+    joins = []
+    
+    # Fetch related template / job assignment in the same query instead of per row
+    if include_template:
+        select_columns.append(
+            "t.name AS template_name, t.equipment_codes AS template_equipment_codes, "
+            "t.checklist_items AS template_checklist_items, t.enabled AS template_enabled, "
+            "t.created_at AS template_created_at"
+        )
+        joins.append("LEFT JOIN factory_telemetry.checklist_templates t ON t.id = c.template_id")
+    
+    if include_assignment:
+        select_columns.append(
+            "j.schedule_id AS ja_schedule_id, j.user_id AS ja_user_id, "
+            "j.assigned_at AS ja_assigned_at, j.accepted_at AS ja_accepted_at, "
+            "j.started_at AS ja_started_at, j.completed_at AS ja_completed_at, "
+            "j.status AS ja_status, j.notes AS ja_notes"
+        )
+        joins.append("LEFT JOIN factory_telemetry.job_assignments j ON j.id = c.job_assignment_id")
+    
+    return f"""
+SELECT {', '.join(select_columns)}
+FROM factory_telemetry.checklist_completions c
+{' '.join(joins)}
+WHERE (CAST(:job_assignment_id AS uuid) IS NULL OR c.job_assignment_id = CAST(:job_assignment_id AS uuid))
+  AND (CAST(:user_id AS uuid) IS NULL OR c.completed_by = CAST(:user_id AS uuid))
+  AND (CAST(:cursor_ts AS timestamptz) IS NULL
+       OR (c.completed_at, c.id) < (CAST(:cursor_ts AS timestamptz), CAST(:cursor_id AS uuid)))
+ORDER BY c.completed_at DESC, c.id DESC
+LIMIT :limit OFFSET :skip
+"""
+
+
+# One fixed statement per (include_template, include_assignment) combination
+_LIST_COMPLETIONS_SQL = {
+    (include_template, include_assignment): _build_list_completions_sql(include_template, include_assignment)
+    for include_template in (False, True)
+    for include_assignment in (False, True)
+}
+
+_UPDATE_JOB_ASSIGNMENT_STATUS_SQL = """
+UPDATE factory_telemetry.job_assignments 
+SET status = :status, updated_at = NOW()
+WHERE id = :job_assignment_id
+"""
+
+
+def encode_page_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode a keyset pagination position as an opaque cursor string."""
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_page_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_page_cursor."""
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("Invalid pagination cursor")
 
 
 class ChecklistService:
     """Service for checklist management and completion workflows."""
     
+    # Response checks per item type: (check(response, options), error message suffix)
+    _RESPONSE_VALIDATORS = {
+        "checkbox": (lambda response, options: isinstance(response, bool), "must be boolean"),
+        "text": (lambda response, options: isinstance(response, str), "must be text"),
+        "number": (lambda response, options: isinstance(response, (int, float)), "must be a number"),
+        "select": (lambda response, options: isinstance(response, Hashable) and response in options,
+                   "has invalid selection"),
+        "signature": (lambda response, options: isinstance(response, dict) and "signature" in response,
+                      "must have signature data"),
+    }
+    
+    # JSON Schema fragments per item type ("select" is built from the item's options)
+    _RESPONSE_SCHEMA_TYPES = {
+        "checkbox": {"type": "boolean"},
+        "text": {"type": "string"},
+        "number": {"type": "number"},
+        "signature": {"type": "object", "required": ["signature"]},
+    }
+    
     def __init__(self):
         self.job_assignment_service = JobAssignmentService()
+        
+        # TTL caches for template lookups: key -> (expires_at, template)
+        self._template_cache: Dict[UUID, Tuple[float, ChecklistTemplateResponse]] = {}
+        self._equipment_template_cache: Dict[frozenset, Tuple[float, Optional[ChecklistTemplateResponse]]] = {}
+        self._template_cache_generation = 0
+        # In-flight loads per (cache, key), so concurrent misses for one key share a query
+        self._template_loads: Dict[Tuple[int, Any], asyncio.Future] = {}
+        
+        # Compiled response rules per template: template_id -> (checklist_items, (rules, schema_validator))
+        self._compiled_checklists: Dict[UUID, Tuple[List[Dict[str, Any]], tuple]] = {}
+        
+        # Each completion holds one connection; leave most of the pool for other work
+        self._completion_semaphore = asyncio.Semaphore(max(2, settings.DATABASE_POOL_SIZE // 4))
+        
+        # Next-page prefetches for list calls: page key -> (started_at, task)
+        self._page_prefetch: "OrderedDict[tuple, Tuple[float, asyncio.Task]]" = OrderedDict()
+    
+    async def _cached_template_lookup(
+        self,
+        cache: Dict[Any, Tuple[float, Any]],
+        key: Any,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached template lookup, loading it once on a miss."""
+        entry = cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        
+        # Single-flight per key: concurrent misses for the same key wait on one load,
+        # while misses for other keys load independently
+        load_key = (id(cache), key)
+        load = self._template_loads.get(load_key)
+        if load is None:
+            load = asyncio.ensure_future(
+                self._load_template(cache, key, loader, self._template_cache_generation)
+            )
+            self._template_loads[load_key] = load
+            # Only drop our own entry; an invalidation may have replaced it already
+            load.add_done_callback(
+                lambda done: self._template_loads.get(load_key) is done and self._template_loads.pop(load_key)
+            )
+        
+        # Shielded so one cancelled caller does not cancel the load for the others
+        return await asyncio.shield(load)
+    
+    async def _load_template(
+        self,
+        cache: Dict[Any, Tuple[float, Any]],
+        key: Any,
+        loader: Callable[[], Awaitable[Any]],
+        generation: int
+    ) -> Any:
+        """Run a template loader and cache its result unless an invalidation raced with it."""
+        value = await loader()
+        if generation == self._template_cache_generation:
+            cache[key] = (time.monotonic() + TEMPLATE_CACHE_TTL, value)
+        return value
+    
+    def _invalidate_template_cache(self) -> None:
+        """Drop all cached template lookups after a template write."""
+        self._template_cache.clear()
+        self._equipment_template_cache.clear()
+        self._compiled_checklists.clear()
+        self._template_cache_generation += 1
+        # Loads started before the write may return old data; later misses start fresh ones
+        self._template_loads.clear()
+        
+        for key in [key for key in self._page_prefetch if key[0] == "templates"]:
+            self._page_prefetch.pop(key)[1].cancel()
+    
+    async def _load_page(self, key: tuple, loader: Callable[[], Awaitable[List[Any]]]) -> List[Any]:
+        """Return a list page, using a prefetched result when one is ready."""
+        entry = self._page_prefetch.pop(key, None)
+        if entry is not None:
+            started_at, task = entry
+            if time.monotonic() - started_at <= PAGE_PREFETCH_MAX_AGE:
+                try:
+                    return await task
+                except Exception:
+                    pass  # Fall back to a direct query
+            else:
+                task.cancel()
+        
+        return await loader()
+    
+    def _prefetch_page(self, key: tuple, loader: Callable[[], Awaitable[List[Any]]]) -> None:
+        """Start loading a list page in the background."""
+        if key in self._page_prefetch:
+            return
+        
+        task = asyncio.create_task(loader())
+        # Unused prefetches may fail unobserved; retrieve the exception so it isn't logged
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._page_prefetch[key] = (time.monotonic(), task)
+        
+        while len(self._page_prefetch) > PAGE_PREFETCH_MAX_ENTRIES:
+            self._page_prefetch.popitem(last=False)[1][1].cancel()
     
     async def create_checklist_template(
         self, 
@@ -40,14 +305,7 @@ class ChecklistService:
             self._validate_checklist_items(template_data.checklist_items)
             
             # Create template
-            create_query = """
-            INSERT INTO factory_telemetry.checklist_templates 
-            (name, equipment_codes, checklist_items, enabled)
-            VALUES (:name, :equipment_codes, :checklist_items, :enabled)
-            RETURNING id, name, equipment_codes, checklist_items, enabled, created_at
-            """
-            
-            result = await execute_query(create_query, {
+            result = await execute_query(_INSERT_TEMPLATE_SQL, {
                 "name": template_data.name,
                 "equipment_codes": template_data.equipment_codes,
                 "checklist_items": template_data.checklist_items,
@@ -58,6 +316,7 @@ class ChecklistService:
                 raise BusinessLogicError("Failed to create checklist template")
             
             template = result[0]
+            self._invalidate_template_cache()
             
             logger.info("Checklist template created", template_id=template["id"], name=template_data.name)
             
@@ -78,6 +337,14 @@ class ChecklistService:
     
     async def get_checklist_template(self, template_id: UUID) -> ChecklistTemplateResponse:
         """Get a checklist template by ID."""
+        return await self._cached_template_lookup(
+            self._template_cache,
+            template_id,
+            lambda: self._fetch_checklist_template(template_id)
+        )
+    
+    async def _fetch_checklist_template(self, template_id: UUID) -> ChecklistTemplateResponse:
+        """Load a checklist template by ID from the database."""
         try:
             query = """
             SELECT id, name, equipment_codes, checklist_items, enabled, created_at
@@ -85,6 +352,8 @@ class ChecklistService:
             WHERE id = :template_id
             """
             
+            # Cache fills read the primary: a lagging replica right after a template
+            # write would otherwise keep the old version cached for TEMPLATE_CACHE_TTL
             result = await execute_query(query, {"template_id": template_id})
             
             if not result:
@@ -114,46 +383,38 @@ class ChecklistService:
     ) -> ChecklistTemplateResponse:
         """Update a checklist template."""
         try:
-            # Check if template exists
-            existing = await self.get_checklist_template(template_id)
-            
-            # Build update query dynamically
-            update_fields = []
-            update_values = {"template_id": template_id}
-            
-            if update_data.name is not None:
-                update_fields.append("name = :name")
-                update_values["name"] = update_data.name
-            
-            if update_data.equipment_codes is not None:
-                update_fields.append("equipment_codes = :equipment_codes")
-                update_values["equipment_codes"] = update_data.equipment_codes
-            
             if update_data.checklist_items is not None:
                 # Validate checklist items structure
                 self._validate_checklist_items(update_data.checklist_items)
-                update_fields.append("checklist_items = :checklist_items")
-                update_values["checklist_items"] = update_data.checklist_items
             
-            if update_data.enabled is not None:
-                update_fields.append("enabled = :enabled")
-                update_values["enabled"] = update_data.enabled
+            if not update_data.model_dump(exclude_none=True):
+                return await self.get_checklist_template(template_id)
             
-            if not update_fields:
-                return existing
+            # Fields left as None keep their current value (COALESCE in the statement)
+            result = await execute_query(_UPDATE_TEMPLATE_SQL, {
+                "template_id": template_id,
+                "name": update_data.name,
+                "equipment_codes": update_data.equipment_codes,
+                "checklist_items": update_data.checklist_items,
+                "enabled": update_data.enabled
+            })
             
-            update_query = f"""
-            UPDATE factory_telemetry.checklist_templates 
-            SET {', '.join(update_fields)}, updated_at = NOW()
-            WHERE id = :template_id
-            """
+            if not result:
+                raise NotFoundError("Checklist template", str(template_id))
             
-            await execute_update(update_query, update_values)
+            template = result[0]
+            self._invalidate_template_cache()
             
             logger.info("Checklist template updated", template_id=template_id)
             
-            # Return updated template
-            return await self.get_checklist_template(template_id)
+            return ChecklistTemplateResponse(
+                id=template["id"],
+                name=template["name"],
+                equipment_codes=template["equipment_codes"],
+                checklist_items=template["checklist_items"],
+                enabled=template["enabled"],
+                created_at=template["created_at"]
+            )
             
         except (NotFoundError, ValidationError):
             raise
@@ -166,52 +427,69 @@ class ChecklistService:
         equipment_codes: Optional[List[str]] = None,
         enabled_only: bool = True,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        min_items: Optional[int] = None
+    ) -> List[ChecklistTemplateResponse]:
+        """
+        List checklist templates with filters.
+        
+        Pass the cursor for the last row of the previous page (see
+        encode_page_cursor) to page by keyset; skip is kept for older callers.
+        """
+        # An empty code list means "no equipment filter", same as None
+        equipment_codes = list(equipment_codes) if equipment_codes else None
+        codes = tuple(equipment_codes) if equipment_codes else None
+        templates = await self._load_page(
+            ("templates", codes, enabled_only, min_items, skip, limit, cursor),
+            lambda: self._query_checklist_templates(equipment_codes, enabled_only, min_items, skip, limit, cursor)
+        )
+        
+        # Keyset pages are read-only and sequential: start loading the next one now
+        if len(templates) == limit and not skip:
+            next_cursor = encode_page_cursor(templates[-1].created_at, templates[-1].id)
+            self._prefetch_page(
+                ("templates", codes, enabled_only, min_items, skip, limit, next_cursor),
+                lambda: self._query_checklist_templates(
+                    equipment_codes, enabled_only, min_items, skip, limit, next_cursor
+                )
+            )
+        
+        return templates
+    
+    async def _query_checklist_templates(
+        self,
+        equipment_codes: Optional[List[str]],
+        enabled_only: bool,
+        min_items: Optional[int],
+        skip: int,
+        limit: int,
+        cursor: Optional[str]
     ) -> List[ChecklistTemplateResponse]:
-        """List checklist templates with filters."""
+        """Run the checklist template listing query."""
         try:
-            where_conditions = []
-            query_params = {"skip": skip, "limit": limit}
-            
-            if enabled_only:
-                where_conditions.append("enabled = true")
-            
-            if equipment_codes:
-                # Find templates that match any of the equipment codes
-                equipment_condition = " OR ".join([
-                    f"equipment_codes @> :equipment_{i}" 
-                    for i in range(len(equipment_codes))
-                ])
-                where_conditions.append(f"({equipment_condition})")
-                
-                for i, code in enumerate(equipment_codes):
-                    query_params[f"equipment_{i}"] = [code]
-            
-            where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-            
-            query = f"""
-            SELECT id, name, equipment_codes, checklist_items, enabled, created_at
-            FROM factory_telemetry.checklist_templates 
-            {where_clause}
-            ORDER BY created_at DESC
-            LIMIT :limit OFFSET :skip
-            """
-            
-            result = await execute_query(query, query_params)
-            
-            templates = []
-            for template in result:
-                templates.append(ChecklistTemplateResponse(
-                    id=template["id"],
-                    name=template["name"],
-                    equipment_codes=template["equipment_codes"],
-                    checklist_items=template["checklist_items"],
-                    enabled=template["enabled"],
-                    created_at=template["created_at"]
-                ))
-            
-            return templates
-            
+            cursor_ts, cursor_id = decode_page_cursor(cursor) if cursor else (None, None)
+            if skip and not cursor:
+                logger.warning("Offset pagination of checklist templates is deprecated, use cursor", skip=skip)
+            
+            # Inactive filters are passed as NULL so the statement text never changes
+            query_params = {
+                "enabled_only": enabled_only,
+                "equipment_codes": equipment_codes,
+                "min_items": min_items,
+                "cursor_ts": cursor_ts,
+                "cursor_id": cursor_id,
+                "skip": 0 if cursor else skip,
+                "limit": limit
+            }
+            
+            result = await execute_query_ro(_LIST_TEMPLATES_SQL, query_params)
+            
+            # Rows come from our own projection, so skip per-row Pydantic validation
+            return [ChecklistTemplateResponse.model_construct(**template._mapping) for template in result]
+            
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error("Failed to list checklist templates", error=str(e))
             raise BusinessLogicError("Failed to list checklist templates")
@@ -221,26 +499,33 @@ class ChecklistService:
         equipment_codes: List[str]
     ) -> Optional[ChecklistTemplateResponse]:
         """Get the most appropriate checklist template for given equipment codes."""
+        # No codes can never overlap a template; skip the cache and the query
+        if not equipment_codes:
+            return None
+        
+        return await self._cached_template_lookup(
+            self._equipment_template_cache,
+            frozenset(equipment_codes),
+            lambda: self._fetch_checklist_template_for_equipment(equipment_codes)
+        )
+    
+    async def _fetch_checklist_template_for_equipment(
+        self, 
+        equipment_codes: List[str]
+    ) -> Optional[ChecklistTemplateResponse]:
+        """Load the best matching checklist template for equipment codes from the database."""
         try:
-            # Find templates that match the equipment codes
-            equipment_condition = " OR ".join([
-                f"equipment_codes @> :equipment_{i}" 
-                for i in range(len(equipment_codes))
-            ])
-            
-            query_params = {}
-            for i, code in enumerate(equipment_codes):
-                query_params[f"equipment_{i}"] = [code]
-            
-            query = f"""
+            # Find templates that match any of the equipment codes (GIN-indexed overlap)
+            query = """
             SELECT id, name, equipment_codes, checklist_items, enabled, created_at
             FROM factory_telemetry.checklist_templates 
-            WHERE enabled = true AND ({equipment_condition})
-            ORDER BY array_length(equipment_codes, 1) DESC, created_at DESC
+            WHERE enabled = true AND equipment_codes && :equipment_codes
+            ORDER BY equipment_codes_len DESC, created_at DESC
             LIMIT 1
             """
             
-            result = await execute_query(query, query_params)
+            # Fills the equipment template cache, so it reads the primary (see _fetch_checklist_template)
+            result = await execute_query(query, {"equipment_codes": list(equipment_codes)})
             
             if not result:
                 return None
@@ -267,52 +552,49 @@ class ChecklistService:
     ) -> ChecklistCompletionResponse:
         """Complete a pre-start checklist."""
         try:
-            # Get job assignment details
-            job_assignment = await self.job_assignment_service.get_job_assignment(completion_data.job_assignment_id)
-            
-            # Validate user authorization
-            if job_assignment.user_id != user_id:
-                raise ValidationError("User not authorized for this job assignment")
-            
-            # Get checklist template
-            template = await self.get_checklist_template(completion_data.template_id)
-            
-            # Validate checklist responses
-            self._validate_checklist_responses(template.checklist_items, completion_data.responses)
-            
-            # Create completion record
-            create_query = """
-            INSERT INTO factory_telemetry.checklist_completions 
-            (job_assignment_id, template_id, completed_by, completed_at, responses, signature_data, status)
-            VALUES (:job_assignment_id, :template_id, :completed_by, NOW(), :responses, :signature_data, :status)
-            RETURNING id, job_assignment_id, template_id, completed_by, completed_at, 
-                     responses, signature_data, status
-            """
-            
-            result = await execute_query(create_query, {
-                "job_assignment_id": completion_data.job_assignment_id,
-                "template_id": completion_data.template_id,
-                "completed_by": user_id,
-                "responses": completion_data.responses,
-                "signature_data": completion_data.signature_data,
-                "status": "completed"
-            })
-            
-            if not result:
-                raise BusinessLogicError("Failed to create checklist completion")
+            # Run the whole workflow on one pooled connection, throttled so
+            # concurrent completions cannot exhaust the pool
+            async with self._completion_semaphore, get_db_session() as session:
+                # Assignment owner and template items in one round-trip
+                context = await execute_query(_COMPLETION_CONTEXT_SQL, {
+                    "job_assignment_id": completion_data.job_assignment_id,
+                    "template_id": completion_data.template_id
+                }, session=session)
+                
+                if not context:
+                    raise NotFoundError("Job assignment", str(completion_data.job_assignment_id))
+                
+                context = context[0]
+                
+                # Validate user authorization
+                if context["user_id"] != user_id:
+                    raise ValidationError("User not authorized for this job assignment")
+                
+                if context["checklist_items"] is None:
+                    raise NotFoundError("Checklist template", str(completion_data.template_id))
+                
+                # Validate checklist responses
+                self._validate_checklist_responses(
+                    self._compile_checklist_items(completion_data.template_id, context["checklist_items"]),
+                    completion_data.responses
+                )
+                
+                # Create completion record and mark the job ready to start in one statement
+                result = await execute_query(_COMPLETE_CHECKLIST_SQL, {
+                    "job_assignment_id": completion_data.job_assignment_id,
+                    "template_id": completion_data.template_id,
+                    "completed_by": user_id,
+                    "responses": completion_data.responses,
+                    "signature_data": completion_data.signature_data,
+                    "status": "completed",
+                    "job_status": "ready_to_start"
+                }, session=session)
+                
+                if not result:
+                    raise BusinessLogicError("Failed to create checklist completion")
             
             completion = result[0]
             
-            # Update job assignment status to ready to start
-            await self._update_job_assignment_status(completion_data.job_assignment_id, "ready_to_start")
-            
-            logger.info(
-                "Checklist completed", 
-                completion_id=completion["id"], 
-                job_assignment_id=completion_data.job_assignment_id,
-                user_id=user_id
-            )
-            
             return ChecklistCompletionResponse(
                 id=completion["id"],
                 job_assignment_id=completion["job_assignment_id"],
@@ -330,6 +612,60 @@ class ChecklistService:
             logger.error("Failed to complete checklist", error=str(e), job_assignment_id=completion_data.job_assignment_id)
             raise BusinessLogicError("Failed to complete checklist")
     
+    async def bulk_complete_checklists(
+        self, 
+        completions: List[ChecklistCompletionCreate],
+        user_id: UUID
+    ) -> int:
+        """Complete several pre-start checklists for one user in a single batched write."""
+        try:
+            if not completions:
+                return 0
+            
+            job_assignments, templates = await asyncio.gather(
+                asyncio.gather(*(
+                    self.job_assignment_service.get_job_assignment(completion.job_assignment_id)
+                    for completion in completions
+                )),
+                asyncio.gather(*(
+                    self.get_checklist_template(completion.template_id)
+                    for completion in completions
+                ))
+            )
+            
+            rows = []
+            for completion, job_assignment, template in zip(completions, job_assignments, templates):
+                if job_assignment.user_id != user_id:
+                    raise ValidationError("User not authorized for this job assignment")
+                
+                self._validate_checklist_responses(
+                    self._compile_checklist_items(template.id, template.checklist_items),
+                    completion.responses
+                )
+                
+                rows.append({
+                    "job_assignment_id": completion.job_assignment_id,
+                    "template_id": completion.template_id,
+                    "completed_by": user_id,
+                    "responses": completion.responses,
+                    "signature_data": completion.signature_data,
+                    "status": "completed",
+                    "job_status": "ready_to_start"
+                })
+            
+            # One executemany of the prepared statement inside one transaction
+            await execute_many(_COMPLETE_CHECKLIST_SQL, rows)
+            
+            logger.info("Checklists completed in bulk", count=len(rows), user_id=user_id)
+            
+            return len(rows)
+            
+        except (NotFoundError, ValidationError, BusinessLogicError):
+            raise
+        except Exception as e:
+            logger.error("Failed to bulk complete checklists", error=str(e), count=len(completions))
+            raise BusinessLogicError("Failed to bulk complete checklists")
+    
     async def get_checklist_completion(
         self, 
         completion_id: UUID
@@ -343,7 +679,7 @@ class ChecklistService:
             WHERE id = :completion_id
             """
             
-            result = await execute_query(query, {"completion_id": completion_id})
+            result = await execute_query_ro(query, {"completion_id": completion_id})
             
             if not result:
                 raise NotFoundError("Checklist completion", str(completion_id))
@@ -372,37 +708,92 @@ class ChecklistService:
         job_assignment_id: Optional[UUID] = None,
         user_id: Optional[UUID] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        include_template: bool = False,
+        include_assignment: bool = False,
+        cursor: Optional[str] = None
     ) -> List[ChecklistCompletionResponse]:
-        """List checklist completions with filters."""
+        """
+        List checklist completions with filters, optionally joining related records.
+        
+        Pass the cursor for the last row of the previous page (see
+        encode_page_cursor) to page by keyset; skip is kept for older callers.
+        """
+        filters = (job_assignment_id, user_id, skip, limit, include_template, include_assignment)
+        completions = await self._load_page(
+            ("completions",) + filters + (cursor,),
+            lambda: self._query_checklist_completions(*filters, cursor)
+        )
+        
+        # Keyset pages are read-only and sequential: start loading the next one now
+        if len(completions) == limit and not skip:
+            next_cursor = encode_page_cursor(completions[-1].completed_at, completions[-1].id)
+            self._prefetch_page(
+                ("completions",) + filters + (next_cursor,),
+                lambda: self._query_checklist_completions(*filters, next_cursor)
+            )
+        
+        return completions
+    
+    async def _query_checklist_completions(
+        self,
+        job_assignment_id: Optional[UUID],
+        user_id: Optional[UUID],
+        skip: int,
+        limit: int,
+        include_template: bool,
+        include_assignment: bool,
+        cursor: Optional[str]
+    ) -> List[ChecklistCompletionResponse]:
+        """Run the checklist completion listing query."""
         try:
-            where_conditions = []
-            query_params = {"skip": skip, "limit": limit}
-            
-            if job_assignment_id:
-                where_conditions.append("job_assignment_id = :job_assignment_id")
-                query_params["job_assignment_id"] = job_assignment_id
-            
-            if user_id:
-                where_conditions.append("completed_by = :user_id")
-                query_params["user_id"] = user_id
-            
-            where_clause = "WHERE " + " AND ".join(where_conditions) if where_conditions else ""
-            
-            query = f"""
-            SELECT id, job_assignment_id, template_id, completed_by, completed_at, 
-                   responses, signature_data, status
-            FROM factory_telemetry.checklist_completions 
-            {where_clause}
-            ORDER BY completed_at DESC
-            LIMIT :limit OFFSET :skip
-            """
+            cursor_ts, cursor_id = decode_page_cursor(cursor) if cursor else (None, None)
+            if skip and not cursor:
+                logger.warning("Offset pagination of checklist completions is deprecated, use cursor", skip=skip)
             
-            result = await execute_query(query, query_params)
+            # Inactive filters are passed as NULL so each statement variant's text never changes
+            query_params = {
+                "job_assignment_id": job_assignment_id,
+                "user_id": user_id,
+                "cursor_ts": cursor_ts,
+                "cursor_id": cursor_id,
+                "skip": 0 if cursor else skip,
+                "limit": limit
+            }
+            
+            result = await execute_query_ro(
+                _LIST_COMPLETIONS_SQL[(include_template, include_assignment)], query_params
+            )
             
+            # Rows come from our own projection, so skip per-row Pydantic validation
             completions = []
             for completion in result:
-                completions.append(ChecklistCompletionResponse(
+                template = None
+                if include_template and completion["template_name"] is not None:
+                    template = ChecklistTemplateResponse.model_construct(
+                        id=completion["template_id"],
+                        name=completion["template_name"],
+                        equipment_codes=completion["template_equipment_codes"],
+                        checklist_items=completion["template_checklist_items"],
+                        enabled=completion["template_enabled"],
+                        created_at=completion["template_created_at"]
+                    )
+                
+                job_assignment = None
+                if include_assignment and completion["ja_status"] is not None:
+                    job_assignment = JobAssignmentResponse.model_construct(
+                        id=completion["job_assignment_id"],
+                        schedule_id=completion["ja_schedule_id"],
+                        user_id=completion["ja_user_id"],
+                        assigned_at=completion["ja_assigned_at"],
+                        accepted_at=completion["ja_accepted_at"],
+                        started_at=completion["ja_started_at"],
+                        completed_at=completion["ja_completed_at"],
+                        status=completion["ja_status"],
+                        notes=completion["ja_notes"]
+                    )
+                
+                completions.append(ChecklistCompletionResponse.model_construct(
                     id=completion["id"],
                     job_assignment_id=completion["job_assignment_id"],
                     template_id=completion["template_id"],
@@ -410,24 +801,27 @@ class ChecklistService:
                     completed_at=completion["completed_at"],
                     responses=completion["responses"],
                     signature_data=completion["signature_data"],
-                    status=completion["status"]
+                    status=completion["status"],
+                    template=template,
+                    job_assignment=job_assignment
                 ))
             
             return completions
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error("Failed to list checklist completions", error=str(e))
             raise BusinessLogicError("Failed to list checklist completions")
     
     def _validate_checklist_items(self, checklist_items: List[Dict[str, Any]]) -> None:
-        """Validate checklist items structure."""
-        if not checklist_items:
-            raise ValidationError("Checklist items cannot be empty")
+        """
+        Validate checklist item semantics.
         
+        That checklist_items is a non-empty array of objects is enforced by
+        the request models and the chk_checklist_items_shape constraint.
+        """
         for i, item in enumerate(checklist_items):
-            if not isinstance(item, dict):
-                raise ValidationError(f"Checklist item {i} must be a dictionary")
-            
             required_fields = ["id", "text", "required", "type"]
             for field in required_fields:
                 if field not in item:
@@ -453,45 +847,100 @@ class ChecklistService:
                 if not item["options"]:
                     raise ValidationError(f"Checklist item {i} select options cannot be empty")
     
+    def _compile_checklist_items(
+        self, 
+        template_id: UUID, 
+        checklist_items: List[Dict[str, Any]]
+    ) -> Tuple[List[tuple], Optional[Callable[[Dict[str, Any]], Any]]]:
+        """
+        Compile template items into validation rules, reusing them per template
+        for as long as the template's items are unchanged.
+        
+        Returns the per-item rules and, when fastjsonschema is installed, a
+        compiled JSON Schema validator for the whole response document.
+        """
+        # Items may be a fresh copy from the database, so compare by value
+        cached = self._compiled_checklists.get(template_id)
+        if cached is not None and cached[0] == checklist_items:
+            return cached[1]
+        
+        rules = []
+        for item in checklist_items:
+            # Unknown item types carry no response constraint
+            check, message = self._RESPONSE_VALIDATORS.get(item["type"], (lambda response, options: True, ""))
+            options = item.get("options") or ()
+            try:
+                options = frozenset(options)
+            except TypeError:
+                options = tuple(options)
+            rules.append((
+                item["id"],
+                item["required"],
+                item["text"],
+                check,
+                f"Checklist item '{item['text']}' {message}",
+                options
+            ))
+        
+        compiled = (rules, self._compile_response_schema(checklist_items))
+        self._compiled_checklists[template_id] = (checklist_items, compiled)
+        return compiled
+    
+    def _compile_response_schema(
+        self, 
+        checklist_items: List[Dict[str, Any]]
+    ) -> Optional[Callable[[Dict[str, Any]], Any]]:
+        """Build and compile a JSON Schema for checklist responses."""
+        if not FASTJSONSCHEMA_AVAILABLE:
+            return None
+        
+        properties = {}
+        for item in checklist_items:
+            item_type = item["type"]
+            if item_type == "select":
+                properties[item["id"]] = {"enum": list(item.get("options") or [])}
+            elif item_type in self._RESPONSE_SCHEMA_TYPES:
+                properties[item["id"]] = self._RESPONSE_SCHEMA_TYPES[item_type]
+        
+        schema = {
+            "type": "object",
+            "minProperties": 1,
+            "required": [item["id"] for item in checklist_items if item["required"]],
+            "properties": properties
+        }
+        
+        try:
+            return fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaDefinitionException as e:
+            logger.warning("Failed to compile checklist response schema", error=str(e))
+            return None
+    
     def _validate_checklist_responses(
         self, 
-        checklist_items: List[Dict[str, Any]], 
+        compiled: Tuple[List[tuple], Optional[Callable[[Dict[str, Any]], Any]]], 
         responses: Dict[str, Any]
     ) -> None:
-        """Validate checklist responses against template."""
+        """Validate checklist responses against compiled template rules."""
         if not responses:
             raise ValidationError("Checklist responses cannot be empty")
         
+        rules, schema_validator = compiled
+        
+        # Fast path: the generated validator accepts the whole document at once
+        if schema_validator is not None:
+            try:
+                schema_validator(responses)
+                return
+            except fastjsonschema.JsonSchemaException:
+                pass  # Fall through to the per-item rules for the exact error
+        
         # Check that all required items are completed
-        for item in checklist_items:
-            item_id = item["id"]
-            
-            if item["required"] and item_id not in responses:
-                raise ValidationError(f"Required checklist item '{item['text']}' not completed")
-            
+        for item_id, required, text, check, message, options in rules:
             if item_id in responses:
-                response = responses[item_id]
-                
-                # Validate response based on item type
-                if item["type"] == "checkbox":
-                    if not isinstance(response, bool):
-                        raise ValidationError(f"Checklist item '{item['text']}' must be boolean")
-                
-                elif item["type"] == "text":
-                    if not isinstance(response, str):
-                        raise ValidationError(f"Checklist item '{item['text']}' must be text")
-                
-                elif item["type"] == "number":
-                    if not isinstance(response, (int, float)):
-                        raise ValidationError(f"Checklist item '{item['text']}' must be a number")
-                
-                elif item["type"] == "select":
-                    if response not in item["options"]:
-                        raise ValidationError(f"Checklist item '{item['text']}' has invalid selection")
-                
-                elif item["type"] == "signature":
-                    if not isinstance(response, dict) or "signature" not in response:
-                        raise ValidationError(f"Checklist item '{item['text']}' must have signature data")
+                if not check(responses[item_id], options):
+                    raise ValidationError(message)
+            elif required:
+                raise ValidationError(f"Required checklist item '{text}' not completed")
     
     async def _update_job_assignment_status(
         self, 
@@ -500,13 +949,7 @@ class ChecklistService:
     ) -> None:
         """Update job assignment status."""
         try:
-            update_query = """
-            UPDATE factory_telemetry.job_assignments 
-            SET status = :status, updated_at = NOW()
-            WHERE id = :job_assignment_id
-            """
-            
-            await execute_update(update_query, {
+            await execute_update(_UPDATE_JOB_ASSIGNMENT_STATUS_SQL, {
                 "job_assignment_id": job_assignment_id,
                 "status": status
             })
@@ -6,22 +6,106 @@ for production equipment, including real-time detection, categorization,
 and integration with the existing PLC telemetry system.
 """
 
-from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Any, Tuple
+import asyncio
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, date
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Any, Tuple
 from uuid import UUID
+import numpy as np
 import structlog
 from enum import Enum
 
-from app.database import execute_query, execute_scalar, execute_update
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from app.database import execute_query, execute_query_stream, execute_scalar, execute_update
 from app.models.production import (
     DowntimeEventCreate, DowntimeEventUpdate, DowntimeEventResponse,
-    DowntimeCategory, DowntimeReasonCode
+    DowntimeCategory
 )
 from app.utils.exceptions import ValidationError, BusinessLogicError, NotFoundError
-from app.api.websocket import broadcast_downtime_event, broadcast_downtime_statistics_update
+from app.api.websocket import (
+    broadcast_downtime_event, broadcast_downtime_events_bulk, broadcast_downtime_statistics_update
+)
 
 logger = structlog.get_logger()
 
+# Buffered event inserts: a batch is flushed after ASYNC_INSERT_WAIT_TIME seconds
+# or as soon as ASYNC_INSERT_MAX_ROWS events are queued, whichever comes first
+ASYNC_INSERT_WAIT_TIME = 0.2
+ASYNC_INSERT_MAX_ROWS = 500
+
+# Interval (seconds) at which coalesced fault/context updates are written back
+DIRTY_EVENT_FLUSH_INTERVAL = 0.5
+
+# Interval (seconds) after which the cached wall-clock anchor used by _now() is refreshed
+NOW_ANCHOR_REFRESH = 1.0
+
+# Window (seconds) over which downtime broadcasts are collected into one fan-out
+BROADCAST_FLUSH_INTERVAL = 0.05
+
+# Strong references to fire-and-forget tasks; the event loop only holds weak ones
+_BACKGROUND_TASKS: set = set()
+
+# Hot-path statements are fixed SQL text, so each is prepared once per connection
+# and reused from the driver's statement cache regardless of batch size
+#
+# INSERT ... RETURNING cannot see the source rows, so ids are generated up front
+# and joined back to each row's 1-based position in the batch (ord)
+_INSERT_EVENTS_SQL = """
+WITH v AS (
+    SELECT gen_random_uuid() AS id, u.*
+    FROM unnest(
+        CAST(:line_ids AS uuid[]), CAST(:equipment_codes AS text[]),
+        CAST(:start_times AS timestamptz[]), CAST(:reason_codes AS text[]),
+        CAST(:reason_descriptions AS text[]), CAST(:categories AS text[]),
+        CAST(:subcategories AS text[]), CAST(:reported_bys AS uuid[]),
+        CAST(:fault_datas AS text[]), CAST(:context_datas AS text[])
+    ) WITH ORDINALITY AS u(line_id, equipment_code, start_time, reason_code, reason_description,
+                           category, subcategory, reported_by, fault_data, context_data, ord)
+), inserted AS (
+    INSERT INTO factory_telemetry.downtime_events 
+    (id, line_id, equipment_code, start_time, reason_code, reason_description, 
+     category, subcategory, reported_by, fault_data, context_data)
+    SELECT id, line_id, equipment_code, start_time, reason_code, reason_description,
+           category::factory_telemetry.downtime_category, subcategory, reported_by,
+           fault_data::jsonb, context_data::jsonb
+    FROM v
+    RETURNING id
+)
+SELECT v.ord, v.id
+FROM inserted JOIN v ON v.id = inserted.id
+"""
+
+_UPDATE_EVENTS_SQL = """
+UPDATE factory_telemetry.downtime_events de
+SET fault_data = v.fd::jsonb, context_data = v.cd::jsonb
+FROM unnest(CAST(:ids AS uuid[]), CAST(:fds AS text[]), CAST(:cds AS text[])) AS v(id, fd, cd)
+WHERE de.id = v.id
+"""
+
+_CLOSE_EVENT_SQL = """
+UPDATE factory_telemetry.downtime_events 
+SET end_time = :end_time, duration_seconds = :duration_seconds, status = 'closed',
+    fault_data = COALESCE(CAST(:fault_data AS text)::jsonb, fault_data),
+    context_data = COALESCE(CAST(:context_data AS text)::jsonb, context_data)
+WHERE id = :event_id
+"""
+
 
 class DowntimeReasonCode(str, Enum):
     """Standardized downtime reason codes."""
@@ -67,21 +151,254 @@ class DowntimeReasonCode(str, Enum):
     OTHER = "OTHER"
 
 
+# Built-in fault catalog (bit index -> fault info), shared read-only by all trackers
+_FAULT_CATALOG = MappingProxyType({
+    0: {"name": "Emergency Stop", "description": "Emergency stop activated", "marker": "INTERNAL", "severity": "critical"},
+    1: {"name": "Safety Gate Open", "description": "Safety gate is open", "marker": "INTERNAL", "severity": "high"},
+    2: {"name": "Motor Overload", "description": "Motor overload protection triggered", "marker": "INTERNAL", "severity": "high"},
+    3: {"name": "Temperature High", "description": "Equipment temperature too high", "marker": "INTERNAL", "severity": "medium"},
+    4: {"name": "Pressure Low", "description": "System pressure below threshold", "marker": "INTERNAL", "severity": "medium"},
+    5: {"name": "Upstream Stop", "description": "Upstream equipment stopped", "marker": "UPSTREAM", "severity": "medium"},
+    6: {"name": "Downstream Stop", "description": "Downstream equipment stopped", "marker": "DOWNSTREAM", "severity": "medium"},
+    7: {"name": "Material Jam", "description": "Material jam detected", "marker": "INTERNAL", "severity": "medium"},
+    8: {"name": "Sensor Fault", "description": "Sensor malfunction", "marker": "INTERNAL", "severity": "low"},
+    9: {"name": "Communication Error", "description": "Communication with PLC lost", "marker": "INTERNAL", "severity": "high"}
+})
+
+# Reason codes counted as planned stops; every other code is unplanned
+_PLANNED_REASON_CODES = frozenset({"MAINTENANCE", "CHANGEOVER", "CLEANING", "INSPECTION", "BREAK_TIME"})
+
+# Reason code -> downtime category, computed once at import
+_REASON_CATEGORY = MappingProxyType({
+    code.value: "planned" if code.value in _PLANNED_REASON_CODES else "unplanned"
+    for code in DowntimeReasonCode
+})
+
+
+class ClassificationResult(NamedTuple):
+    """Outcome of classifying a stopped equipment status."""
+    reason_code: str
+    reason_description: str
+    category: str
+    subcategory: Optional[str]
+    fault_data: Dict[str, Any]
+    context_data: Dict[str, Any]
+
+
+# Fault name keywords in priority order, scanned in a single pass by _FAULT_KEYWORD_PATTERN
+_FAULT_KEYWORDS = (
+    ("bearing", DowntimeReasonCode.BEARING_FAILURE),
+    ("belt", DowntimeReasonCode.BELT_BREAKAGE),
+    ("gear", DowntimeReasonCode.GEAR_FAILURE),
+    ("motor", DowntimeReasonCode.MOTOR_FAILURE),
+    ("sensor", DowntimeReasonCode.SENSOR_FAILURE),
+    ("plc", DowntimeReasonCode.PLC_FAULT),
+    ("power", DowntimeReasonCode.POWER_LOSS),
+    ("wiring", DowntimeReasonCode.WIRING_FAULT),
+    ("quality", DowntimeReasonCode.QUALITY_ISSUE),
+)
+_FAULT_KEYWORD_PATTERN = re.compile("|".join(keyword for keyword, _ in _FAULT_KEYWORDS))
+
+# Shared pool for CPU-bound event classification so it does not stall the event loop;
+# worker threads are only spawned on first use
+_CLASSIFICATION_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="downtime-classify"
+)
+
+# Fault catalog markers packed into an int8 array indexed by fault bit
+MARKER_NONE = -1  # bit not in the fault catalog
+MARKER_OTHER = -2  # catalogued with a marker that does not drive reason selection
+MARKER_INTERNAL = 0
+MARKER_UPSTREAM = 1
+MARKER_DOWNSTREAM = 2
+_MARKER_IDS = {"INTERNAL": MARKER_INTERNAL, "UPSTREAM": MARKER_UPSTREAM, "DOWNSTREAM": MARKER_DOWNSTREAM}
+
+
+def _scan_faults_kernel(fault_bits: np.ndarray, catalog_markers: np.ndarray) -> Tuple[int, int, int]:
+    """Return the first internal, upstream and downstream active fault bit (-1 when none)."""
+    first_internal = first_upstream = first_downstream = -1
+    for i in range(min(fault_bits.shape[0], catalog_markers.shape[0])):
+        if fault_bits[i]:
+            marker = catalog_markers[i]
+            if marker == MARKER_INTERNAL:
+                first_internal = i
+                break
+            if marker == MARKER_UPSTREAM and first_upstream < 0:
+                first_upstream = i
+            elif marker == MARKER_DOWNSTREAM and first_downstream < 0:
+                first_downstream = i
+    return first_internal, first_upstream, first_downstream
+
+
+def _scan_faults_numpy(fault_bits: np.ndarray, catalog_markers: np.ndarray) -> Tuple[int, int, int]:
+    """Pure-Python fallback for _scan_faults_kernel that only visits active bits."""
+    active = np.flatnonzero(fault_bits[:catalog_markers.shape[0]])
+    first_internal = first_upstream = first_downstream = -1
+    for bit_index, marker in zip(active.tolist(), catalog_markers[active].tolist()):
+        if marker == MARKER_INTERNAL:
+            first_internal = bit_index
+            break
+        if marker == MARKER_UPSTREAM and first_upstream < 0:
+            first_upstream = bit_index
+        elif marker == MARKER_DOWNSTREAM and first_downstream < 0:
+            first_downstream = bit_index
+    return first_internal, first_upstream, first_downstream
+
+
+_scan_faults = njit(cache=True)(_scan_faults_kernel) if NUMBA_AVAILABLE else _scan_faults_numpy
+
+
+def warmup_fault_scan() -> None:
+    """Compile the fault scan kernel ahead of the first PLC tick (no-op without Numba)."""
+    if NUMBA_AVAILABLE:
+        _scan_faults(np.zeros(64, dtype=np.bool_), np.zeros(64, dtype=np.int8))
+
+
+def _iso(timestamp: Optional[datetime]) -> Optional[str]:
+    """ISO 8601 string for an optional datetime."""
+    return timestamp.isoformat() if timestamp else None
+
+
+def _epoch_seconds(timestamp: datetime) -> float:
+    """Epoch seconds for a datetime, treating naive values as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+def _fingerprint(fault_data: Dict[str, Any], context_data: Dict[str, Any]) -> int:
+    """Cheap change-detection fingerprint of extracted fault/context data."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        return hash((
+            orjson.dumps(fault_data, default=str, option=option),
+            orjson.dumps(context_data, default=str, option=option)
+        ))
+    return hash((json.dumps(fault_data, default=str), json.dumps(context_data, default=str)))
+
+
+def _public_event(event_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a tracked event without the tracker's underscore-prefixed bookkeeping."""
+    return {key: value for key, value in event_data.items() if not key.startswith("_")}
+
+
+class ActiveEventTable(dict):
+    """
+    Active downtime events keyed by equipment code.
+    
+    Behaves as a plain dict for per-event access, and mirrors each event's start
+    time into a parallel float64 array (one slot per equipment) so scans over all
+    open events, such as finding long-running stops, are a single vectorized
+    comparison instead of a Python loop over the event dicts.
+    """
+    
+    # Below this many open events a plain loop is cheaper than the array scan
+    VECTOR_SCAN_MIN_EVENTS = 32
+    
+    def __init__(self, capacity: int = 64):
+        super().__init__()
+        self._slots: Dict[str, int] = {}  # equipment_code -> slot
+        self._slot_codes: List[Optional[str]] = []  # slot -> equipment_code
+        self._free_slots: List[int] = []
+        self._start_ts = np.full(capacity, np.nan)
+    
+    def __setitem__(self, equipment_code: str, event_data: Dict[str, Any]) -> None:
+        super().__setitem__(equipment_code, event_data)
+        slot = self._slots.get(equipment_code)
+        if slot is None:
+            slot = self._allocate_slot(equipment_code)
+        self._start_ts[slot] = _epoch_seconds(event_data["start_time"])
+    
+    def __delitem__(self, equipment_code: str) -> None:
+        super().__delitem__(equipment_code)
+        self._release_slot(equipment_code)
+    
+    def pop(self, equipment_code: str, *default):
+        if equipment_code not in self:
+            return super().pop(equipment_code, *default)
+        event_data = super().pop(equipment_code)
+        self._release_slot(equipment_code)
+        return event_data
+    
+    def clear(self) -> None:
+        super().clear()
+        self._slots.clear()
+        self._slot_codes.clear()
+        self._free_slots.clear()
+        self._start_ts[:] = np.nan
+    
+    def _allocate_slot(self, equipment_code: str) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_codes[slot] = equipment_code
+        else:
+            slot = len(self._slot_codes)
+            self._slot_codes.append(equipment_code)
+            if slot >= len(self._start_ts):
+                grown = np.full(len(self._start_ts) * 2, np.nan)
+                grown[:len(self._start_ts)] = self._start_ts
+                self._start_ts = grown
+        self._slots[equipment_code] = slot
+        return slot
+    
+    def _release_slot(self, equipment_code: str) -> None:
+        slot = self._slots.pop(equipment_code, None)
+        if slot is not None:
+            self._start_ts[slot] = np.nan
+            self._slot_codes[slot] = None
+            self._free_slots.append(slot)
+    
+    def open_longer_than(self, min_duration_seconds: float, now_ts: Optional[float] = None) -> List[str]:
+        """Equipment codes whose open event started more than ``min_duration_seconds`` ago."""
+        if now_ts is None:
+            now_ts = time.time()
+        
+        if len(self) < self.VECTOR_SCAN_MIN_EVENTS:
+            return [
+                equipment_code for equipment_code, slot in self._slots.items()
+                if now_ts - self._start_ts[slot] > min_duration_seconds
+            ]
+        
+        # Free slots hold NaN, which never compares greater
+        ages = now_ts - self._start_ts[:len(self._slot_codes)]
+        return [self._slot_codes[slot] for slot in np.flatnonzero(ages > min_duration_seconds).tolist()]
+
+
 class DowntimeTracker:
     """Comprehensive downtime tracking and analysis service."""
     
     def __init__(self):
         """Initialize downtime tracker with fault catalog."""
-        self.active_events = {}  # equipment_code -> event_data
+        self.active_events = ActiveEventTable()  # equipment_code -> event_data
         self.fault_catalog = self._load_fault_catalog()
+        self._catalog_markers = self._build_catalog_markers(self.fault_catalog)
         self.reason_codes = self._load_reason_codes()
+        self._fault_reason_cache: Dict[str, str] = {}  # fault name -> reason code
+        self._cpu_pool = _CLASSIFICATION_POOL
+        self._last_now: Tuple[float, datetime] = (float("-inf"), datetime.min)  # (monotonic, utc)
+        
+        # Pending inserts are (event_data, future) pairs drained by _insert_flush_loop.
+        # The flush loops below are started on first use, since trackers are built
+        # outside the event loop, and return once idle so short-lived trackers (one
+        # per API request) leave no tasks behind
+        self._insert_queue: asyncio.Queue = asyncio.Queue()
+        self._insert_flush_task: Optional[asyncio.Task] = None
+        
+        # Fault/context changes are coalesced per event and written by _update_flush_loop
+        self._dirty_events: Dict[UUID, Tuple[str, str]] = {}
+        self._update_flush_task: Optional[asyncio.Task] = None
+        
+        # Open/close broadcasts are queued and fanned out in batches by _broadcast_flush_loop
+        self._broadcast_queue: asyncio.Queue = asyncio.Queue()
+        self._broadcast_flush_task: Optional[asyncio.Task] = None
     
     async def detect_downtime_event(
         self, 
         line_id: UUID, 
         equipment_code: str, 
         current_status: Dict[str, Any],
-        timestamp: datetime = None
+        timestamp: datetime = None,
+        wait_for_persist: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         Detect and categorize downtime events based on PLC data.
@@ -90,41 +407,47 @@ class DowntimeTracker:
             line_id: Production line ID
             equipment_code: Equipment identifier
             current_status: Current equipment status from PLC
-            timestamp: Event timestamp (defaults to now)
+            timestamp: Event timestamp; pollers should pass one timestamp per poll
+                cycle. Defaults to a cached monotonic-offset clock (see _now).
+            wait_for_persist: Wait for a newly started event to be stored so the
+                returned event carries its "id". Otherwise the insert runs in the
+                background and "id" is None until it completes.
             
         Returns:
             Downtime event data if detected, None otherwise
         """
+        # Determine if equipment is actually running
+        is_actually_running = (
+            current_status.get("running", False) and current_status.get("speed", 0.0) > 0.1
+        )
+        has_active_event = equipment_code in self.active_events
+        
+        # Fast path: running equipment with no open event is the common tick and needs
+        # neither a timestamp nor any classification, so it returns before the try block
+        if is_actually_running and not has_active_event:
+            return None
+        
         if timestamp is None:
-            timestamp = datetime.utcnow()
+            timestamp = self._now()
         
         try:
-            # Check if equipment is currently running
-            is_running = current_status.get("running", False)
-            speed = current_status.get("speed", 0.0)
-            
-            # Determine if equipment is actually running
-            is_actually_running = is_running and speed > 0.1
-            
             if is_actually_running:
-                # Equipment is running, check if we need to close an active event
-                if equipment_code in self.active_events:
-                    return await self._close_downtime_event(
-                        line_id, equipment_code, timestamp
-                    )
-                return None
+                # Equipment is running again, close the active event
+                return await self._close_downtime_event(
+                    line_id, equipment_code, timestamp
+                )
             
             # Equipment is stopped, determine reason and handle event
-            if equipment_code not in self.active_events:
+            if not has_active_event:
                 # Start new downtime event
                 return await self._start_downtime_event(
-                    line_id, equipment_code, current_status, timestamp
-                )
-            else:
-                # Update existing event with additional information
-                return await self._update_downtime_event(
-                    line_id, equipment_code, current_status, timestamp
+                    line_id, equipment_code, current_status, timestamp, wait_for_persist
                 )
+            
+            # Update existing event with additional information
+            return await self._update_downtime_event(
+                line_id, equipment_code, current_status, timestamp
+            )
                 
         except Exception as e:
             logger.error(
@@ -135,57 +458,90 @@ class DowntimeTracker:
             )
             raise BusinessLogicError("Failed to detect downtime event")
     
+    def _now(self) -> datetime:
+        """Current UTC time as a monotonic offset from a wall-clock anchor refreshed every second."""
+        monotonic_now = time.monotonic()
+        anchor_monotonic, anchor_utc = self._last_now
+        elapsed = monotonic_now - anchor_monotonic
+        if elapsed >= NOW_ANCHOR_REFRESH:
+            anchor_utc = datetime.utcnow()
+            self._last_now = (monotonic_now, anchor_utc)
+            return anchor_utc
+        return anchor_utc + timedelta(seconds=elapsed)
+    
     async def _start_downtime_event(
         self,
         line_id: UUID,
         equipment_code: str,
         status: Dict[str, Any],
-        timestamp: datetime
+        timestamp: datetime,
+        wait_for_persist: bool = False
     ) -> Dict[str, Any]:
         """Start a new downtime event."""
         try:
-            # Determine downtime reason
-            reason_code, reason_description, category = await self._determine_downtime_reason(
-                equipment_code, status
-            )
+            # Classify off the event loop so pending DB writes and broadcasts keep flowing
+            loop = asyncio.get_running_loop()
+            classification = await loop.run_in_executor(self._cpu_pool, self._classify_full, status)
             
             # Create downtime event
             event_data = {
+                "id": None,  # Set once the batched insert completes
                 "line_id": line_id,
                 "equipment_code": equipment_code,
                 "start_time": timestamp,
-                "reason_code": reason_code,
-                "reason_description": reason_description,
-                "category": category,
-                "subcategory": self._get_subcategory(reason_code, status),
+                "reason_code": classification.reason_code,
+                "reason_description": classification.reason_description,
+                "category": classification.category,
+                "subcategory": classification.subcategory,
                 "reported_by": None,  # Will be set when user reports
                 "status": "open",
-                "fault_data": self._extract_fault_data(status),
-                "context_data": self._extract_context_data(status)
+                "fault_data": classification.fault_data,
+                "context_data": classification.context_data,
+                # Formatted once and reused by every broadcast over the event's lifetime
+                "_line_id_str": str(line_id),
+                "_start_time_iso": timestamp.isoformat(),
+                # Lets the first update tick skip data identical to what is being inserted
+                "_fingerprint": _fingerprint(classification.fault_data, classification.context_data)
             }
             
             # Store in active events
             self.active_events[equipment_code] = event_data
             
-            # Store in database
-            event_id = await self._store_downtime_event(event_data)
-            event_data["id"] = event_id
+            # Persist in the background so the next tick can be classified while the
+            # insert waits for its batch; "id" is set once the insert completes
+            persist_task = asyncio.create_task(self._persist_downtime_event(event_data))
+            event_data["_persist_task"] = persist_task
             
-            logger.info(
-                "Downtime event started",
-                event_id=event_id,
-                line_id=line_id,
-                equipment_code=equipment_code,
-                reason_code=reason_code,
-                category=category
-            )
+            if wait_for_persist:
+                await persist_task
+                if event_data["id"] is None:
+                    raise BusinessLogicError("Failed to store downtime event")
             
-            return event_data
+            return _public_event(event_data)
             
         except Exception as e:
             logger.error("Failed to start downtime event", error=str(e))
             raise BusinessLogicError("Failed to start downtime event")
     
+    async def _persist_downtime_event(self, event_data: Dict[str, Any]) -> None:
+        """Store a newly started downtime event and record its id."""
+        try:
+            event_id = await self._store_downtime_event(event_data)
+        except BusinessLogicError:
+            # Already logged; the event stays active without an id and is dropped on close
+            return
+        
+        event_data["id"] = event_id
+        
+        logger.info(
+            "Downtime event started",
+            event_id=event_id,
+            line_id=event_data["line_id"],
+            equipment_code=event_data["equipment_code"],
+            reason_code=event_data["reason_code"],
+            category=event_data["category"]
+        )
+    
     async def _close_downtime_event(
         self,
         line_id: UUID,
@@ -193,32 +549,36 @@ class DowntimeTracker:
         timestamp: datetime
     ) -> Dict[str, Any]:
         """Close an active downtime event."""
+        # Claim the event before the first await so a concurrent close for the same
+        # equipment finds nothing to close instead of closing it a second time
+        event_data = self.active_events.pop(equipment_code, None)
+        if event_data is None:
+            return None
+        
         try:
-            if equipment_code not in self.active_events:
-                return None
-            
-            event_data = self.active_events[equipment_code]
+            # Wait for the start of the event to be persisted before closing it
+            persist_task = event_data.pop("_persist_task", None)
+            if persist_task is not None:
+                await persist_task
             event_id = event_data.get("id")
             
             if not event_id:
-                # Event was not stored in database, remove from active events
-                del self.active_events[equipment_code]
+                # Event was not stored in database, so there is nothing to close
                 return None
             
             # Calculate duration
             start_time = event_data["start_time"]
             duration_seconds = int((timestamp - start_time).total_seconds())
             
-            # Update event in database
-            await self._update_downtime_event_in_db(
-                event_id, 
-                end_time=timestamp,
-                duration_seconds=duration_seconds,
-                status="closed"
-            )
-            
-            # Remove from active events
-            del self.active_events[equipment_code]
+            # Update event in database, folding in any fault/context change not yet flushed
+            fault_json, context_json = self._dirty_events.pop(event_id, (None, None))
+            await execute_update(_CLOSE_EVENT_SQL, {
+                "event_id": event_id,
+                "end_time": timestamp,
+                "duration_seconds": duration_seconds,
+                "fault_data": fault_json,
+                "context_data": context_json
+            })
             
             # Update event data
             event_data.update({
@@ -236,26 +596,26 @@ class DowntimeTracker:
             )
             
             # Broadcast real-time update
-            try:
-                await broadcast_downtime_event({
-                    "id": str(event_id),
-                    "line_id": str(line_id),
-                    "equipment_code": equipment_code,
-                    "start_time": start_time.isoformat(),
-                    "end_time": timestamp.isoformat(),
-                    "duration_seconds": duration_seconds,
-                    "reason_code": event_data["reason_code"],
-                    "reason_description": event_data["reason_description"],
-                    "category": event_data["category"],
-                    "subcategory": event_data["subcategory"],
-                    "status": "closed"
-                })
-            except Exception as e:
-                logger.warning("Failed to broadcast downtime event closure", error=str(e))
+            self._queue_broadcast({
+                "id": event_data.get("_id_str") or str(event_id),
+                "line_id": event_data.get("_line_id_str") or str(line_id),
+                "equipment_code": equipment_code,
+                "start_time": event_data.get("_start_time_iso") or start_time.isoformat(),
+                "end_time": timestamp.isoformat(),
+                "duration_seconds": duration_seconds,
+                "reason_code": event_data["reason_code"],
+                "reason_description": event_data["reason_description"],
+                "category": event_data["category"],
+                "subcategory": event_data["subcategory"],
+                "status": "closed"
+            })
             
-            return event_data
+            return _public_event(event_data)
             
         except Exception as e:
+            # Keep the event open for the next tick unless a new one has started meanwhile
+            if equipment_code not in self.active_events:
+                self.active_events[equipment_code] = event_data
             logger.error("Failed to close downtime event", error=str(e))
             raise BusinessLogicError("Failed to close downtime event")
     
@@ -281,73 +641,82 @@ class DowntimeTracker:
             new_fault_data = self._extract_fault_data(status)
             new_context_data = self._extract_context_data(status)
             
+            # Nothing changed since the last tick: skip the merge and the write entirely
+            fingerprint = _fingerprint(new_fault_data, new_context_data)
+            if event_data.get("_fingerprint") == fingerprint:
+                return _public_event(event_data)
+            event_data["_fingerprint"] = fingerprint
+            
             # Merge with existing data
             event_data["fault_data"].update(new_fault_data)
             event_data["context_data"].update(new_context_data)
             
-            # Update in database
-            await self._update_downtime_event_in_db(
-                event_id,
-                fault_data=event_data["fault_data"],
-                context_data=event_data["context_data"]
-            )
+            fault_json = json.dumps(event_data["fault_data"], default=str)
+            context_json = json.dumps(event_data["context_data"], default=str)
+            
+            # Mark dirty; the flush loop writes the latest data for each event
+            self._dirty_events[event_id] = (fault_json, context_json)
+            if self._update_flush_task is None or self._update_flush_task.done():
+                self._update_flush_task = asyncio.create_task(self._update_flush_loop())
             
-            return event_data
+            return _public_event(event_data)
             
         except Exception as e:
             logger.error("Failed to update downtime event", error=str(e))
             raise BusinessLogicError("Failed to update downtime event")
     
-    async def _determine_downtime_reason(
+    def _classify_full(self, status: Dict[str, Any]) -> ClassificationResult:
+        """Classify a stop in one pass over the status: reason, subcategory, fault and context data."""
+        fault_data = self._extract_fault_data(status)
+        context_data = self._extract_context_data(status)
+        
+        # Reason selection reuses the already extracted fault bits and speed
+        reason_code, reason_description, category = self._resolve_downtime_reason(
+            status, fault_data["fault_bits"], context_data["speed"]
+        )
+        return ClassificationResult(
+            reason_code,
+            reason_description,
+            category,
+            self._get_subcategory(reason_code, status),
+            fault_data,
+            context_data
+        )
+    
+    def _resolve_downtime_reason(
         self, 
-        equipment_code: str, 
-        status: Dict[str, Any]
+        status: Dict[str, Any],
+        fault_bits: Any,
+        speed: float
     ) -> Tuple[str, str, str]:
         """Determine downtime reason from equipment status."""
         try:
-            # Check for active faults first
-            fault_bits = status.get("fault_bits", [])
-            active_faults = []
-            
-            for i, bit_active in enumerate(fault_bits):
-                if bit_active:
-                    fault_info = self.fault_catalog.get(i, {})
-                    if fault_info:
-                        active_faults.append({
-                            "bit_index": i,
-                            "name": fault_info.get("name", f"Fault {i}"),
-                            "description": fault_info.get("description", "Unknown fault"),
-                            "marker": fault_info.get("marker", "INTERNAL"),
-                            "severity": fault_info.get("severity", "medium")
-                        })
-            
-            if active_faults:
-                # Prioritize faults by marker and severity
-                internal_faults = [f for f in active_faults if f["marker"] == "INTERNAL"]
-                upstream_faults = [f for f in active_faults if f["marker"] == "UPSTREAM"]
-                downstream_faults = [f for f in active_faults if f["marker"] == "DOWNSTREAM"]
-                
-                if internal_faults:
-                    fault = internal_faults[0]  # Take first internal fault
-                    return (
-                        self._map_fault_to_reason_code(fault["name"]),
-                        fault["description"],
-                        "unplanned"
-                    )
-                elif upstream_faults:
-                    fault = upstream_faults[0]
-                    return (
-                        DowntimeReasonCode.UPSTREAM_STOP,
-                        f"Upstream: {fault['description']}",
-                        "unplanned"
-                    )
-                elif downstream_faults:
-                    fault = downstream_faults[0]
-                    return (
-                        DowntimeReasonCode.DOWNSTREAM_STOP,
-                        f"Downstream: {fault['description']}",
-                        "unplanned"
-                    )
+            # Check for active faults first; an internal fault wins over upstream/downstream
+            first_internal, first_upstream, first_downstream = _scan_faults(
+                self._fault_bits_array(fault_bits), self._catalog_markers
+            )
+            
+            if first_internal >= 0:
+                fault = self._fault_info(first_internal)
+                return (
+                    self._map_fault_to_reason_code(fault["name"]),
+                    fault["description"],
+                    "unplanned"
+                )
+            if first_upstream >= 0:
+                fault = self._fault_info(first_upstream)
+                return (
+                    DowntimeReasonCode.UPSTREAM_STOP,
+                    f"Upstream: {fault['description']}",
+                    "unplanned"
+                )
+            if first_downstream >= 0:
+                fault = self._fault_info(first_downstream)
+                return (
+                    DowntimeReasonCode.DOWNSTREAM_STOP,
+                    f"Downstream: {fault['description']}",
+                    "unplanned"
+                )
             
             # Check for planned stops
             if status.get("planned_stop", False):
@@ -358,7 +727,6 @@ class DowntimeTracker:
                 )
             
             # Check for speed-based stops
-            speed = status.get("speed", 0.0)
             if speed == 0.0:
                 return (
                     DowntimeReasonCode.UNKNOWN,
@@ -396,30 +764,38 @@ class DowntimeTracker:
                 "unplanned"
             )
     
+    def _fault_bits_array(self, fault_bits: Any) -> np.ndarray:
+        """Convert fault bits (list of bools or int bitmap) to a bool array over the catalog range."""
+        marker_count = len(self._catalog_markers)
+        if isinstance(fault_bits, (int, np.integer)):
+            packed = (int(fault_bits) & ((1 << marker_count) - 1)).to_bytes((marker_count + 7) // 8, "little")
+            bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), bitorder="little")
+            return bits[:marker_count].astype(np.bool_)
+        return np.asarray(fault_bits, dtype=np.bool_)[:marker_count]
+    
+    def _fault_info(self, bit_index: int) -> Dict[str, Any]:
+        """Get catalog details for an active fault bit."""
+        fault_info = self.fault_catalog[bit_index]
+        return {
+            "bit_index": bit_index,
+            "name": fault_info.get("name", f"Fault {bit_index}"),
+            "description": fault_info.get("description", "Unknown fault"),
+            "marker": fault_info.get("marker", "INTERNAL"),
+            "severity": fault_info.get("severity", "medium")
+        }
+    
     def _map_fault_to_reason_code(self, fault_name: str) -> str:
         """Map fault name to standardized reason code."""
-        fault_name_lower = fault_name.lower()
-        
-        if "bearing" in fault_name_lower:
-            return DowntimeReasonCode.BEARING_FAILURE
-        elif "belt" in fault_name_lower:
-            return DowntimeReasonCode.BELT_BREAKAGE
-        elif "gear" in fault_name_lower:
-            return DowntimeReasonCode.GEAR_FAILURE
-        elif "motor" in fault_name_lower:
-            return DowntimeReasonCode.MOTOR_FAILURE
-        elif "sensor" in fault_name_lower:
-            return DowntimeReasonCode.SENSOR_FAILURE
-        elif "plc" in fault_name_lower:
-            return DowntimeReasonCode.PLC_FAULT
-        elif "power" in fault_name_lower:
-            return DowntimeReasonCode.POWER_LOSS
-        elif "wiring" in fault_name_lower:
-            return DowntimeReasonCode.WIRING_FAULT
-        elif "quality" in fault_name_lower:
-            return DowntimeReasonCode.QUALITY_ISSUE
-        else:
-            return DowntimeReasonCode.MECHANICAL_FAULT
+        reason_code = self._fault_reason_cache.get(fault_name)
+        if reason_code is None:
+            # Earliest keyword in _FAULT_KEYWORDS wins, regardless of position in the name
+            matches = {match.group(0) for match in _FAULT_KEYWORD_PATTERN.finditer(fault_name.lower())}
+            reason_code = next(
+                (code for keyword, code in _FAULT_KEYWORDS if keyword in matches),
+                DowntimeReasonCode.MECHANICAL_FAULT
+            )
+            self._fault_reason_cache[fault_name] = reason_code
+        return reason_code
     
     def _get_subcategory(self, reason_code: str, status: Dict[str, Any]) -> Optional[str]:
         """Get subcategory for downtime reason."""
@@ -460,56 +836,165 @@ class DowntimeTracker:
     async def _store_downtime_event(self, event_data: Dict[str, Any]) -> UUID:
         """Store downtime event in database."""
         try:
-            insert_query = """
-            INSERT INTO factory_telemetry.downtime_events 
-            (line_id, equipment_code, start_time, reason_code, reason_description, 
-             category, subcategory, reported_by, fault_data, context_data)
-            VALUES (:line_id, :equipment_code, :start_time, :reason_code, 
-                   :reason_description, :category, :subcategory, :reported_by, 
-                   :fault_data, :context_data)
-            RETURNING id
-            """
+            if self._insert_flush_task is None or self._insert_flush_task.done():
+                self._insert_flush_task = asyncio.create_task(self._insert_flush_loop())
+            
+            # Queue the insert and wait for the batch containing it to be flushed
+            future = asyncio.get_running_loop().create_future()
+            self._insert_queue.put_nowait((event_data, future))
+            event_id = await future
+            event_data["_id_str"] = str(event_id)
             
-            result = await execute_query(insert_query, {
-                "line_id": event_data["line_id"],
+            # Broadcast real-time update
+            self._queue_broadcast({
+                "id": event_data["_id_str"],
+                "line_id": event_data.get("_line_id_str") or str(event_data["line_id"]),
                 "equipment_code": event_data["equipment_code"],
-                "start_time": event_data["start_time"],
+                "start_time": event_data.get("_start_time_iso") or event_data["start_time"].isoformat(),
                 "reason_code": event_data["reason_code"],
                 "reason_description": event_data["reason_description"],
                 "category": event_data["category"],
                 "subcategory": event_data["subcategory"],
-                "reported_by": event_data["reported_by"],
-                "fault_data": event_data["fault_data"],
-                "context_data": event_data["context_data"]
+                "status": "open"
             })
             
-            if not result:
-                raise BusinessLogicError("Failed to store downtime event")
-            
-            event_id = result[0]["id"]
-            
-            # Broadcast real-time update
-            try:
-                await broadcast_downtime_event({
-                    "id": str(event_id),
-                    "line_id": str(event_data["line_id"]),
-                    "equipment_code": event_data["equipment_code"],
-                    "start_time": event_data["start_time"].isoformat(),
-                    "reason_code": event_data["reason_code"],
-                    "reason_description": event_data["reason_description"],
-                    "category": event_data["category"],
-                    "subcategory": event_data["subcategory"],
-                    "status": "open"
-                })
-            except Exception as e:
-                logger.warning("Failed to broadcast downtime event", error=str(e))
-            
             return event_id
             
         except Exception as e:
             logger.error("Failed to store downtime event", error=str(e))
             raise BusinessLogicError("Failed to store downtime event")
     
+    async def _insert_flush_loop(self) -> None:
+        """Drain queued downtime event inserts into batched multi-row INSERTs until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        
+        while not self._insert_queue.empty():
+            batch = [self._insert_queue.get_nowait()]
+            deadline = loop.time() + ASYNC_INSERT_WAIT_TIME
+            
+            while len(batch) < ASYNC_INSERT_MAX_ROWS:
+                try:
+                    batch.append(self._insert_queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._insert_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._flush_inserts(batch)
+    
+    async def _flush_inserts(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Insert a batch of downtime events and resolve each waiter with its id."""
+        try:
+            await self._insert_events(batch)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error("Failed to flush downtime event inserts", error=str(e), batch_size=1)
+                self._fail_inserts(batch, e)
+                return
+            logger.warning(
+                "Batched downtime event insert failed, retrying row by row",
+                error=str(e),
+                batch_size=len(batch)
+            )
+        
+        # One bad row fails the whole statement, so isolate it from its neighbours
+        for entry in batch:
+            try:
+                await self._insert_events([entry])
+            except Exception as e:
+                logger.error(
+                    "Failed to insert downtime event",
+                    error=str(e),
+                    equipment_code=entry[0]["equipment_code"]
+                )
+                self._fail_inserts([entry], e)
+    
+    async def _insert_events(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Run one batched INSERT and resolve each waiter with the id of its row."""
+        events = [event_data for event_data, _ in batch]
+        params = {
+            "line_ids": [event["line_id"] for event in events],
+            "equipment_codes": [event["equipment_code"] for event in events],
+            "start_times": [event["start_time"] for event in events],
+            "reason_codes": [event["reason_code"] for event in events],
+            "reason_descriptions": [event["reason_description"] for event in events],
+            "categories": [event["category"] for event in events],
+            "subcategories": [event["subcategory"] for event in events],
+            "reported_bys": [event["reported_by"] for event in events],
+            "fault_datas": [json.dumps(event["fault_data"], default=str) for event in events],
+            "context_datas": [json.dumps(event["context_data"], default=str) for event in events]
+        }
+        
+        result = await execute_query(_INSERT_EVENTS_SQL, params)
+        
+        # RETURNING order is not guaranteed, so ids are matched by batch position
+        ids = {row.ord: row.id for row in result}
+        
+        for ordinal, (_, future) in enumerate(batch, start=1):
+            if future.done():
+                continue
+            event_id = ids.get(ordinal)
+            if event_id is not None:
+                future.set_result(event_id)
+            else:
+                future.set_exception(BusinessLogicError("Failed to store downtime event"))
+    
+    @staticmethod
+    def _fail_inserts(batch: List[Tuple[Dict[str, Any], asyncio.Future]], error: Exception) -> None:
+        """Reject every still-pending waiter in a batch."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+    
+    async def _update_flush_loop(self) -> None:
+        """Periodically write coalesced fault/context updates in one statement until none are left."""
+        while True:
+            await asyncio.sleep(DIRTY_EVENT_FLUSH_INTERVAL)
+            if not self._dirty_events:
+                return
+            
+            dirty, self._dirty_events = self._dirty_events, {}
+            params = {
+                "ids": list(dirty),
+                "fds": [fault_json for fault_json, _ in dirty.values()],
+                "cds": [context_json for _, context_json in dirty.values()]
+            }
+            
+            try:
+                await execute_update(_UPDATE_EVENTS_SQL, params)
+            except Exception as e:
+                logger.error("Failed to flush downtime event updates", error=str(e), batch_size=len(dirty))
+                # Retry on the next tick unless a newer update has superseded the entry
+                for event_id, data in dirty.items():
+                    self._dirty_events.setdefault(event_id, data)
+    
+    def _queue_broadcast(self, payload: Dict[str, Any]) -> None:
+        """Queue a downtime event broadcast without waiting on WebSocket sends."""
+        if self._broadcast_flush_task is None or self._broadcast_flush_task.done():
+            self._broadcast_flush_task = asyncio.create_task(self._broadcast_flush_loop())
+        self._broadcast_queue.put_nowait(payload)
+    
+    async def _broadcast_flush_loop(self) -> None:
+        """Fan out queued downtime broadcasts once per BROADCAST_FLUSH_INTERVAL until the queue is empty."""
+        while not self._broadcast_queue.empty():
+            await asyncio.sleep(BROADCAST_FLUSH_INTERVAL)
+            payloads = []
+            while not self._broadcast_queue.empty():
+                payloads.append(self._broadcast_queue.get_nowait())
+            
+            try:
+                await broadcast_downtime_events_bulk(payloads)
+            except Exception as e:
+                logger.warning("Failed to broadcast downtime events", error=str(e), batch_size=len(payloads))
+    
     async def _update_downtime_event_in_db(
         self,
         event_id: UUID,
@@ -559,6 +1044,64 @@ class DowntimeTracker:
             logger.error("Failed to update downtime event", error=str(e))
             raise BusinessLogicError("Failed to update downtime event")
     
+    def _build_downtime_events_query(
+        self,
+        line_id: Optional[UUID] = None,
+        equipment_code: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build the filtered downtime events query (newest first, no paging)."""
+        where_conditions = []
+        params = {}
+        
+        if line_id:
+            where_conditions.append("de.line_id = :line_id")
+            params["line_id"] = line_id
+        
+        if equipment_code:
+            where_conditions.append("de.equipment_code = :equipment_code")
+            params["equipment_code"] = equipment_code
+        
+        # Half-open timestamp range so the start_time indexes can be used
+        if start_date:
+            where_conditions.append("de.start_time >= :start_ts")
+            params["start_ts"] = datetime.combine(start_date, datetime.min.time())
+        
+        if end_date:
+            where_conditions.append("de.start_time < :end_ts")
+            params["end_ts"] = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+        
+        if category:
+            where_conditions.append("de.category = :category")
+            params["category"] = category
+        
+        if status:
+            where_conditions.append("de.status = :status")
+            params["status"] = status
+        
+        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+        
+        query = f"""
+        SELECT de.id, de.line_id, de.equipment_code, de.start_time, de.end_time,
+               de.duration_seconds, de.reason_code, de.reason_description,
+               de.category, de.subcategory, de.reported_by, de.confirmed_by,
+               de.confirmed_at, de.notes, de.fault_data, de.context_data,
+               de.created_at, pl.line_code, pl.name as line_name,
+               u1.username as reported_by_username,
+               u2.username as confirmed_by_username
+        FROM factory_telemetry.downtime_events de
+        JOIN factory_telemetry.production_lines pl ON de.line_id = pl.id
+        LEFT JOIN factory_telemetry.users u1 ON de.reported_by = u1.id
+        LEFT JOIN factory_telemetry.users u2 ON de.confirmed_by = u2.id
+        WHERE {where_clause}
+        ORDER BY de.start_time DESC
+        """
+        
+        return query, params
+    
     async def get_downtime_events(
         self,
         line_id: Optional[UUID] = None,
@@ -572,85 +1115,49 @@ class DowntimeTracker:
     ) -> List[DowntimeEventResponse]:
         """Get downtime events with filtering."""
         try:
-            where_conditions = []
-            params = {"limit": limit, "offset": offset}
-            
-            if line_id:
-                where_conditions.append("de.line_id = :line_id")
-                params["line_id"] = line_id
-            
-            if equipment_code:
-                where_conditions.append("de.equipment_code = :equipment_code")
-                params["equipment_code"] = equipment_code
-            
-            if start_date:
-                where_conditions.append("DATE(de.start_time) >= :start_date")
-                params["start_date"] = start_date
-            
-            if end_date:
-                where_conditions.append("DATE(de.start_time) <= :end_date")
-                params["end_date"] = end_date
-            
-            if category:
-                where_conditions.append("de.category = :category")
-                params["category"] = category
-            
-            if status:
-                where_conditions.append("de.status = :status")
-                params["status"] = status
-            
-            where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
+            query, params = self._build_downtime_events_query(
+                line_id, equipment_code, start_date, end_date, category, status
+            )
+            params.update({"limit": limit, "offset": offset})
             
-            query = f"""
-            SELECT de.id, de.line_id, de.equipment_code, de.start_time, de.end_time,
-                   de.duration_seconds, de.reason_code, de.reason_description,
-                   de.category, de.subcategory, de.reported_by, de.confirmed_by,
-                   de.confirmed_at, de.notes, de.fault_data, de.context_data,
-                   pl.line_code, pl.name as line_name,
-                   u1.username as reported_by_username,
-                   u2.username as confirmed_by_username
-            FROM factory_telemetry.downtime_events de
-            JOIN factory_telemetry.production_lines pl ON de.line_id = pl.id
-            LEFT JOIN factory_telemetry.users u1 ON de.reported_by = u1.id
-            LEFT JOIN factory_telemetry.users u2 ON de.confirmed_by = u2.id
-            WHERE {where_clause}
-            ORDER BY de.start_time DESC
-            LIMIT :limit OFFSET :offset
-            """
+            result = await execute_query(query + "LIMIT :limit OFFSET :offset", params)
             
-            result = await execute_query(query, params)
-            
-            events = []
-            for row in result:
-                events.append(DowntimeEventResponse(
-                    id=row["id"],
-                    line_id=row["line_id"],
-                    equipment_code=row["equipment_code"],
-                    start_time=row["start_time"],
-                    end_time=row["end_time"],
-                    duration_seconds=row["duration_seconds"],
-                    reason_code=row["reason_code"],
-                    reason_description=row["reason_description"],
-                    category=row["category"],
-                    subcategory=row["subcategory"],
-                    reported_by=row["reported_by"],
-                    confirmed_by=row["confirmed_by"],
-                    confirmed_at=row["confirmed_at"],
-                    notes=row["notes"],
-                    fault_data=row["fault_data"],
-                    context_data=row["context_data"],
-                    line_code=row["line_code"],
-                    line_name=row["line_name"],
-                    reported_by_username=row["reported_by_username"],
-                    confirmed_by_username=row["confirmed_by_username"]
-                ))
-            
-            return events
+            # Rows come straight from the database, so skip field validation
+            return [DowntimeEventResponse.model_construct(**row._mapping) for row in result]
             
         except Exception as e:
             logger.error("Failed to get downtime events", error=str(e))
             raise BusinessLogicError("Failed to get downtime events")
     
+    async def stream_downtime_events(
+        self,
+        line_id: Optional[UUID] = None,
+        equipment_code: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[DowntimeEventResponse]:
+        """Stream all matching downtime events through a server-side cursor (for exports)."""
+        query, params = self._build_downtime_events_query(
+            line_id, equipment_code, start_date, end_date, category, status
+        )
+        
+        try:
+            async for row in execute_query_stream(query, params, batch_size=batch_size):
+                yield DowntimeEventResponse.model_construct(**row._mapping)
+        except Exception as e:
+            logger.error("Failed to stream downtime events", error=str(e))
+            raise BusinessLogicError("Failed to stream downtime events")
+    
+    def get_long_running_events(self, min_duration_seconds: int = 600) -> List[Dict[str, Any]]:
+        """Get active downtime events that have been open longer than the given duration."""
+        return [
+            self.active_events[equipment_code]
+            for equipment_code in self.active_events.open_longer_than(min_duration_seconds)
+        ]
+    
     async def get_downtime_statistics(
         self,
         line_id: Optional[UUID] = None,
@@ -663,66 +1170,81 @@ class DowntimeTracker:
             params = {}
             
             if line_id:
-                where_conditions.append("de.line_id = :line_id")
+                where_conditions.append("h.line_id = :line_id")
                 params["line_id"] = line_id
             
+            # Day boundaries fall on hour boundaries, so the date range maps onto whole buckets
             if start_date:
-                where_conditions.append("DATE(de.start_time) >= :start_date")
-                params["start_date"] = start_date
+                where_conditions.append("h.hour_bucket >= :start_ts")
+                params["start_ts"] = datetime.combine(start_date, datetime.min.time())
             
             if end_date:
-                where_conditions.append("DATE(de.start_time) <= :end_date")
-                params["end_date"] = end_date
+                where_conditions.append("h.hour_bucket < :end_ts")
+                params["end_ts"] = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
             
             where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
             
-            # Get overall statistics
+            # Overall statistics, top reasons and daily breakdown in one round trip over the
+            # trigger-maintained hourly rollup (see migration 017) rather than raw events;
+            # the two breakdowns come back as jsonb arrays alongside the totals
             stats_query = f"""
-            SELECT 
-                COUNT(*) as total_events,
-                COALESCE(SUM(duration_seconds), 0) as total_downtime_seconds,
-                COALESCE(AVG(duration_seconds), 0) as avg_duration_seconds,
-                COUNT(CASE WHEN category = 'unplanned' THEN 1 END) as unplanned_events,
-                COUNT(CASE WHEN category = 'planned' THEN 1 END) as planned_events,
-                COUNT(CASE WHEN category = 'maintenance' THEN 1 END) as maintenance_events,
-                COUNT(CASE WHEN category = 'changeover' THEN 1 END) as changeover_events
-            FROM factory_telemetry.downtime_events de
-            WHERE {where_clause}
+            WITH base AS (
+                SELECT h.reason_code, h.reason_description, h.category,
+                       h.event_count, h.duration_count, h.total_duration_seconds,
+                       DATE(h.hour_bucket) as event_date
+                FROM factory_telemetry.downtime_events_hourly h
+                WHERE {where_clause}
+            ),
+            stats AS (
+                SELECT 
+                    COALESCE(SUM(event_count), 0) as total_events,
+                    COALESCE(SUM(total_duration_seconds), 0)::bigint as total_downtime_seconds,
+                    COALESCE(SUM(total_duration_seconds)::numeric / NULLIF(SUM(duration_count), 0), 0) as avg_duration_seconds,
+                    COALESCE(SUM(event_count) FILTER (WHERE category = 'unplanned'), 0) as unplanned_events,
+                    COALESCE(SUM(event_count) FILTER (WHERE category = 'planned'), 0) as planned_events,
+                    COALESCE(SUM(event_count) FILTER (WHERE category = 'maintenance'), 0) as maintenance_events,
+                    COALESCE(SUM(event_count) FILTER (WHERE category = 'changeover'), 0) as changeover_events
+                FROM base
+            ),
+            reasons AS (
+                SELECT COALESCE(jsonb_agg(r ORDER BY r.event_count DESC, r.total_duration_seconds DESC), '[]'::jsonb) as top_reasons
+                FROM (
+                    SELECT 
+                        reason_code,
+                        MAX(reason_description) as reason_description,
+                        SUM(event_count) as event_count,
+                        SUM(total_duration_seconds)::bigint as total_duration_seconds,
+                        ROUND(SUM(total_duration_seconds) / 60.0, 2) as total_duration_minutes
+                    FROM base
+                    GROUP BY reason_code
+                    HAVING SUM(event_count) > 0
+                    ORDER BY event_count DESC, total_duration_seconds DESC
+                    LIMIT 10
+                ) r
+            ),
+            daily AS (
+                SELECT COALESCE(jsonb_agg(d ORDER BY d."date" DESC), '[]'::jsonb) as daily_breakdown
+                FROM (
+                    SELECT 
+                        event_date as "date",
+                        SUM(event_count) as event_count,
+                        SUM(total_duration_seconds)::bigint as total_duration_seconds,
+                        ROUND(SUM(total_duration_seconds) / 60.0, 2) as total_duration_minutes
+                    FROM base
+                    GROUP BY event_date
+                    HAVING SUM(event_count) > 0
+                    ORDER BY event_date DESC
+                    LIMIT 30
+                ) d
+            )
+            SELECT stats.*, reasons.top_reasons, daily.daily_breakdown
+            FROM stats, reasons, daily
             """
             
             stats_result = await execute_query(stats_query, params)
             stats = stats_result[0] if stats_result else {}
-            
-            # Get top reasons
-            reasons_query = f"""
-            SELECT 
-                reason_code,
-                reason_description,
-                COUNT(*) as event_count,
-                COALESCE(SUM(duration_seconds), 0) as total_duration_seconds
-            FROM factory_telemetry.downtime_events de
-            WHERE {where_clause}
-            GROUP BY reason_code, reason_description
-            ORDER BY event_count DESC, total_duration_seconds DESC
-            LIMIT 10
-            """
-            
-            reasons_result = await execute_query(reasons_query, params)
-            
-            # Get daily breakdown
-            daily_query = f"""
-            SELECT 
-                DATE(de.start_time) as event_date,
-                COUNT(*) as event_count,
-                COALESCE(SUM(duration_seconds), 0) as total_duration_seconds
-            FROM factory_telemetry.downtime_events de
-            WHERE {where_clause}
-            GROUP BY DATE(de.start_time)
-            ORDER BY event_date DESC
-            LIMIT 30
-            """
-            
-            daily_result = await execute_query(daily_query, params)
+            reasons_result = self._decode_jsonb(stats.get("top_reasons"))
+            daily_result = self._decode_jsonb(stats.get("daily_breakdown"))
             
             return {
                 "total_events": stats.get("total_events", 0),
@@ -735,31 +1257,23 @@ class DowntimeTracker:
                 "planned_events": stats.get("planned_events", 0),
                 "maintenance_events": stats.get("maintenance_events", 0),
                 "changeover_events": stats.get("changeover_events", 0),
-                "top_reasons": [
-                    {
-                        "reason_code": row["reason_code"],
-                        "reason_description": row["reason_description"],
-                        "event_count": row["event_count"],
-                        "total_duration_seconds": row["total_duration_seconds"],
-                        "total_duration_minutes": round(row["total_duration_seconds"] / 60, 2)
-                    }
-                    for row in reasons_result
-                ],
-                "daily_breakdown": [
-                    {
-                        "date": row["event_date"],
-                        "event_count": row["event_count"],
-                        "total_duration_seconds": row["total_duration_seconds"],
-                        "total_duration_minutes": round(row["total_duration_seconds"] / 60, 2)
-                    }
-                    for row in daily_result
-                ]
+                "top_reasons": reasons_result,
+                "daily_breakdown": daily_result
             }
             
         except Exception as e:
             logger.error("Failed to get downtime statistics", error=str(e))
             raise BusinessLogicError("Failed to get downtime statistics")
     
+    @staticmethod
+    def _decode_jsonb(value: Any) -> List[Dict[str, Any]]:
+        """Decode a jsonb aggregate that the driver may return as text."""
+        if value is None:
+            return []
+        if isinstance(value, (str, bytes)):
+            return json.loads(value)
+        return value
+    
     async def confirm_downtime_event(
         self,
         event_id: UUID,
@@ -774,7 +1288,10 @@ class DowntimeTracker:
             SET confirmed_by = :confirmed_by, confirmed_at = NOW(), 
                 notes = COALESCE(:notes, notes)
             WHERE id = :event_id
-            RETURNING id
+            RETURNING id, line_id, equipment_code, start_time, end_time,
+                      duration_seconds, reason_code, reason_description,
+                      category, subcategory, reported_by, confirmed_by,
+                      confirmed_at, notes, created_at
             """
             
             result = await execute_query(update_query, {
@@ -786,39 +1303,33 @@ class DowntimeTracker:
             if not result:
                 raise NotFoundError("Downtime event", str(event_id))
             
-            # Get updated event
-            events = await self.get_downtime_events(limit=1)
-            if not events:
-                raise NotFoundError("Downtime event", str(event_id))
+            confirmed_event = DowntimeEventResponse.model_construct(**result[0]._mapping)
+            
+            # One payload serves both the log entry and the broadcast
+            event_payload = {
+                "id": str(confirmed_event.id),
+                "line_id": str(confirmed_event.line_id),
+                "equipment_code": confirmed_event.equipment_code,
+                "start_time": _iso(confirmed_event.start_time),
+                "end_time": _iso(confirmed_event.end_time),
+                "duration_seconds": confirmed_event.duration_seconds,
+                "reason_code": confirmed_event.reason_code,
+                "reason_description": confirmed_event.reason_description,
+                "category": confirmed_event.category,
+                "subcategory": confirmed_event.subcategory,
+                "status": "confirmed",
+                "confirmed_by": str(confirmed_event.confirmed_by),
+                "confirmed_at": _iso(confirmed_event.confirmed_at)
+            }
             
-            logger.info(
-                "Downtime event confirmed",
-                event_id=event_id,
-                confirmed_by=confirmed_by
-            )
+            logger.info("Downtime event confirmed", **event_payload)
             
-            # Broadcast real-time update
-            try:
-                confirmed_event = events[0]
-                await broadcast_downtime_event({
-                    "id": str(confirmed_event.id),
-                    "line_id": str(confirmed_event.line_id),
-                    "equipment_code": confirmed_event.equipment_code,
-                    "start_time": confirmed_event.start_time.isoformat(),
-                    "end_time": confirmed_event.end_time.isoformat() if confirmed_event.end_time else None,
-                    "duration_seconds": confirmed_event.duration_seconds,
-                    "reason_code": confirmed_event.reason_code,
-                    "reason_description": confirmed_event.reason_description,
-                    "category": confirmed_event.category,
-                    "subcategory": confirmed_event.subcategory,
-                    "status": "confirmed",
-                    "confirmed_by": str(confirmed_event.confirmed_by),
-                    "confirmed_at": confirmed_event.confirmed_at.isoformat() if confirmed_event.confirmed_at else None
-                })
-            except Exception as e:
-                logger.warning("Failed to broadcast downtime event confirmation", error=str(e))
+            # Broadcast real-time update off the response path
+            task = asyncio.create_task(self._broadcast_confirmation(event_payload))
+            _BACKGROUND_TASKS.add(task)
+            task.add_done_callback(_BACKGROUND_TASKS.discard)
             
-            return events[0]
+            return confirmed_event
             
         except (NotFoundError, BusinessLogicError):
             raise
@@ -826,44 +1337,37 @@ class DowntimeTracker:
             logger.error("Failed to confirm downtime event", error=str(e))
             raise BusinessLogicError("Failed to confirm downtime event")
     
+    async def _broadcast_confirmation(self, payload: Dict[str, Any]) -> None:
+        """Broadcast a downtime event confirmation, logging rather than raising on failure."""
+        try:
+            await broadcast_downtime_event(payload)
+        except Exception as e:
+            logger.warning("Failed to broadcast downtime event confirmation", error=str(e))
+    
     def _load_fault_catalog(self) -> Dict[int, Dict[str, Any]]:
         """Load fault catalog from database or configuration."""
         # This would typically load from a database table or configuration file
-        # For now, return a basic fault catalog
-        return {
-            0: {"name": "Emergency Stop", "description": "Emergency stop activated", "marker": "INTERNAL", "severity": "critical"},
-            1: {"name": "Safety Gate Open", "description": "Safety gate is open", "marker": "INTERNAL", "severity": "high"},
-            2: {"name": "Motor Overload", "description": "Motor overload protection triggered", "marker": "INTERNAL", "severity": "high"},
-            3: {"name": "Temperature High", "description": "Equipment temperature too high", "marker": "INTERNAL", "severity": "medium"},
-            4: {"name": "Pressure Low", "description": "System pressure below threshold", "marker": "INTERNAL", "severity": "medium"},
-            5: {"name": "Upstream Stop", "description": "Upstream equipment stopped", "marker": "UPSTREAM", "severity": "medium"},
-            6: {"name": "Downstream Stop", "description": "Downstream equipment stopped", "marker": "DOWNSTREAM", "severity": "medium"},
-            7: {"name": "Material Jam", "description": "Material jam detected", "marker": "INTERNAL", "severity": "medium"},
-            8: {"name": "Sensor Fault", "description": "Sensor malfunction", "marker": "INTERNAL", "severity": "low"},
-            9: {"name": "Communication Error", "description": "Communication with PLC lost", "marker": "INTERNAL", "severity": "high"}
-        }
+        # For now, return the built-in fault catalog
+        return _FAULT_CATALOG
+    
+    def _build_catalog_markers(self, fault_catalog: Dict[int, Dict[str, Any]]) -> np.ndarray:
+        """Pack fault catalog markers into an array indexed by fault bit."""
+        markers = np.full(max(fault_catalog, default=-1) + 1, MARKER_NONE, dtype=np.int8)
+        for bit_index, fault_info in fault_catalog.items():
+            if fault_info:
+                markers[bit_index] = _MARKER_IDS.get(fault_info.get("marker", "INTERNAL"), MARKER_OTHER)
+        return markers
     
     def _load_reason_codes(self) -> Dict[str, Dict[str, Any]]:
         """Load reason codes and their descriptions."""
         return {
-            code.value: {
-                "description": code.value.replace("_", " ").title(),
-                "category": self._get_reason_category(code.value)
+            code: {
+                "description": code.replace("_", " ").title(),
+                "category": category
             }
-            for code in DowntimeReasonCode
+            for code, category in _REASON_CATEGORY.items()
         }
     
     def _get_reason_category(self, reason_code: str) -> str:
         """Get category for reason code."""
-        if reason_code.startswith("MECH_") or reason_code.startswith("ELEC_"):
-            return "unplanned"
-        elif reason_code.startswith("MAT_"):
-            return "unplanned"
-        elif reason_code in ["MAINTENANCE", "CHANGEOVER", "CLEANING", "INSPECTION", "BREAK_TIME"]:
-            return "planned"
-        elif reason_code in ["UPSTREAM_STOP", "DOWNSTREAM_STOP", "CONVEYOR_STOP"]:
-            return "unplanned"
-        elif reason_code.startswith("QUALITY_"):
-            return "unplanned"
-        else:
-            return "unplanned"
+        return _REASON_CATEGORY.get(reason_code, "unplanned")
@@ -6,26 +6,272 @@ management services, providing enhanced OEE calculations, downtime tracking,
 and production context management.
 """
 
+import asyncio
+import importlib.util
+import os
+import sys
 from datetime import datetime, timedelta
+from types import MappingProxyType, ModuleType
 from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
 import structlog
+from cachetools import TTLCache
+from sqlalchemy import text
 
 from app.services.production_service import ProductionLineService, ProductionScheduleService
 from app.services.oee_calculator import OEECalculator
 from app.services.downtime_tracker import DowntimeTracker
 from app.services.andon_service import AndonService
 from app.services.notification_service import NotificationService
-from app.database import execute_query, execute_scalar
+from app.database import (
+    execute_query, execute_scalar, execute_single_row, execute_update, listen_for_notifications
+)
+from app.models.production import AndonEventType, AndonPriority
+
+logger = structlog.get_logger()
+
+# Directory holding the original tag scanner modules
+TAG_SCANNER_DIR = os.path.join(os.path.dirname(__file__), '../../../Tag_Scanner_for Reference Only')
+
+
+def _load_tag_scanner_module(name: str) -> ModuleType:
+    """Load a tag scanner module from its file without adding the directory to sys.path."""
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(TAG_SCANNER_DIR, f"{name}.py"))
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Tag scanner module '{name}' not found in {TAG_SCANNER_DIR}")
+        module = importlib.util.module_from_spec(spec)
+        # Registered under its own name so tag scanner imports of it resolve to this module
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            del sys.modules[name]
+            raise
+    return module
+
 
 # Import the original transformer from the tag scanner
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../../Tag_Scanner_for Reference Only'))
+MetricTransformer = _load_tag_scanner_module("transforms").MetricTransformer
 
-from transforms import MetricTransformer
+# Upper bound on cached production contexts (one per equipment)
+CONTEXT_CACHE_MAX_SIZE = 4096
 
-logger = structlog.get_logger()
+# Postgres NOTIFY channel carrying the equipment code of a changed production context,
+# so every worker drops its cached copy instead of serving it until the TTL expires
+CONTEXT_CHANGED_CHANNEL = "context_changed"
+CONTEXT_LISTEN_RETRY_INTERVAL = 5.0  # seconds
+
+# Downtime reason code -> (Andon event type, priority); upstream/downstream stops are
+# raised as plain stops since AndonEventType has no separate values for them
+_ANDON_REASON_MAP = MappingProxyType({
+    "MECH_FAULT": ("maintenance", "high"),
+    "ELEC_FAULT": ("maintenance", "high"),
+    "BEARING_FAIL": ("maintenance", "high"),
+    "BELT_BREAK": ("maintenance", "medium"),
+    "MOTOR_FAIL": ("maintenance", "high"),
+    "SENSOR_FAIL": ("maintenance", "medium"),
+    "PLC_FAULT": ("maintenance", "critical"),
+    "POWER_LOSS": ("maintenance", "critical"),
+    "MAT_SHORTAGE": ("material", "medium"),
+    "MAT_JAM": ("material", "medium"),
+    "UPSTREAM_STOP": ("stop", "low"),
+    "DOWNSTREAM_STOP": ("stop", "low"),
+    "QUALITY_ISSUE": ("quality", "medium"),
+    "UNKNOWN": ("maintenance", "medium")
+})
+
+# Production context lookups are coalesced into one ANY(:codes) query per batch
+CONTEXT_BATCH_MAX_SIZE = 64
+CONTEXT_BATCH_WAIT_TIME = 0.002  # seconds
+
+_CONTEXT_COLUMNS = """
+    c.equipment_code,
+    c.current_job_id,
+    c.production_schedule_id,
+    c.production_line_id,
+    c.target_speed,
+    c.current_product_type_id,
+    c.shift_id,
+    c.target_quantity,
+    c.actual_quantity,
+    c.production_efficiency,
+    c.quality_rate,
+    c.changeover_status,
+    c.current_operator,
+    c.current_shift
+"""
+
+# Built as text() clauses once, so the hot lookups skip bind parameter parsing per call;
+# asyncpg's per-connection statement cache then reuses the prepared statements
+_CONTEXT_BATCH_SQL = text(f"""
+SELECT {_CONTEXT_COLUMNS}
+FROM factory_telemetry.context c
+WHERE c.equipment_code = ANY(:equipment_codes)
+""")
+
+# Single-equipment batches (the usual case once misses are de-duplicated) fetch one row
+_CONTEXT_SINGLE_SQL = text(f"""
+SELECT {_CONTEXT_COLUMNS}
+FROM factory_telemetry.context c
+WHERE c.equipment_code = :equipment_code
+""")
+
+# Context columns update_production_context may write; the names are interpolated into
+# the UPDATE, so only these are accepted
+_CONTEXT_UPDATABLE_COLUMNS = frozenset({
+    "current_job_id", "production_schedule_id", "production_line_id", "target_speed",
+    "current_product_type_id", "shift_id", "target_quantity", "actual_quantity",
+    "production_efficiency", "quality_rate", "changeover_status", "current_operator",
+    "current_shift"
+})
+
+
+# Auto-generated Andon events are buffered and created in bulk
+ANDON_BATCH_MAX_SIZE = 50
+ANDON_FLUSH_INTERVAL = 5.0  # seconds
+
+# Values the andon_events enum columns accept; anything else would fail the whole batch
+_ANDON_EVENT_TYPES = frozenset(event_type.value for event_type in AndonEventType)
+_ANDON_PRIORITIES = frozenset(priority.value for priority in AndonPriority)
+
+
+class AndonEmitter:
+    """Buffers auto-generated Andon events and creates them in batches."""
+    
+    def __init__(
+        self,
+        andon_service: AndonService,
+        max_batch: int = ANDON_BATCH_MAX_SIZE,
+        flush_interval: float = ANDON_FLUSH_INTERVAL
+    ):
+        self.andon_service = andon_service
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        # Pending events are (andon_data, flush_now) pairs drained by _flush_loop,
+        # which is started lazily because the emitter may be built outside a running loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    def emit(self, andon_data: Dict[str, Any], flush_now: bool = False) -> None:
+        """Queue an Andon event; flush_now sends the pending batch without waiting."""
+        if andon_data.get("event_type") not in _ANDON_EVENT_TYPES or andon_data.get("priority") not in _ANDON_PRIORITIES:
+            logger.warning(
+                "Skipping Andon event with invalid type or priority",
+                equipment_code=andon_data.get("equipment_code"),
+                event_type=andon_data.get("event_type"),
+                priority=andon_data.get("priority")
+            )
+            return
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        self._queue.put_nowait((andon_data, flush_now))
+    
+    async def _flush_loop(self) -> None:
+        """Flush queued events when the batch fills, the interval elapses or an urgent event arrives."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            andon_data, urgent = await self._queue.get()
+            batch = [andon_data]
+            deadline = loop.time() + self.flush_interval
+            
+            while len(batch) < self.max_batch and not urgent:
+                try:
+                    andon_data, urgent = self._queue.get_nowait()
+                    batch.append(andon_data)
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    andon_data, urgent = await asyncio.wait_for(self._queue.get(), remaining)
+                    batch.append(andon_data)
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self.andon_service.create_andon_events(batch)
+            except Exception as e:
+                logger.error("Failed to flush Andon events", error=str(e), batch_size=len(batch))
+
+
+class ContextBatcher:
+    """Coalesces concurrent production context lookups into batched queries."""
+    
+    def __init__(self, max_batch: int = CONTEXT_BATCH_MAX_SIZE, wait_time: float = CONTEXT_BATCH_WAIT_TIME):
+        self.max_batch = max_batch
+        self.wait_time = wait_time
+        # Pending lookups are (equipment_code, future) pairs drained by _flush_loop,
+        # which is started lazily because the batcher may be built outside a running loop
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+    
+    async def get(self, equipment_code: str) -> Dict[str, Any]:
+        """Get the production context for equipment, or an empty dict if none exists."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((equipment_code, future))
+        return await future
+    
+    async def _flush_loop(self) -> None:
+        """Drain queued lookups into batched context queries."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.wait_time
+            
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            await self._flush(batch)
+    
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Fetch contexts for a batch of equipment codes and resolve each waiter."""
+        try:
+            equipment_codes = list({equipment_code for equipment_code, _ in batch})
+            
+            # Rows are converted to dicts once here, at the cache boundary
+            contexts = {}
+            if len(equipment_codes) == 1:
+                row = await execute_single_row(_CONTEXT_SINGLE_SQL, {"equipment_code": equipment_codes[0]})
+                rows = [row] if row is not None else []
+            else:
+                rows = await execute_query(_CONTEXT_BATCH_SQL, {"equipment_codes": equipment_codes})
+            
+            for row in rows:
+                context = dict(row._mapping)
+                contexts[context.pop("equipment_code")] = context
+            
+            for equipment_code, future in batch:
+                if not future.done():
+                    future.set_result(contexts.get(equipment_code, {}))
+                    
+        except Exception as e:
+            logger.error("Failed to fetch production context batch", error=str(e), batch_size=len(batch))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
 
 
 class EnhancedMetricTransformer(MetricTransformer):
@@ -38,11 +284,16 @@ class EnhancedMetricTransformer(MetricTransformer):
         self.oee_calculator = OEECalculator()
         self.downtime_tracker = DowntimeTracker()
         self.andon_service = AndonService()
+        self._andon_emitter = AndonEmitter(self.andon_service)
         self.notification_service = NotificationService() if NotificationService else None
         
-        # Production context cache
-        self.production_context_cache = {}
+        # Production context cache, bounded and expired per entry by TTLCache
         self.cache_ttl = 300  # 5 minutes
+        self.production_context_cache: TTLCache = TTLCache(maxsize=CONTEXT_CACHE_MAX_SIZE, ttl=self.cache_ttl)
+        self._context_batcher = ContextBatcher()
+        self._inflight_contexts: Dict[str, asyncio.Future] = {}
+        # Started lazily because the transformer may be built outside a running loop
+        self._invalidation_task: Optional[asyncio.Task] = None
     
     async def transform_bagger_metrics(
         self,
@@ -53,16 +304,25 @@ class EnhancedMetricTransformer(MetricTransformer):
         # Call parent transformation
         metrics = super().transform_bagger_metrics(raw_data, context_data)
         
+        # Production context is fetched once and shared by the helpers below
+        equipment_code = context_data.get("equipment_code", "")
+        production_context = await self._get_production_context(equipment_code)
+        
         # Add production-specific metrics
-        production_metrics = await self._add_production_metrics(raw_data, context_data)
+        production_metrics = self._add_production_metrics(raw_data, context_data, production_context)
         metrics.update(production_metrics)
         
+        # OEE and downtime tracking both need a production line and share one timestamp
+        if not production_context.get("production_line_id"):
+            return metrics
+        now = datetime.utcnow()
+        
         # Add enhanced OEE calculations
-        oee_metrics = await self._calculate_enhanced_oee(metrics, context_data)
+        oee_metrics = await self._calculate_enhanced_oee(metrics, context_data, production_context, now=now)
         metrics.update(oee_metrics)
         
         # Add downtime tracking
-        downtime_metrics = await self._track_downtime_events(metrics, context_data)
+        downtime_metrics = await self._track_downtime_events(metrics, context_data, production_context, now=now)
         metrics.update(downtime_metrics)
         
         return metrics
@@ -77,28 +337,38 @@ class EnhancedMetricTransformer(MetricTransformer):
         # Call parent transformation
         metrics = super().transform_basket_loader_metrics(raw_data, context_data, parent_product)
         
+        # Production context is fetched once and shared by the helpers below
+        equipment_code = context_data.get("equipment_code", "")
+        production_context = await self._get_production_context(equipment_code)
+        
         # Add production-specific metrics
-        production_metrics = await self._add_production_metrics(raw_data, context_data)
+        production_metrics = self._add_production_metrics(raw_data, context_data, production_context)
         metrics.update(production_metrics)
         
+        # OEE and downtime tracking both need a production line and share one timestamp
+        if not production_context.get("production_line_id"):
+            return metrics
+        now = datetime.utcnow()
+        
         # Add enhanced OEE calculations (if applicable)
-        oee_metrics = await self._calculate_enhanced_oee(metrics, context_data)
+        oee_metrics = await self._calculate_enhanced_oee(metrics, context_data, production_context, now=now)
         metrics.update(oee_metrics)
         
         # Add downtime tracking
-        downtime_metrics = await self._track_downtime_events(metrics, context_data)
+        downtime_metrics = await self._track_downtime_events(metrics, context_data, production_context, now=now)
         metrics.update(downtime_metrics)
         
         return metrics
     
-    async def _add_production_metrics(self, raw_data: Dict, context_data: Dict) -> Dict[str, Any]:
+    def _add_production_metrics(
+        self,
+        raw_data: Dict,
+        context_data: Dict,
+        production_context: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """Add production management specific metrics."""
         processed = raw_data.get("processed", {})
         
-        # Get production context
-        equipment_code = context_data.get("equipment_code", "")
-        production_context = await self._get_production_context(equipment_code)
-        
         return {
             "production_line_id": production_context.get("production_line_id"),
             "current_job_id": production_context.get("current_job_id"),
@@ -113,13 +383,18 @@ class EnhancedMetricTransformer(MetricTransformer):
             "target_speed": production_context.get("target_speed", 0.0)
         }
     
-    async def _calculate_enhanced_oee(self, metrics: Dict, context_data: Dict) -> Dict[str, Any]:
+    async def _calculate_enhanced_oee(
+        self,
+        metrics: Dict,
+        context_data: Dict,
+        production_context: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """Calculate enhanced OEE with production context."""
         if not self.oee_calculator:
             return {}
         
         equipment_code = context_data.get("equipment_code", "")
-        production_context = await self._get_production_context(equipment_code)
         line_id = production_context.get("production_line_id")
         
         if not line_id:
@@ -131,7 +406,7 @@ class EnhancedMetricTransformer(MetricTransformer):
                 line_id=line_id,
                 equipment_code=equipment_code,
                 current_status=metrics,
-                timestamp=datetime.utcnow()
+                timestamp=now or datetime.utcnow()
             )
             
             return {
@@ -146,13 +421,18 @@ class EnhancedMetricTransformer(MetricTransformer):
             logger.error("Failed to calculate enhanced OEE", error=str(e), equipment_code=equipment_code)
             return {}
     
-    async def _track_downtime_events(self, metrics: Dict, context_data: Dict) -> Dict[str, Any]:
+    async def _track_downtime_events(
+        self,
+        metrics: Dict,
+        context_data: Dict,
+        production_context: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """Track downtime events with production context."""
         if not self.downtime_tracker:
             return {}
         
         equipment_code = context_data.get("equipment_code", "")
-        production_context = await self._get_production_context(equipment_code)
         line_id = production_context.get("production_line_id")
         
         if not line_id:
@@ -160,11 +440,13 @@ class EnhancedMetricTransformer(MetricTransformer):
         
         try:
             # Detect downtime event
-            downtime_event = self.downtime_tracker.detect_downtime_event(
+            downtime_event = await self.downtime_tracker.detect_downtime_event(
                 line_id=line_id,
                 equipment_code=equipment_code,
                 current_status=metrics,
-                timestamp=datetime.utcnow()
+                timestamp=now or datetime.utcnow(),
+                # downtime_event_id is part of the enriched metrics, so wait for the insert
+                wait_for_persist=True
             )
             
             if downtime_event:
@@ -185,73 +467,77 @@ class EnhancedMetricTransformer(MetricTransformer):
     
     async def _get_production_context(self, equipment_code: str) -> Dict[str, Any]:
         """Get production context for equipment with caching."""
+        if self._invalidation_task is None or self._invalidation_task.done():
+            self._invalidation_task = asyncio.create_task(self._listen_for_context_changes())
+        
         # Check cache first
-        cache_key = f"{equipment_code}_{datetime.now().strftime('%Y%m%d%H%M')}"
-        if cache_key in self.production_context_cache:
-            return self.production_context_cache[cache_key]
+        context = self.production_context_cache.get(equipment_code)
+        if context is not None:
+            return context
+        
+        # Concurrent misses for the same equipment wait on a single in-flight fetch
+        fetch = self._inflight_contexts.get(equipment_code)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_production_context(equipment_code))
+            self._inflight_contexts[equipment_code] = fetch
+            fetch.add_done_callback(lambda _: self._inflight_contexts.pop(equipment_code, None))
         
         try:
-            # Get production context from database
-            context_query = """
-            SELECT 
-                c.current_job_id,
-                c.production_schedule_id,
-                c.production_line_id,
-                c.target_speed,
-                c.current_product_type_id,
-                c.shift_id,
-                c.target_quantity,
-                c.actual_quantity,
-                c.production_efficiency,
-                c.quality_rate,
-                c.changeover_status,
-                c.current_operator,
-                c.current_shift
-            FROM factory_telemetry.context c
-            WHERE c.equipment_code = :equipment_code
-            """
-            
-            result = await execute_query(context_query, {"equipment_code": equipment_code})
-            
-            if result:
-                context = result[0]
-                # Cache the result
-                self.production_context_cache[cache_key] = context
-                return context
-            
-            return {}
+            # Shielded so one cancelled caller does not cancel the fetch for the others
+            return await asyncio.shield(fetch)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error("Failed to get production context", error=str(e), equipment_code=equipment_code)
             return {}
     
+    async def _fetch_production_context(self, equipment_code: str) -> Dict[str, Any]:
+        """Fetch production context from the database and cache it."""
+        # Concurrent misses across equipment share one batched query
+        context = await self._context_batcher.get(equipment_code)
+        
+        if context:
+            # Cache the result
+            self.production_context_cache[equipment_code] = context
+        
+        return context
+    
+    async def _listen_for_context_changes(self) -> None:
+        """Drop cached production contexts as other workers report changes."""
+        while True:
+            try:
+                await listen_for_notifications(CONTEXT_CHANGED_CHANNEL, self._invalidate_production_context)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Production context invalidation listener failed", error=str(e))
+                await asyncio.sleep(CONTEXT_LISTEN_RETRY_INTERVAL)
+    
+    def _invalidate_production_context(self, equipment_code: str) -> None:
+        """Drop the cached production context for equipment."""
+        self.production_context_cache.pop(equipment_code, None)
+    
     def _calculate_production_efficiency(self, processed: Dict, context_data: Dict) -> float:
         """Calculate production efficiency percentage."""
-        try:
-            target_speed = context_data.get("target_speed", 0.0)
-            actual_speed = processed.get("speed_real", 0.0)
-            
-            if target_speed <= 0:
-                return 0.0
-            
-            efficiency = min(100.0, (actual_speed / target_speed) * 100.0)
-            return round(efficiency, 2)
-        except Exception:
+        # `or 0.0` absorbs None values from the PLC/context payloads
+        target_speed = context_data.get("target_speed") or 0.0
+        if target_speed <= 0.0:
             return 0.0
+        
+        efficiency = (processed.get("speed_real") or 0.0) * 100.0 / target_speed
+        return round(efficiency if efficiency < 100.0 else 100.0, 2)
     
     def _calculate_quality_rate(self, processed: Dict, context_data: Dict) -> float:
         """Calculate quality rate percentage."""
-        try:
-            # This would typically be calculated from quality data
-            # For now, return a default value or calculate from available data
-            total_parts = processed.get("product_count", 0)
-            if total_parts <= 0:
-                return 100.0  # Default to 100% if no parts produced
-            
-            # In a real implementation, this would use quality data
-            # For now, assume 95% quality rate
-            return 95.0
-        except Exception:
-            return 95.0
+        # This would typically be calculated from quality data
+        # For now, return a default value or calculate from available data
+        total_parts = processed.get("product_count") or 0
+        if total_parts <= 0:
+            return 100.0  # Default to 100% if no parts produced
+        
+        # In a real implementation, this would use quality data
+        # For now, assume 95% quality rate
+        return 95.0
     
     def _detect_changeover_status(self, processed: Dict, context_data: Dict) -> str:
         """Detect changeover status from equipment data."""
@@ -278,20 +564,15 @@ class EnhancedMetricTransformer(MetricTransformer):
     
     def _trigger_andon_if_needed(self, downtime_event: Dict, equipment_code: str, line_id: UUID):
         """Trigger Andon event if downtime event meets criteria."""
+        # Only create Andon events for unplanned downtime; most events stop here
+        if downtime_event.get("category") != "unplanned" or not self.andon_service:
+            return
+        
         try:
-            if not self.andon_service:
-                return
-            
-            # Determine if we should create an Andon event
-            category = downtime_event.get("category", "")
-            reason_code = downtime_event.get("reason_code", "")
-            
-            # Only create Andon events for unplanned downtime
-            if category != "unplanned":
-                return
-            
             # Determine event type and priority based on reason code
-            event_type, priority = self._classify_downtime_for_andon(reason_code, equipment_code)
+            event_type, priority = self._classify_downtime_for_andon(
+                downtime_event.get("reason_code", ""), equipment_code
+            )
             
             if event_type and priority:
                 # Create Andon event
@@ -304,7 +585,9 @@ class EnhancedMetricTransformer(MetricTransformer):
                     "auto_generated": True
                 }
                 
-                # This would be called asynchronously in a real implementation
+                # Critical events skip the batching delay
+                self._andon_emitter.emit(andon_data, flush_now=(priority == "critical"))
+                
                 logger.info(
                     "Andon event triggered for downtime",
                     equipment_code=equipment_code,
@@ -317,34 +600,41 @@ class EnhancedMetricTransformer(MetricTransformer):
     
     def _classify_downtime_for_andon(self, reason_code: str, equipment_code: str) -> Tuple[str, str]:
         """Classify downtime reason for Andon event creation."""
-        # Map reason codes to Andon event types and priorities
-        reason_mapping = {
-            "MECH_FAULT": ("maintenance", "high"),
-            "ELEC_FAULT": ("maintenance", "high"),
-            "BEARING_FAIL": ("maintenance", "high"),
-            "BELT_BREAK": ("maintenance", "medium"),
-            "MOTOR_FAIL": ("maintenance", "high"),
-            "SENSOR_FAIL": ("maintenance", "medium"),
-            "PLC_FAULT": ("maintenance", "critical"),
-            "POWER_LOSS": ("maintenance", "critical"),
-            "MAT_SHORTAGE": ("material", "medium"),
-            "MAT_JAM": ("material", "medium"),
-            "UPSTREAM_STOP": ("upstream", "low"),
-            "DOWNSTREAM_STOP": ("downstream", "low"),
-            "QUALITY_ISSUE": ("quality", "medium"),
-            "UNKNOWN": ("maintenance", "medium")
-        }
-        
-        return reason_mapping.get(reason_code, ("maintenance", "medium"))
+        return _ANDON_REASON_MAP.get(reason_code, ("maintenance", "medium"))
     
-    def update_production_context(self, equipment_code: str, context_updates: Dict[str, Any]):
-        """Update production context for equipment."""
+    async def update_production_context(self, equipment_code: str, context_updates: Dict[str, Any]):
+        """Update production context for equipment and have every worker drop its cached copy."""
         try:
-            # This would typically update the database context table
-            # For now, just update the cache
-            cache_key = f"{equipment_code}_{datetime.now().strftime('%Y%m%d%H%M')}"
-            if cache_key in self.production_context_cache:
-                self.production_context_cache[cache_key].update(context_updates)
+            columns = sorted(_CONTEXT_UPDATABLE_COLUMNS.intersection(context_updates))
+            ignored = context_updates.keys() - _CONTEXT_UPDATABLE_COLUMNS
+            if ignored:
+                logger.warning(
+                    "Ignoring unknown production context fields",
+                    equipment_code=equipment_code,
+                    fields=sorted(ignored)
+                )
+            if not columns:
+                return
+            
+            # The NOTIFY is sent from the UPDATE's own transaction, so listeners (this
+            # worker included) only drop their cached copy once the new row is committed
+            assignments = ", ".join(f"{column} = :{column}" for column in columns)
+            await execute_update(f"""
+            WITH updated AS (
+                UPDATE factory_telemetry.context
+                SET {assignments}
+                WHERE equipment_code = :equipment_code
+                RETURNING equipment_code
+            )
+            SELECT pg_notify(:channel, equipment_code) FROM updated
+            """, {
+                **{column: context_updates[column] for column in columns},
+                "equipment_code": equipment_code,
+                "channel": CONTEXT_CHANGED_CHANNEL
+            })
+            
+            # Don't wait for our own notification to drop the now stale entry
+            self.production_context_cache.pop(equipment_code, None)
             
             logger.info(
                 "Production context updated",
@@ -354,10 +644,10 @@ class EnhancedMetricTransformer(MetricTransformer):
         except Exception as e:
             logger.error("Failed to update production context", error=str(e), equipment_code=equipment_code)
     
-    def get_equipment_production_status(self, equipment_code: str) -> Dict[str, Any]:
+    async def get_equipment_production_status(self, equipment_code: str) -> Dict[str, Any]:
         """Get comprehensive production status for equipment."""
         try:
-            production_context = self._get_production_context(equipment_code)
+            production_context = await self._get_production_context(equipment_code)
             
             # Get current job details if available
             current_job_id = production_context.get("current_job_id")
@@ -370,7 +660,7 @@ class EnhancedMetricTransformer(MetricTransformer):
                 "equipment_code": equipment_code,
                 "production_context": production_context,
                 "current_job": job_details,
-                "cache_status": "active" if equipment_code in str(self.production_context_cache) else "inactive",
+                "cache_status": "active" if equipment_code in self.production_context_cache else "inactive",
                 "last_updated": datetime.utcnow().isoformat()
             }
         except Exception as e:
@@ -7,31 +7,169 @@ context management, real-time OEE calculations, and automated workflow triggers.
 """
 
 import asyncio
+import os
 import signal
 import sys
 import time
+from collections import deque
+from contextlib import ExitStack
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Any
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, NamedTuple, Optional, Tuple
 from uuid import UUID
+import numpy as np
 import structlog
+from cachetools import TTLCache
+from sqlalchemy import text
 
-from app.services.enhanced_metric_transformer import EnhancedMetricTransformer
+from app.services.enhanced_metric_transformer import (
+    TAG_SCANNER_DIR, AndonEmitter, ContextBatcher, EnhancedMetricTransformer
+)
 from app.services.production_service import ProductionLineService, ProductionScheduleService
 from app.services.oee_calculator import OEECalculator
 from app.services.downtime_tracker import DowntimeTracker
 from app.services.andon_service import AndonService
 from app.services.notification_service import NotificationService
-from app.database import execute_query, execute_scalar, execute_update
+from app.database import execute_scalar, execute_single_row, execute_update
 
-# Import the original poller from the tag scanner
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '../../../Tag_Scanner_for Reference Only'))
+# Import the original poller from the tag scanner. It imports its sibling modules by
+# name, so the directory goes on sys.path, but only once per process.
+_TAG_SCANNER_PATH = os.path.normpath(TAG_SCANNER_DIR)
+if _TAG_SCANNER_PATH not in sys.path:
+    sys.path.append(_TAG_SCANNER_PATH)
 
 from poller import TelemetryPoller
 
 logger = structlog.get_logger()
 
+# Fixed poll period; cycles are scheduled on this phase rather than relative to the last one
+POLL_INTERVAL = 1.0  # seconds
+
+# Equipment polled every cycle
+BAGGER_EQUIPMENT_CODE = "BP01.PACK.BAG1"
+BASKET_LOADER_EQUIPMENT_CODE = "BP01.PACK.BAG1.BL"
+
+# Cycle durations are measured in integer nanoseconds on the monotonic clock
+NS_PER_SECOND = 1_000_000_000
+POLL_INTERVAL_NS = int(POLL_INTERVAL * NS_PER_SECOND)
+CYCLE_TIME_WARNING_NS = int(0.8 * POLL_INTERVAL_NS)  # 80% of the 1Hz target
+
+# Metric keys written back to the production context row; metrics where all of them are None
+# skip the UPDATE
+_CONTEXT_UPDATE_KEYS = frozenset({
+    "production_line_id", "current_job_id", "production_schedule_id", "target_quantity",
+    "actual_quantity", "production_efficiency", "quality_rate", "changeover_status"
+})
+
+# One UPDATE per poll cycle covers every polled equipment's production context row;
+# built once so its bind parameters are not re-parsed every cycle
+_UPDATE_CONTEXTS_STMT = text("""
+UPDATE factory_telemetry.context AS c
+SET 
+    production_line_id = v.production_line_id,
+    current_job_id = v.current_job_id,
+    production_schedule_id = v.production_schedule_id,
+    target_quantity = v.target_quantity,
+    actual_quantity = v.actual_quantity,
+    production_efficiency = v.production_efficiency,
+    quality_rate = v.quality_rate,
+    changeover_status = v.changeover_status,
+    last_production_update = v.last_production_update
+FROM unnest(
+    CAST(:equipment_codes AS text[]), CAST(:production_line_ids AS uuid[]),
+    CAST(:current_job_ids AS uuid[]), CAST(:production_schedule_ids AS uuid[]),
+    CAST(:target_quantities AS numeric[]), CAST(:actual_quantities AS numeric[]),
+    CAST(:production_efficiencies AS double precision[]), CAST(:quality_rates AS double precision[]),
+    CAST(:changeover_statuses AS text[]), CAST(:last_production_updates AS timestamptz[])
+) AS v(
+    equipment_code, production_line_id, current_job_id, production_schedule_id,
+    target_quantity, actual_quantity, production_efficiency, quality_rate,
+    changeover_status, last_production_update
+)
+WHERE c.equipment_code = v.equipment_code
+""")
+
+# Metric bindings are configuration that rarely changes; reuse them for this long
+BINDING_CACHE_TTL = 30.0  # seconds
+
+# Quality rate (%) below which a quality_issue production event is raised
+QUALITY_THRESHOLD = 95.0
+
+# Changeover status values that raise a production event, mapped to the event type
+_CHANGEOVER_EVENT_TYPES = {
+    "in_progress": "changeover_started",
+    "completed": "changeover_completed"
+}
+
+# Number of fault bits in a PLC fault word
+FAULT_WORD_BITS = 64
+
+# Shared all-clear fault bits for readings without a fault word (immutable, so safe to share)
+_FAULT_BITS_DEFAULT: Tuple[bool, ...] = (False,) * FAULT_WORD_BITS
+
+
+def _pack_fault_word(fault_bits) -> int:
+    """Pack a sequence of fault booleans (bit 0 first) into a single integer word."""
+    packed = np.packbits(np.asarray(fault_bits[:FAULT_WORD_BITS], dtype=np.bool_), bitorder="little")
+    return int.from_bytes(packed.tobytes(), "little")
+
+
+# Hot-path log lines are queued for a background worker instead of rendered inline;
+# when the queue is full they are dropped and counted
+LOG_QUEUE_MAX_SIZE = 1024
+
+# Minimum interval between log lines for the same (equipment, fault bit)
+FAULT_LOG_INTERVAL = 1.0  # seconds
+
+# Maximum age of the poll loop's database session before it is closed and reopened
+DB_SESSION_MAX_AGE = 300.0  # seconds
+
+# Bound on queued production events; events are shed and counted beyond this
+PRODUCTION_EVENT_QUEUE_MAX_SIZE = 4096
+
+# Andon events raised by production event handlers are coalesced across handlers and
+# worker batches, and created together once this many queue up or the window closes
+ANDON_EMIT_MAX_BATCH = 256
+ANDON_EMIT_INTERVAL = 0.05  # seconds
+
+# Push notifications are sent in the background, at most this many at once
+NOTIFICATION_CONCURRENCY = 64
+
+# Production contexts cached by ProductionContextManager, and how long a missing one is remembered
+PRODUCTION_CONTEXT_CACHE_SIZE = 2048
+MISSING_CONTEXT_TTL = 5.0  # seconds
+
+# Window over which production context cache misses are collected into one lookup
+CONTEXT_LOOKUP_BATCH_WAIT = 0.005  # seconds
+
+# Window over which equipment context updates are merged before being written
+CONTEXT_UPDATE_FLUSH_INTERVAL = 0.1  # seconds
+
+# Maximum production events handled per worker wake-up
+PRODUCTION_EVENT_BATCH_SIZE = 128
+
+# How long background workers get to drain their queues on shutdown before being cancelled
+WORKER_DRAIN_TIMEOUT = 5.0  # seconds
+
+# Put on each worker queue at shutdown to wake a worker blocked on an empty queue
+_STOP_WORKER = object()
+
+
+class ProductionEvent(NamedTuple):
+    """Production event queued by the poll cycle for the production events worker."""
+    type: str
+    equipment_code: str
+    timestamp: datetime
+    metrics: Optional[Dict[str, Any]] = None
+    fault_bit: Optional[int] = None
+    job_id: Optional[Any] = None
+    target_quantity: Optional[int] = None
+    actual_quantity: Optional[int] = None
+    quality_rate: Optional[float] = None
+    threshold: Optional[float] = None
+    # Denormalized from the producer's context so handlers can skip a context read
+    line_id: Optional[Any] = None
+    current_operator: Optional[str] = None
+
 
 class EnhancedTelemetryPoller(TelemetryPoller):
     """Enhanced poller with production management integration."""
@@ -41,6 +179,7 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         super().__init__()
         self.production_service = None
         self.andon_service = None
+        self._andon_emitter: Optional[AndonEmitter] = None
         self.notification_service = None
         self.production_context_manager = None
         
@@ -49,12 +188,43 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         self.enhanced_downtime_tracker = None
         
         # Production event processing
-        self.production_events_queue = asyncio.Queue()
+        self.production_events_queue: asyncio.Queue = asyncio.Queue(maxsize=PRODUCTION_EVENT_QUEUE_MAX_SIZE)
+        self._dropped_production_events = 0
         self.andon_events_queue = asyncio.Queue()
+        # Set on shutdown; workers check it between items and exit on a _STOP_WORKER marker
+        self._shutdown = asyncio.Event()
+        # Deferred (level, event, fields) log entries written by the log worker
+        self._log_queue: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX_SIZE)
+        self._dropped_log_count = 0
+        # Loop time of the last log line per (equipment_code, fault bit)
+        self._fault_log_times: Dict[Tuple[str, int], float] = {}
+        # In-flight background push notifications, bounded by the semaphore
+        self._notification_semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+        self._notification_tasks: set = set()
         
         # Performance monitoring
-        self.poll_cycle_times = []
         self.max_cycle_time_history = 100
+        self.poll_cycle_times: deque = deque(maxlen=self.max_cycle_time_history)
+        self._poll_cycle_time_total = 0
+        # Sliding-window min/max over poll_cycle_times: monotonic deques of
+        # (sample number, duration) pairs, so stats never rescan the history
+        self._poll_cycle_count = 0
+        self._poll_cycle_min: deque = deque()
+        self._poll_cycle_max: deque = deque()
+        
+        # Metric bindings per equipment code as (loop time fetched, bindings)
+        self._binding_cache: Dict[str, Tuple[float, Dict]] = {}
+        
+        # (name, description) per (equipment_code, fault bit), for the fault catalog in
+        # _fault_lookup_catalog; a reloaded catalog is a new object and resets the cache
+        self._fault_lookup_cache: Dict[Tuple[str, int], Tuple[str, str]] = {}
+        self._fault_lookup_catalog = None
+        
+        # Last packed fault word per equipment; edge detection only runs when it changes
+        self._fault_words: Dict[str, int] = {}
+        
+        # Equipment whose last written context row had at least one value set
+        self._equipment_with_context: set = set()
     
     async def initialize(self) -> None:
         """Initialize with production services."""
@@ -64,9 +234,16 @@ class EnhancedTelemetryPoller(TelemetryPoller):
             # Initialize production services
             self.production_service = ProductionLineService()
             self.andon_service = AndonService()
+            self._andon_emitter = AndonEmitter(
+                self.andon_service,
+                max_batch=ANDON_EMIT_MAX_BATCH,
+                flush_interval=ANDON_EMIT_INTERVAL
+            )
             self.notification_service = NotificationService() if NotificationService else None
             
-            # Initialize enhanced transformer
+            # Initialize enhanced transformer. The tag scanner's initialize() builds a base
+            # MetricTransformer first and has no hook to skip it; replacing it here drops the
+            # only reference, so it is freed immediately rather than held until GC.
             self.transformer = EnhancedMetricTransformer(
                 fault_catalog=self.fault_catalog,
                 production_service=self.production_service
@@ -88,117 +265,205 @@ class EnhancedTelemetryPoller(TelemetryPoller):
     async def run(self) -> None:
         """Run enhanced polling loop with production management."""
         self.running = True
+        self._shutdown.clear()
         logger.info(
             "starting_enhanced_poll_loop",
-            interval_s=1.0,  # 1Hz polling
+            interval_s=POLL_INTERVAL,  # 1Hz polling
         )
         
         # Start background task processors
         production_task = asyncio.create_task(self._process_production_events_worker())
         andon_task = asyncio.create_task(self._process_andon_events_worker())
+        log_task = asyncio.create_task(self._log_worker())
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        
+        # One database session is reused across cycles, each cycle committing its own writes
+        session_stack = ExitStack()
+        session = None
+        session_opened_at = 0.0
         
         try:
             while self.running:
-                cycle_start = time.time()
+                cycle_start = loop.time()
+                cycle_start_ns = time.monotonic_ns()
+                deadline += POLL_INTERVAL
                 
                 try:
-                    await self._enhanced_poll_cycle()
+                    # Reopen the poll session periodically so the connection is not held forever
+                    if session is None or cycle_start - session_opened_at >= DB_SESSION_MAX_AGE:
+                        session = None
+                        session_stack.close()
+                        session = session_stack.enter_context(self._get_db_session())
+                        session_opened_at = cycle_start
+                    
+                    await self._enhanced_poll_cycle(session)
                 except Exception as e:
                     logger.error("enhanced_poll_cycle_error", error=str(e))
+                    # Discard just this cycle's writes; reopen the session if that fails too
+                    if session is not None:
+                        try:
+                            session.rollback()
+                        except Exception as rollback_error:
+                            logger.error("enhanced_poll_session_rollback_failed", error=str(rollback_error))
+                            session = None
+                            session_stack.close()
                 
                 # Track cycle time for performance monitoring
-                cycle_duration = time.time() - cycle_start
-                self._track_cycle_time(cycle_duration)
-                
-                # Calculate sleep time to maintain 1Hz
-                sleep_time = max(0, 1.0 - cycle_duration)
+                cycle_duration_ns = time.monotonic_ns() - cycle_start_ns
+                self._track_cycle_time(cycle_duration_ns)
                 
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                else:
+                if cycle_duration_ns >= POLL_INTERVAL_NS:
                     logger.warning(
                         "enhanced_poll_cycle_slow",
-                        duration=cycle_duration,
-                        target=1.0,
+                        duration=cycle_duration_ns / NS_PER_SECOND,
+                        target=POLL_INTERVAL,
                     )
+                
+                now = loop.time()
+                
+                # Skip ticks missed by an overrun rather than running them back to back
+                lag = now - deadline
+                if lag > POLL_INTERVAL:
+                    deadline += int(lag // POLL_INTERVAL) * POLL_INTERVAL
+                
+                # Sleep to the next tick on the fixed phase, so overruns do not accumulate drift
+                await asyncio.sleep(max(0.0, deadline - now))
             
         finally:
-            # Cancel background tasks
-            production_task.cancel()
-            andon_task.cancel()
+            session_stack.close()
+            
+            # Let background workers drain their queues, cancelling any that overrun
+            self._stop_queue_workers()
             
             try:
-                await asyncio.gather(production_task, andon_task, return_exceptions=True)
+                _, pending = await asyncio.wait(
+                    {production_task, andon_task, log_task}, timeout=WORKER_DRAIN_TIMEOUT
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(production_task, andon_task, log_task, return_exceptions=True)
+                
+                # Give notifications raised while draining a chance to go out
+                if self._notification_tasks:
+                    await asyncio.wait(set(self._notification_tasks), timeout=WORKER_DRAIN_TIMEOUT)
             except Exception as e:
                 logger.error("Error cancelling background tasks", error=str(e))
     
-    async def _enhanced_poll_cycle(self) -> None:
-        """Execute enhanced polling cycle with production management."""
+    async def _enhanced_poll_cycle(self, session) -> None:
+        """Execute enhanced polling cycle with production management on the poll loop's session."""
         ts = datetime.utcnow()
         
-        # Get database session
-        with self._get_db_session() as session:
-            # Get metric bindings
-            bagger_bindings = self._get_metric_bindings(session, "BP01.PACK.BAG1")
-            basket_bindings = self._get_metric_bindings(session, "BP01.PACK.BAG1.BL")
-            
-            # Get enhanced context data
-            context_bagger = await self._get_enhanced_context(session, "BP01.PACK.BAG1")
-            context_basket = await self._get_enhanced_context(session, "BP01.PACK.BAG1.BL")
-            
-            # Poll Bagger 1 with enhanced processing
-            bagger_metrics = await self._enhanced_poll_bagger(context_bagger)
-            if bagger_metrics:
-                self.last_bagger_product = bagger_metrics.get("current_product")
-                await self._store_enhanced_metrics(
-                    session,
-                    "BP01.PACK.BAG1",
-                    bagger_metrics,
-                    bagger_bindings,
-                    ts
-                )
-                
-                # Process production events
-                await self._process_equipment_production_events("BP01.PACK.BAG1", bagger_metrics)
+        # Get metric bindings
+        bagger_bindings = self._get_metric_bindings_cached(session, BAGGER_EQUIPMENT_CODE)
+        basket_bindings = self._get_metric_bindings_cached(session, BASKET_LOADER_EQUIPMENT_CODE)
+        
+        # Production context rows are collected per equipment and written in one UPDATE
+        context_updates: List[Tuple[str, Dict[str, Any]]] = []
+        
+        # Get enhanced context data for both equipments concurrently
+        context_bagger, context_basket = await asyncio.gather(
+            self._get_enhanced_context(session, BAGGER_EQUIPMENT_CODE),
+            self._get_enhanced_context(session, BASKET_LOADER_EQUIPMENT_CODE)
+        )
+        
+        # Read Bagger 1 first; the Basket Loader only needs its current product
+        bagger_reading = await self._enhanced_read_bagger(context_bagger)
+        if bagger_reading:
+            self.last_bagger_product = bagger_reading[1].get("current_product")
+        
+        # Finish Bagger 1 processing while polling Basket Loader 1
+        bagger_metrics, basket_metrics = await asyncio.gather(
+            self._enhanced_process_bagger(bagger_reading, context_bagger),
+            self._enhanced_poll_basket_loader(context_basket, self.last_bagger_product)
+        )
+        
+        # Database writes and event queueing stay serial on the cycle's session
+        if bagger_metrics:
+            await self._store_enhanced_metrics(
+                session,
+                BAGGER_EQUIPMENT_CODE,
+                bagger_metrics,
+                bagger_bindings,
+                ts,
+                context_updates
+            )
             
-            # Poll Basket Loader 1 with enhanced processing
-            basket_metrics = await self._enhanced_poll_basket_loader(
-                context_basket,
-                self.last_bagger_product
+            # Process production events
+            await self._process_equipment_production_events(BAGGER_EQUIPMENT_CODE, bagger_metrics, context_bagger, ts)
+        
+        if basket_metrics:
+            await self._store_enhanced_metrics(
+                session,
+                BASKET_LOADER_EQUIPMENT_CODE,
+                basket_metrics,
+                basket_bindings,
+                ts,
+                context_updates
             )
-            if basket_metrics:
-                await self._store_enhanced_metrics(
-                    session,
-                    "BP01.PACK.BAG1.BL",
-                    basket_metrics,
-                    basket_bindings,
-                    ts
-                )
-                
-                # Process production events
-                await self._process_equipment_production_events("BP01.PACK.BAG1.BL", basket_metrics)
             
-            session.commit()
+            # Process production events
+            await self._process_equipment_production_events(BASKET_LOADER_EQUIPMENT_CODE, basket_metrics, context_basket, ts)
+        
+        await self._update_production_context_table(session, context_updates, ts)
+        
+        session.commit()
+
+    def _get_metric_bindings_cached(self, session, equipment_code: str) -> Dict:
+        """Get metric bindings for equipment, reusing them for BINDING_CACHE_TTL seconds."""
+        now = asyncio.get_running_loop().time()
+        cached = self._binding_cache.get(equipment_code)
+        if cached and now - cached[0] < BINDING_CACHE_TTL:
+            return cached[1]
+        
+        bindings = self._get_metric_bindings(session, equipment_code)
+        self._binding_cache[equipment_code] = (now, bindings)
+        return bindings
     
-    async def _enhanced_poll_bagger(self, context_data: Dict) -> Optional[Dict]:
-        """Enhanced Bagger 1 polling with production management."""
+    def invalidate_bindings(self, equipment_code: Optional[str] = None) -> None:
+        """Drop cached metric bindings for one equipment code, or all of them."""
+        if equipment_code is None:
+            self._binding_cache.clear()
+        else:
+            self._binding_cache.pop(equipment_code, None)
+    
+    async def _enhanced_read_bagger(self, context_data: Dict) -> Optional[Tuple[Dict, Dict]]:
+        """Read Bagger 1 PLC tags and transform them into enhanced metrics."""
         try:
-            # Read PLC tags
-            raw_data = self.bagger_mapper.read_all_tags()
+            # Read PLC tags off the event loop; the PLC round-trip blocks
+            raw_data = await asyncio.to_thread(self.bagger_mapper.read_all_tags)
             
             # Transform to enhanced metrics
             metrics = await self.transformer.transform_bagger_metrics(raw_data, context_data)
             
+            return raw_data, metrics
+            
+        except Exception as e:
+            logger.error("enhanced_bagger_poll_failed", error=str(e))
+            return None
+    
+    async def _enhanced_process_bagger(
+        self,
+        reading: Optional[Tuple[Dict, Dict]],
+        context_data: Dict
+    ) -> Optional[Dict]:
+        """Enhanced Bagger 1 post-processing with production management."""
+        if not reading:
+            return None
+        
+        raw_data, metrics = reading
+        try:
             # Update production context
-            await self._update_production_context("BP01.PACK.BAG1", metrics, context_data)
+            await self._update_production_context(BAGGER_EQUIPMENT_CODE, metrics, context_data)
             
             # Detect fault edges
-            fault_bits = raw_data["processed"].get("fault_bits", [False] * 64)
-            edges = self.fault_detector.detect_edges("BP01.PACK.BAG1", fault_bits)
+            fault_bits = raw_data["processed"].get("fault_bits") or _FAULT_BITS_DEFAULT
+            edges = self._detect_fault_edges(BAGGER_EQUIPMENT_CODE, fault_bits)
             
             # Process fault edges with enhanced handling
             if edges:
-                await self._enhanced_process_fault_edges("BP01.PACK.BAG1", edges, metrics)
+                await self._enhanced_process_fault_edges(BAGGER_EQUIPMENT_CODE, edges, metrics, context_data)
             
             return metrics
             
@@ -213,8 +478,8 @@ class EnhancedTelemetryPoller(TelemetryPoller):
     ) -> Optional[Dict]:
         """Enhanced Basket Loader 1 polling with production management."""
         try:
-            # Read PLC tags
-            raw_data = self.basket_loader_mapper.read_all_tags()
+            # Read PLC tags off the event loop; the PLC round-trip blocks
+            raw_data = await asyncio.to_thread(self.basket_loader_mapper.read_all_tags)
             
             # Transform to enhanced metrics
             metrics = await self.transformer.transform_basket_loader_metrics(
@@ -224,7 +489,7 @@ class EnhancedTelemetryPoller(TelemetryPoller):
             )
             
             # Update production context
-            await self._update_production_context("BP01.PACK.BAG1.BL", metrics, context_data)
+            await self._update_production_context(BASKET_LOADER_EQUIPMENT_CODE, metrics, context_data)
             
             return metrics
             
@@ -234,25 +499,12 @@ class EnhancedTelemetryPoller(TelemetryPoller):
     
     async def _get_enhanced_context(self, session, equipment_code: str) -> Dict:
         """Get enhanced context data including production information."""
-        try:
-            # Get basic context
-            basic_context = self._get_context(session, equipment_code)
-            
-            # Get production context
-            production_context = await self.production_context_manager.get_production_context(equipment_code)
-            
-            # Merge contexts
-            enhanced_context = {
-                **basic_context,
-                **production_context,
-                "equipment_code": equipment_code
-            }
-            
-            return enhanced_context
-            
-        except Exception as e:
-            logger.error("Failed to get enhanced context", error=str(e), equipment_code=equipment_code)
-            return self._get_context(session, equipment_code)
+        # Basic and production context live on the same context row, fetched in one query
+        merged_context = await self.production_context_manager.get_merged_context(equipment_code)
+        if merged_context:
+            return merged_context
+        
+        return self._get_context(session, equipment_code)
     
     async def _update_production_context(self, equipment_code: str, metrics: Dict, context_data: Dict):
         """Update production context based on current metrics."""
@@ -280,37 +532,23 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         equipment_code: str,
         metrics: Dict,
         bindings: Dict,
-        ts: datetime
+        ts: datetime,
+        context_updates: List[Tuple[str, Dict[str, Any]]]
     ) -> None:
-        """Store enhanced metrics in database."""
+        """Store enhanced metrics, queueing the production context update on context_updates."""
         try:
             # Store basic metrics using parent method
             await self._store_metrics(session, equipment_code, metrics, bindings, ts)
             
-            # Store enhanced metrics in production context
-            enhanced_metrics = {
-                "production_line_id": metrics.get("production_line_id"),
-                "current_job_id": metrics.get("current_job_id"),
-                "production_schedule_id": metrics.get("production_schedule_id"),
-                "target_quantity": metrics.get("target_quantity"),
-                "actual_quantity": metrics.get("actual_quantity"),
-                "production_efficiency": metrics.get("production_efficiency"),
-                "quality_rate": metrics.get("quality_rate"),
-                "changeover_status": metrics.get("changeover_status"),
-                "enhanced_oee": metrics.get("enhanced_oee"),
-                "enhanced_availability": metrics.get("enhanced_availability"),
-                "enhanced_performance": metrics.get("enhanced_performance"),
-                "enhanced_quality": metrics.get("enhanced_quality"),
-                "is_currently_down": metrics.get("is_currently_down"),
-                "current_downtime_duration": metrics.get("current_downtime_duration"),
-                "downtime_event_id": metrics.get("downtime_event_id"),
-                "downtime_reason": metrics.get("downtime_reason"),
-                "downtime_category": metrics.get("downtime_category"),
-                "downtime_status": metrics.get("downtime_status")
-            }
-            
-            # Update production context table
-            await self._update_production_context_table(session, equipment_code, enhanced_metrics)
+            # Production context table is updated once per cycle for all equipment.
+            # _add_production_metrics always sets the keys, so skip on values: idle
+            # equipment is skipped, except for the one write that clears its row.
+            if any(metrics.get(key) is not None for key in _CONTEXT_UPDATE_KEYS):
+                self._equipment_with_context.add(equipment_code)
+                context_updates.append((equipment_code, metrics))
+            elif equipment_code in self._equipment_with_context:
+                self._equipment_with_context.discard(equipment_code)
+                context_updates.append((equipment_code, metrics))
             
         except Exception as e:
             logger.error(
@@ -320,41 +558,44 @@ class EnhancedTelemetryPoller(TelemetryPoller):
             )
             raise
     
-    async def _update_production_context_table(self, session, equipment_code: str, metrics: Dict):
-        """Update production context table with enhanced metrics."""
+    async def _update_production_context_table(
+        self,
+        session,
+        context_updates: List[Tuple[str, Dict[str, Any]]],
+        ts: datetime
+    ):
+        """Update production context table rows for a poll cycle in one statement."""
+        if not context_updates:
+            return
+        
         try:
-            update_query = """
-            UPDATE factory_telemetry.context 
-            SET 
-                production_line_id = :production_line_id,
-                current_job_id = :current_job_id,
-                production_schedule_id = :production_schedule_id,
-                target_quantity = :target_quantity,
-                actual_quantity = :actual_quantity,
-                production_efficiency = :production_efficiency,
-                quality_rate = :quality_rate,
-                changeover_status = :changeover_status,
-                last_production_update = :last_production_update
-            WHERE equipment_code = :equipment_code
-            """
-            
-            await execute_update(update_query, {
-                "equipment_code": equipment_code,
-                "production_line_id": metrics.get("production_line_id"),
-                "current_job_id": metrics.get("current_job_id"),
-                "production_schedule_id": metrics.get("production_schedule_id"),
-                "target_quantity": metrics.get("target_quantity"),
-                "actual_quantity": metrics.get("actual_quantity"),
-                "production_efficiency": metrics.get("production_efficiency"),
-                "quality_rate": metrics.get("quality_rate"),
-                "changeover_status": metrics.get("changeover_status"),
-                "last_production_update": metrics.get("last_production_update")
+            metrics_list = [metrics for _, metrics in context_updates]
+            await execute_update(_UPDATE_CONTEXTS_STMT, {
+                "equipment_codes": [equipment_code for equipment_code, _ in context_updates],
+                "production_line_ids": [metrics.get("production_line_id") for metrics in metrics_list],
+                "current_job_ids": [metrics.get("current_job_id") for metrics in metrics_list],
+                "production_schedule_ids": [metrics.get("production_schedule_id") for metrics in metrics_list],
+                "target_quantities": [metrics.get("target_quantity") for metrics in metrics_list],
+                "actual_quantities": [metrics.get("actual_quantity") for metrics in metrics_list],
+                "production_efficiencies": [metrics.get("production_efficiency") for metrics in metrics_list],
+                "quality_rates": [metrics.get("quality_rate") for metrics in metrics_list],
+                "changeover_statuses": [metrics.get("changeover_status") for metrics in metrics_list],
+                "last_production_updates": [ts] * len(metrics_list)
             })
             
         except Exception as e:
-            logger.error("Failed to update production context table", error=str(e))
+            logger.error("Failed to update production context table", error=str(e), batch_size=len(context_updates))
     
-    async def _enhanced_process_fault_edges(self, equipment_code: str, edges: List, metrics: Dict):
+    def _detect_fault_edges(self, equipment_code: str, fault_bits) -> List:
+        """Detect fault edges, skipping the per-bit detector while the fault word is unchanged."""
+        fault_word = _pack_fault_word(fault_bits)
+        if self._fault_words.get(equipment_code) == fault_word:
+            return []
+        
+        self._fault_words[equipment_code] = fault_word
+        return self.fault_detector.detect_edges(equipment_code, fault_bits)
+    
+    async def _enhanced_process_fault_edges(self, equipment_code: str, edges: List, metrics: Dict, context_data: Dict):
         """Enhanced fault edge processing with production context."""
         try:
             # Process basic fault edges
@@ -364,216 +605,333 @@ class EnhancedTelemetryPoller(TelemetryPoller):
             for edge in edges:
                 if edge["edge_type"] == "rising" and edge["is_active"]:
                     # New fault detected - trigger production events
-                    await self._handle_fault_detected(equipment_code, edge, metrics)
+                    await self._handle_fault_detected(equipment_code, edge, metrics, context_data)
                 elif edge["edge_type"] == "falling" and not edge["is_active"]:
                     # Fault cleared - trigger recovery events
-                    await self._handle_fault_cleared(equipment_code, edge, metrics)
+                    await self._handle_fault_cleared(equipment_code, edge, metrics, context_data)
             
         except Exception as e:
             logger.error("Enhanced fault edge processing failed", error=str(e))
     
-    async def _handle_fault_detected(self, equipment_code: str, edge: Dict, metrics: Dict):
+    async def _handle_fault_detected(self, equipment_code: str, edge: Dict, metrics: Dict, context_data: Dict):
         """Handle fault detection with production context."""
         try:
             # Add to production events queue
-            production_event = {
-                "type": "fault_detected",
-                "equipment_code": equipment_code,
-                "fault_bit": edge["bit_index"],
-                "timestamp": edge["timestamp"],
-                "metrics": metrics
-            }
-            
-            await self.production_events_queue.put(production_event)
-            
-            logger.info(
-                "Fault detected with production context",
+            self._queue_production_event(ProductionEvent(
+                type="fault_detected",
                 equipment_code=equipment_code,
-                fault_bit=edge["bit_index"]
-            )
+                timestamp=edge["timestamp"],
+                metrics=metrics,
+                fault_bit=edge["bit_index"],
+                line_id=metrics.get("production_line_id"),
+                current_operator=context_data.get("current_operator")
+            ))
+            
+            if self._should_log_fault(equipment_code, edge["bit_index"]):
+                self._defer_log(
+                    "info",
+                    "Fault detected with production context",
+                    equipment_code=equipment_code,
+                    fault_bit=edge["bit_index"]
+                )
             
         except Exception as e:
             logger.error("Failed to handle fault detection", error=str(e))
     
-    async def _handle_fault_cleared(self, equipment_code: str, edge: Dict, metrics: Dict):
+    async def _handle_fault_cleared(self, equipment_code: str, edge: Dict, metrics: Dict, context_data: Dict):
         """Handle fault clearing with production context."""
         try:
             # Add to production events queue
-            production_event = {
-                "type": "fault_cleared",
-                "equipment_code": equipment_code,
-                "fault_bit": edge["bit_index"],
-                "timestamp": edge["timestamp"],
-                "metrics": metrics
-            }
-            
-            await self.production_events_queue.put(production_event)
-            
-            logger.info(
-                "Fault cleared with production context",
+            self._queue_production_event(ProductionEvent(
+                type="fault_cleared",
                 equipment_code=equipment_code,
-                fault_bit=edge["bit_index"]
-            )
+                timestamp=edge["timestamp"],
+                metrics=metrics,
+                fault_bit=edge["bit_index"],
+                line_id=metrics.get("production_line_id"),
+                current_operator=context_data.get("current_operator")
+            ))
+            
+            if self._should_log_fault(equipment_code, edge["bit_index"]):
+                self._defer_log(
+                    "info",
+                    "Fault cleared with production context",
+                    equipment_code=equipment_code,
+                    fault_bit=edge["bit_index"]
+                )
             
         except Exception as e:
             logger.error("Failed to handle fault clearing", error=str(e))
     
-    async def _process_equipment_production_events(self, equipment_code: str, metrics: Dict):
-        """Process production events for equipment."""
+    async def _process_equipment_production_events(
+        self,
+        equipment_code: str,
+        metrics: Dict,
+        context_data: Dict,
+        ts: datetime
+    ):
+        """Process production events for equipment; events share the poll cycle timestamp ts."""
         try:
             # Check for job completion
-            await self._check_job_completion(equipment_code, metrics)
+            await self._check_job_completion(equipment_code, metrics, context_data, ts)
             
             # Check for quality issues
-            await self._check_quality_issues(equipment_code, metrics)
+            await self._check_quality_issues(equipment_code, metrics, context_data, ts)
             
             # Check for changeover events
-            await self._check_changeover_events(equipment_code, metrics)
+            await self._check_changeover_events(equipment_code, metrics, context_data, ts)
             
         except Exception as e:
             logger.error("Failed to process production events", error=str(e), equipment_code=equipment_code)
     
-    async def _check_job_completion(self, equipment_code: str, metrics: Dict):
+    async def _check_job_completion(self, equipment_code: str, metrics: Dict, context_data: Dict, ts: datetime):
         """Check for job completion based on metrics."""
         try:
             target_quantity = metrics.get("target_quantity", 0)
             actual_quantity = metrics.get("actual_quantity", 0)
             
-            if target_quantity > 0 and actual_quantity >= target_quantity:
-                # Job completed
-                completion_event = {
-                    "type": "job_completed",
-                    "equipment_code": equipment_code,
-                    "target_quantity": target_quantity,
-                    "actual_quantity": actual_quantity,
-                    "timestamp": datetime.utcnow()
-                }
-                
-                await self.production_events_queue.put(completion_event)
-                
-                logger.info(
-                    "Job completed detected",
-                    equipment_code=equipment_code,
-                    target_quantity=target_quantity,
-                    actual_quantity=actual_quantity
-                )
+            if target_quantity <= 0 or actual_quantity < target_quantity:
+                return
+            
+            # Job completed
+            self._queue_production_event(ProductionEvent(
+                type="job_completed",
+                equipment_code=equipment_code,
+                timestamp=ts,
+                target_quantity=target_quantity,
+                actual_quantity=actual_quantity,
+                line_id=metrics.get("production_line_id"),
+                current_operator=context_data.get("current_operator")
+            ))
+            
+            self._defer_log(
+                "info",
+                "Job completed detected",
+                equipment_code=equipment_code,
+                target_quantity=target_quantity,
+                actual_quantity=actual_quantity
+            )
                 
         except Exception as e:
             logger.error("Failed to check job completion", error=str(e))
     
-    async def _check_quality_issues(self, equipment_code: str, metrics: Dict):
+    async def _check_quality_issues(self, equipment_code: str, metrics: Dict, context_data: Dict, ts: datetime):
         """Check for quality issues based on metrics."""
         try:
             quality_rate = metrics.get("quality_rate", 100.0)
-            quality_threshold = 95.0  # Configurable threshold
             
-            if quality_rate < quality_threshold:
-                # Quality issue detected
-                quality_event = {
-                    "type": "quality_issue",
-                    "equipment_code": equipment_code,
-                    "quality_rate": quality_rate,
-                    "threshold": quality_threshold,
-                    "timestamp": datetime.utcnow()
-                }
-                
-                await self.production_events_queue.put(quality_event)
-                
-                logger.warning(
-                    "Quality issue detected",
-                    equipment_code=equipment_code,
-                    quality_rate=quality_rate,
-                    threshold=quality_threshold
-                )
+            if quality_rate >= QUALITY_THRESHOLD:
+                return
+            
+            # Quality issue detected
+            self._queue_production_event(ProductionEvent(
+                type="quality_issue",
+                equipment_code=equipment_code,
+                timestamp=ts,
+                quality_rate=quality_rate,
+                threshold=QUALITY_THRESHOLD,
+                line_id=metrics.get("production_line_id"),
+                current_operator=context_data.get("current_operator")
+            ))
+            
+            self._defer_log(
+                "warning",
+                "Quality issue detected",
+                equipment_code=equipment_code,
+                quality_rate=quality_rate,
+                threshold=QUALITY_THRESHOLD
+            )
                 
         except Exception as e:
             logger.error("Failed to check quality issues", error=str(e))
     
-    async def _check_changeover_events(self, equipment_code: str, metrics: Dict):
+    async def _check_changeover_events(self, equipment_code: str, metrics: Dict, context_data: Dict, ts: datetime):
         """Check for changeover events based on metrics."""
         try:
-            changeover_status = metrics.get("changeover_status", "none")
+            event_type = _CHANGEOVER_EVENT_TYPES.get(metrics.get("changeover_status", "none"))
             current_job_id = metrics.get("current_job_id")
             
-            if changeover_status == "in_progress" and current_job_id:
-                # Changeover started
-                changeover_event = {
-                    "type": "changeover_started",
-                    "equipment_code": equipment_code,
-                    "job_id": current_job_id,
-                    "timestamp": datetime.utcnow()
-                }
-                
-                await self.production_events_queue.put(changeover_event)
-                
-            elif changeover_status == "completed" and current_job_id:
-                # Changeover completed
-                changeover_event = {
-                    "type": "changeover_completed",
-                    "equipment_code": equipment_code,
-                    "job_id": current_job_id,
-                    "timestamp": datetime.utcnow()
-                }
-                
-                await self.production_events_queue.put(changeover_event)
+            if event_type is None or not current_job_id:
+                return
+            
+            self._queue_production_event(ProductionEvent(
+                type=event_type,
+                equipment_code=equipment_code,
+                timestamp=ts,
+                job_id=current_job_id,
+                line_id=metrics.get("production_line_id"),
+                current_operator=context_data.get("current_operator")
+            ))
                 
         except Exception as e:
             logger.error("Failed to check changeover events", error=str(e))
     
+    def _queue_production_event(self, event: ProductionEvent) -> None:
+        """Queue a production event without yielding, shedding it if the queue is full."""
+        try:
+            self.production_events_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._dropped_production_events += 1
+    
     async def _process_production_events_worker(self):
-        """Background worker for processing production events."""
-        while self.running:
-            try:
-                # Wait for events with timeout
-                event = await asyncio.wait_for(
-                    self.production_events_queue.get(),
-                    timeout=1.0
-                )
-                
-                await self._process_production_event(event)
-                
-            except asyncio.TimeoutError:
-                # No events, continue
-                continue
-            except Exception as e:
-                logger.error("Error processing production event", error=str(e))
+        """Background worker for processing production events in batches."""
+        await self._run_queue_worker(
+            self.production_events_queue,
+            self._process_production_event_batch,
+            "Error processing production events",
+            max_batch=PRODUCTION_EVENT_BATCH_SIZE
+        )
     
     async def _process_andon_events_worker(self):
         """Background worker for processing Andon events."""
-        while self.running:
+        await self._run_queue_worker(
+            self.andon_events_queue,
+            self._process_andon_event,
+            "Error processing Andon event"
+        )
+    
+    async def _log_worker(self):
+        """Background worker writing deferred log entries."""
+        await self._run_queue_worker(
+            self._log_queue,
+            self._write_log_entry,
+            "Error writing deferred log entry"
+        )
+    
+    def _defer_log(self, level: str, event: str, **fields) -> None:
+        """Queue a log line for the log worker, dropping it if the queue is full."""
+        try:
+            self._log_queue.put_nowait((level, event, fields))
+        except asyncio.QueueFull:
+            self._dropped_log_count += 1
+    
+    def _should_log_fault(self, equipment_code: str, bit_index: int) -> bool:
+        """Rate limit fault log lines to one per FAULT_LOG_INTERVAL per fault bit."""
+        now = asyncio.get_running_loop().time()
+        key = (equipment_code, bit_index)
+        last_logged = self._fault_log_times.get(key)
+        if last_logged is not None and now - last_logged < FAULT_LOG_INTERVAL:
+            return False
+        
+        self._fault_log_times[key] = now
+        return True
+    
+    async def _write_log_entry(self, entry: Tuple[str, str, Dict[str, Any]]):
+        """Write a deferred log entry, reporting any entries dropped since the last one."""
+        if self._dropped_log_count:
+            logger.warning("Deferred log entries dropped", count=self._dropped_log_count)
+            self._dropped_log_count = 0
+        
+        level, event, fields = entry
+        getattr(logger, level)(event, **fields)
+    
+    async def _run_queue_worker(
+        self,
+        queue: asyncio.Queue,
+        handler,
+        error_message: str,
+        max_batch: Optional[int] = None
+    ):
+        """Process queued items until shutdown is signalled, then drain what is left.
+        
+        With max_batch set, the handler receives a list of up to max_batch items:
+        the one that woke the worker plus whatever was already queued behind it.
+        """
+        async def handle(item):
+            if max_batch is not None:
+                item = self._drain_batch(queue, item, max_batch)
             try:
-                # Wait for events with timeout
-                event = await asyncio.wait_for(
-                    self.andon_events_queue.get(),
-                    timeout=1.0
-                )
-                
-                await self._process_andon_event(event)
-                
-            except asyncio.TimeoutError:
-                # No events, continue
-                continue
+                await handler(item)
             except Exception as e:
-                logger.error("Error processing Andon event", error=str(e))
+                logger.error(error_message, error=str(e))
+        
+        while not self._shutdown.is_set():
+            item = await queue.get()
+            if item is _STOP_WORKER:
+                # Left over from an earlier shutdown when not shutting down now
+                continue
+            await handle(item)
+        
+        # Process items queued before shutdown
+        while True:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is not _STOP_WORKER:
+                await handle(item)
+    
+    def _stop_queue_workers(self) -> None:
+        """Signal shutdown and wake any worker blocked on an empty queue."""
+        self._shutdown.set()
+        for queue in (self.production_events_queue, self.andon_events_queue, self._log_queue):
+            try:
+                queue.put_nowait(_STOP_WORKER)
+            except asyncio.QueueFull:
+                # A worker never blocks on a full queue; it sees the shutdown flag next item
+                pass
+    
+    @staticmethod
+    def _drain_batch(queue: asyncio.Queue, first, max_batch: int) -> List:
+        """Collect first plus up to max_batch - 1 items already waiting on the queue."""
+        batch = [first]
+        while len(batch) < max_batch:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            # The worker loop exits on the shutdown flag, so a marker is simply dropped
+            if item is not _STOP_WORKER:
+                batch.append(item)
+        return batch
+    
+    def _fire_notification(self, **notification) -> None:
+        """Send a push notification in the background so event handling does not wait on it."""
+        task = asyncio.create_task(self._send_notification(notification))
+        self._notification_tasks.add(task)
+        task.add_done_callback(self._notification_tasks.discard)
+    
+    async def _send_notification(self, notification: Dict[str, Any]) -> None:
+        """Send a push notification, logging rather than raising on failure."""
+        try:
+            async with self._notification_semaphore:
+                await self.notification_service.send_push_notification(**notification)
+        except Exception as e:
+            logger.warning(
+                "Failed to send push notification",
+                error=str(e),
+                notification_type=notification.get("notification_type")
+            )
+    
+    async def _process_production_event_batch(self, events: List[ProductionEvent]):
+        """Process a batch of production events, equipment concurrently and each equipment in order."""
+        events_by_equipment: Dict[str, List[ProductionEvent]] = {}
+        for event in events:
+            events_by_equipment.setdefault(event.equipment_code, []).append(event)
+        
+        if len(events_by_equipment) == 1:
+            await self._process_equipment_event_sequence(events)
+            return
+        
+        await asyncio.gather(*(
+            self._process_equipment_event_sequence(equipment_events)
+            for equipment_events in events_by_equipment.values()
+        ))
     
-    async def _process_production_event(self, event: Dict):
+    async def _process_equipment_event_sequence(self, events: List[ProductionEvent]):
+        """Process one equipment's production events in the order they were raised."""
+        for event in events:
+            await self._process_production_event(event)
+    
+    async def _process_production_event(self, event: ProductionEvent):
         """Process a production event."""
         try:
-            event_type = event.get("type")
-            equipment_code = event.get("equipment_code")
-            
-            if event_type == "job_completed":
-                await self._handle_job_completion(event)
-            elif event_type == "quality_issue":
-                await self._handle_quality_issue(event)
-            elif event_type == "changeover_started":
-                await self._handle_changeover_started(event)
-            elif event_type == "changeover_completed":
-                await self._handle_changeover_completed(event)
-            elif event_type == "fault_detected":
-                await self._handle_fault_detected_event(event)
-            elif event_type == "fault_cleared":
-                await self._handle_fault_cleared_event(event)
+            event_type = event.type
+            equipment_code = event.equipment_code
+            
+            handler = self._PRODUCTION_EVENT_HANDLERS.get(event_type)
+            if handler is not None:
+                await handler(self, event)
             
             logger.info("Production event processed", event_type=event_type, equipment_code=equipment_code)
             
@@ -589,12 +947,36 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         except Exception as e:
             logger.error("Failed to process Andon event", error=str(e), event=event)
     
-    async def _handle_job_completion(self, event: Dict):
+    def _lookup_fault(self, equipment_code: str, fault_bit: int) -> Tuple[str, str]:
+        """Get the catalog (name, description) for a fault bit, memoized per catalog."""
+        if self.fault_catalog is not self._fault_lookup_catalog:
+            self._fault_lookup_cache.clear()
+            self._fault_lookup_catalog = self.fault_catalog
+        
+        key = (equipment_code, fault_bit)
+        fault = self._fault_lookup_cache.get(key)
+        if fault is None:
+            fault_info = self.fault_catalog.get(equipment_code, {}).get(fault_bit, {})
+            fault = (
+                fault_info.get("name", f"Fault {fault_bit}"),
+                fault_info.get("description", "Unknown fault")
+            )
+            self._fault_lookup_cache[key] = fault
+        return fault
+    
+    async def _event_context(self, event: ProductionEvent) -> Dict:
+        """Line and operator for an event, read from the production context only if the producer had no line."""
+        if event.line_id is not None:
+            return {"production_line_id": event.line_id, "current_operator": event.current_operator or ""}
+        
+        return await self.production_context_manager.get_production_context(event.equipment_code)
+    
+    async def _handle_job_completion(self, event: ProductionEvent):
         """Handle job completion event."""
         try:
-            equipment_code = event.get("equipment_code")
-            target_quantity = event.get("target_quantity")
-            actual_quantity = event.get("actual_quantity")
+            equipment_code = event.equipment_code
+            target_quantity = event.target_quantity
+            actual_quantity = event.actual_quantity
             
             if not equipment_code:
                 return
@@ -626,7 +1008,7 @@ class EnhancedTelemetryPoller(TelemetryPoller):
             
             # Send notification
             if self.notification_service:
-                await self.notification_service.send_push_notification(
+                self._fire_notification(
                     user_id=production_context.get("current_operator", ""),
                     title="Job Completed",
                     body=f"Job {current_job_id} completed on {equipment_code}",
@@ -644,22 +1026,22 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         except Exception as e:
             logger.error("Failed to handle job completion", error=str(e), event=event)
     
-    async def _handle_quality_issue(self, event: Dict):
+    async def _handle_quality_issue(self, event: ProductionEvent):
         """Handle quality issue event."""
         try:
-            equipment_code = event.get("equipment_code")
-            quality_rate = event.get("quality_rate")
-            threshold = event.get("threshold")
+            equipment_code = event.equipment_code
+            quality_rate = event.quality_rate
+            threshold = event.threshold
             
             if not equipment_code:
                 return
             
             # Get production context
-            production_context = await self.production_context_manager.get_production_context(equipment_code)
+            production_context = await self._event_context(event)
             line_id = production_context.get("production_line_id")
             
             # Create Andon event for quality issue
-            if self.andon_service and line_id:
+            if self._andon_emitter and line_id:
                 andon_data = {
                     "line_id": line_id,
                     "equipment_code": equipment_code,
@@ -669,11 +1051,11 @@ class EnhancedTelemetryPoller(TelemetryPoller):
                     "auto_generated": True
                 }
                 
-                await self.andon_service.create_andon_event(andon_data)
+                self._andon_emitter.emit(andon_data)
             
             # Send notification to quality team
             if self.notification_service:
-                await self.notification_service.send_push_notification(
+                self._fire_notification(
                     user_id="quality_team",  # This would be a group or specific user
                     title="Quality Issue Detected",
                     body=f"Quality rate {quality_rate:.1f}% on {equipment_code}",
@@ -697,28 +1079,30 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         except Exception as e:
             logger.error("Failed to handle quality issue", error=str(e), event=event)
     
-    async def _handle_changeover_started(self, event: Dict):
+    async def _handle_changeover_started(self, event: ProductionEvent):
         """Handle changeover started event."""
         try:
-            equipment_code = event.get("equipment_code")
-            job_id = event.get("job_id")
+            equipment_code = event.equipment_code
+            job_id = event.job_id
             
             if not equipment_code:
                 return
             
+            now = datetime.utcnow()
+            
             # Get production context
-            production_context = await self.production_context_manager.get_production_context(equipment_code)
+            production_context = await self._event_context(event)
             line_id = production_context.get("production_line_id")
             
             # Update production context
             await self.production_context_manager.update_equipment_context(equipment_code, {
                 "changeover_status": "in_progress",
-                "changeover_started_at": datetime.utcnow(),
+                "changeover_started_at": now,
                 "current_job_id": job_id
             })
             
             # Create Andon event for changeover
-            if self.andon_service and line_id:
+            if self._andon_emitter and line_id:
                 andon_data = {
                     "line_id": line_id,
                     "equipment_code": equipment_code,
@@ -728,11 +1112,11 @@ class EnhancedTelemetryPoller(TelemetryPoller):
                     "auto_generated": True
                 }
                 
-                await self.andon_service.create_andon_event(andon_data)
+                self._andon_emitter.emit(andon_data)
             
             # Send notification
             if self.notification_service:
-                await self.notification_service.send_push_notification(
+                self._fire_notification(
                     user_id=production_context.get("current_operator", ""),
                     title="Changeover Started",
                     body=f"Changeover started on {equipment_code} for job {job_id}",
@@ -748,15 +1132,17 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         except Exception as e:
             logger.error("Failed to handle changeover started", error=str(e), event=event)
     
-    async def _handle_changeover_completed(self, event: Dict):
+    async def _handle_changeover_completed(self, event: ProductionEvent):
         """Handle changeover completed event."""
         try:
-            equipment_code = event.get("equipment_code")
-            job_id = event.get("job_id")
+            equipment_code = event.equipment_code
+            job_id = event.job_id
             
             if not equipment_code:
                 return
             
+            now = datetime.utcnow()
+            
             # Get production context
             production_context = await self.production_context_manager.get_production_context(equipment_code)
             line_id = production_context.get("production_line_id")
@@ -765,17 +1151,17 @@ class EnhancedTelemetryPoller(TelemetryPoller):
             changeover_started_at = production_context.get("changeover_started_at")
             changeover_duration = None
             if changeover_started_at:
-                changeover_duration = (datetime.utcnow() - changeover_started_at).total_seconds()
+                changeover_duration = (now - changeover_started_at).total_seconds()
             
             # Update production context
             await self.production_context_manager.update_equipment_context(equipment_code, {
                 "changeover_status": "completed",
-                "changeover_completed_at": datetime.utcnow(),
+                "changeover_completed_at": now,
                 "changeover_duration": changeover_duration
             })
             
             # Create Andon event for changeover completion
-            if self.andon_service and line_id:
+            if self._andon_emitter and line_id:
                 andon_data = {
                     "line_id": line_id,
                     "equipment_code": equipment_code,
@@ -785,12 +1171,12 @@ class EnhancedTelemetryPoller(TelemetryPoller):
                     "auto_generated": True
                 }
                 
-                await self.andon_service.create_andon_event(andon_data)
+                self._andon_emitter.emit(andon_data)
             
             # Send notification
             if self.notification_service:
                 duration_text = f" (Duration: {changeover_duration:.1f}s)" if changeover_duration else ""
-                await self.notification_service.send_push_notification(
+                self._fire_notification(
                     user_id=production_context.get("current_operator", ""),
                     title="Changeover Completed",
                     body=f"Changeover completed on {equipment_code} for job {job_id}{duration_text}",
@@ -807,27 +1193,27 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         except Exception as e:
             logger.error("Failed to handle changeover completed", error=str(e), event=event)
     
-    async def _handle_fault_detected_event(self, event: Dict):
+    async def _handle_fault_detected_event(self, event: ProductionEvent):
         """Handle fault detected event."""
         try:
-            equipment_code = event.get("equipment_code")
-            fault_bit = event.get("fault_bit")
-            metrics = event.get("metrics", {})
+            equipment_code = event.equipment_code
+            fault_bit = event.fault_bit
+            metrics = event.metrics or {}
             
             if not equipment_code:
                 return
             
+            now = datetime.utcnow()
+            
             # Get production context
-            production_context = await self.production_context_manager.get_production_context(equipment_code)
+            production_context = await self._event_context(event)
             line_id = production_context.get("production_line_id")
             
             # Get fault information from catalog
-            fault_info = self.fault_catalog.get(equipment_code, {}).get(fault_bit, {})
-            fault_name = fault_info.get("name", f"Fault {fault_bit}")
-            fault_description = fault_info.get("description", "Unknown fault")
+            fault_name, fault_description = self._lookup_fault(equipment_code, fault_bit)
             
             # Create Andon event for fault
-            if self.andon_service and line_id:
+            if self._andon_emitter and line_id:
                 andon_data = {
                     "line_id": line_id,
                     "equipment_code": equipment_code,
@@ -837,11 +1223,11 @@ class EnhancedTelemetryPoller(TelemetryPoller):
                     "auto_generated": True
                 }
                 
-                await self.andon_service.create_andon_event(andon_data)
+                self._andon_emitter.emit(andon_data)
             
             # Send notification to maintenance team
             if self.notification_service:
-                await self.notification_service.send_push_notification(
+                self._fire_notification(
                     user_id="maintenance_team",  # This would be a group or specific user
                     title="Fault Detected",
                     body=f"Fault {fault_name} detected on {equipment_code}",
@@ -853,7 +1239,7 @@ class EnhancedTelemetryPoller(TelemetryPoller):
                 "fault_status": "active",
                 "active_fault_bit": fault_bit,
                 "fault_name": fault_name,
-                "fault_detected_at": datetime.utcnow()
+                "fault_detected_at": now
             })
             
             logger.warning(
@@ -866,32 +1252,33 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         except Exception as e:
             logger.error("Failed to handle fault detected event", error=str(e), event=event)
     
-    async def _handle_fault_cleared_event(self, event: Dict):
+    async def _handle_fault_cleared_event(self, event: ProductionEvent):
         """Handle fault cleared event."""
         try:
-            equipment_code = event.get("equipment_code")
-            fault_bit = event.get("fault_bit")
-            metrics = event.get("metrics", {})
+            equipment_code = event.equipment_code
+            fault_bit = event.fault_bit
+            metrics = event.metrics or {}
             
             if not equipment_code:
                 return
             
+            now = datetime.utcnow()
+            
             # Get production context
             production_context = await self.production_context_manager.get_production_context(equipment_code)
             line_id = production_context.get("production_line_id")
             
             # Get fault information from catalog
-            fault_info = self.fault_catalog.get(equipment_code, {}).get(fault_bit, {})
-            fault_name = fault_info.get("name", f"Fault {fault_bit}")
+            fault_name, _ = self._lookup_fault(equipment_code, fault_bit)
             
             # Calculate fault duration
             fault_detected_at = production_context.get("fault_detected_at")
             fault_duration = None
             if fault_detected_at:
-                fault_duration = (datetime.utcnow() - fault_detected_at).total_seconds()
+                fault_duration = (now - fault_detected_at).total_seconds()
             
             # Create Andon event for fault cleared
-            if self.andon_service and line_id:
+            if self._andon_emitter and line_id:
                 andon_data = {
                     "line_id": line_id,
                     "equipment_code": equipment_code,
@@ -901,12 +1288,12 @@ class EnhancedTelemetryPoller(TelemetryPoller):
                     "auto_generated": True
                 }
                 
-                await self.andon_service.create_andon_event(andon_data)
+                self._andon_emitter.emit(andon_data)
             
             # Send notification
             if self.notification_service:
                 duration_text = f" (Duration: {fault_duration:.1f}s)" if fault_duration else ""
-                await self.notification_service.send_push_notification(
+                self._fire_notification(
                     user_id="maintenance_team",
                     title="Fault Cleared",
                     body=f"Fault {fault_name} cleared on {equipment_code}{duration_text}",
@@ -918,7 +1305,7 @@ class EnhancedTelemetryPoller(TelemetryPoller):
                 "fault_status": "cleared",
                 "active_fault_bit": None,
                 "fault_name": None,
-                "fault_cleared_at": datetime.utcnow(),
+                "fault_cleared_at": now,
                 "fault_duration": fault_duration
             })
             
@@ -933,20 +1320,44 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         except Exception as e:
             logger.error("Failed to handle fault cleared event", error=str(e), event=event)
     
-    def _track_cycle_time(self, cycle_duration: float):
-        """Track poll cycle times for performance monitoring."""
-        self.poll_cycle_times.append(cycle_duration)
+    # Production event type -> handler, dispatched by _process_production_event
+    _PRODUCTION_EVENT_HANDLERS: ClassVar[Dict[str, Callable[..., Awaitable[None]]]] = {
+        "job_completed": _handle_job_completion,
+        "quality_issue": _handle_quality_issue,
+        "changeover_started": _handle_changeover_started,
+        "changeover_completed": _handle_changeover_completed,
+        "fault_detected": _handle_fault_detected_event,
+        "fault_cleared": _handle_fault_cleared_event,
+    }
+    
+    def _track_cycle_time(self, cycle_duration_ns: int):
+        """Track poll cycle times (integer nanoseconds) for performance monitoring."""
+        # The bounded deque evicts the oldest sample; keep the running total in step
+        if len(self.poll_cycle_times) == self.poll_cycle_times.maxlen:
+            self._poll_cycle_time_total -= self.poll_cycle_times[0]
+        self.poll_cycle_times.append(cycle_duration_ns)
+        self._poll_cycle_time_total += cycle_duration_ns
         
-        # Keep only recent cycle times
-        if len(self.poll_cycle_times) > self.max_cycle_time_history:
-            self.poll_cycle_times.pop(0)
+        sample = self._poll_cycle_count
+        self._poll_cycle_count += 1
+        oldest_in_window = sample - self.max_cycle_time_history + 1
+        while self._poll_cycle_min and self._poll_cycle_min[-1][1] >= cycle_duration_ns:
+            self._poll_cycle_min.pop()
+        self._poll_cycle_min.append((sample, cycle_duration_ns))
+        if self._poll_cycle_min[0][0] < oldest_in_window:
+            self._poll_cycle_min.popleft()
+        while self._poll_cycle_max and self._poll_cycle_max[-1][1] <= cycle_duration_ns:
+            self._poll_cycle_max.pop()
+        self._poll_cycle_max.append((sample, cycle_duration_ns))
+        if self._poll_cycle_max[0][0] < oldest_in_window:
+            self._poll_cycle_max.popleft()
         
         # Log performance warnings
-        if cycle_duration > 0.8:  # 80% of 1Hz target
+        if cycle_duration_ns > CYCLE_TIME_WARNING_NS:
             logger.warning(
                 "Poll cycle performance warning",
-                duration=cycle_duration,
-                avg_duration=sum(self.poll_cycle_times) / len(self.poll_cycle_times)
+                duration=cycle_duration_ns / NS_PER_SECOND,
+                avg_duration=self._poll_cycle_time_total / len(self.poll_cycle_times) / NS_PER_SECOND
             )
     
     def get_performance_stats(self) -> Dict[str, Any]:
@@ -954,19 +1365,22 @@ class EnhancedTelemetryPoller(TelemetryPoller):
         if not self.poll_cycle_times:
             return {"error": "No cycle time data available"}
         
+        current_ns = self.poll_cycle_times[-1]
         return {
             "total_cycles": len(self.poll_cycle_times),
-            "avg_cycle_time": round(sum(self.poll_cycle_times) / len(self.poll_cycle_times), 3),
-            "min_cycle_time": round(min(self.poll_cycle_times), 3),
-            "max_cycle_time": round(max(self.poll_cycle_times), 3),
-            "current_cycle_time": round(self.poll_cycle_times[-1], 3) if self.poll_cycle_times else 0,
-            "performance_status": "good" if self.poll_cycle_times[-1] < 0.8 else "degraded" if self.poll_cycle_times[-1] < 1.0 else "poor"
+            "dropped_production_events": self._dropped_production_events,
+            "avg_cycle_time": round(self._poll_cycle_time_total / len(self.poll_cycle_times) / NS_PER_SECOND, 3),
+            "min_cycle_time": round(self._poll_cycle_min[0][1] / NS_PER_SECOND, 3),
+            "max_cycle_time": round(self._poll_cycle_max[0][1] / NS_PER_SECOND, 3),
+            "current_cycle_time": round(current_ns / NS_PER_SECOND, 3),
+            "performance_status": "good" if current_ns < CYCLE_TIME_WARNING_NS else "degraded" if current_ns < POLL_INTERVAL_NS else "poor"
         }
     
     async def shutdown(self) -> None:
         """Gracefully shutdown the enhanced poller."""
         logger.info("shutting_down_enhanced_poller")
         self.running = False
+        self._stop_queue_workers()
         
         # Call parent shutdown
         await super().shutdown()
@@ -984,62 +1398,99 @@ class ProductionContextManager:
     
     def __init__(self, production_service: ProductionLineService):
         self.production_service = production_service
-        self.context_cache = {}
         self.cache_ttl = 300  # 5 minutes
+        self.context_cache: TTLCache = TTLCache(maxsize=PRODUCTION_CONTEXT_CACHE_SIZE, ttl=self.cache_ttl)
+        # Equipment without a context row, remembered briefly so lookups do not hit the database every time
+        self._missing_contexts: TTLCache = TTLCache(
+            maxsize=PRODUCTION_CONTEXT_CACHE_SIZE, ttl=MISSING_CONTEXT_TTL
+        )
+        # Cache misses within a short window are fetched together in one query
+        self._context_batcher = ContextBatcher(wait_time=CONTEXT_LOOKUP_BATCH_WAIT)
+        self._inflight_contexts: Dict[str, asyncio.Future] = {}
+        # Context updates merged per equipment and written behind by _flush_pending_updates,
+        # which is started on demand because the manager may be built outside a running loop
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
     
     async def get_production_context(self, equipment_code: str) -> Dict:
         """Get production context for equipment."""
-        try:
-            # Check cache first
-            cache_key = f"{equipment_code}_{datetime.now().strftime('%Y%m%d%H%M')}"
-            if cache_key in self.context_cache:
-                return self.context_cache[cache_key]
-            
-            # Get from database
-            context_query = """
-            SELECT 
-                c.current_job_id,
-                c.production_schedule_id,
-                c.production_line_id,
-                c.target_speed,
-                c.current_product_type_id,
-                c.shift_id,
-                c.target_quantity,
-                c.actual_quantity,
-                c.production_efficiency,
-                c.quality_rate,
-                c.changeover_status,
-                c.current_operator,
-                c.current_shift
-            FROM factory_telemetry.context c
-            WHERE c.equipment_code = :equipment_code
-            """
-            
-            result = await execute_query(context_query, {"equipment_code": equipment_code})
-            
-            if result:
-                context = result[0]
-                self.context_cache[cache_key] = context
-                return context
-            
+        # Check cache first
+        context = self.context_cache.get(equipment_code)
+        if context is not None:
+            return context
+        if equipment_code in self._missing_contexts:
             return {}
-            
+        
+        # Concurrent misses for the same equipment share one lookup
+        fetch = self._inflight_contexts.get(equipment_code)
+        if fetch is None:
+            fetch = asyncio.ensure_future(self._fetch_production_context(equipment_code))
+            self._inflight_contexts[equipment_code] = fetch
+            fetch.add_done_callback(lambda _: self._inflight_contexts.pop(equipment_code, None))
+        
+        try:
+            # Shielded so one cancelled caller does not cancel the fetch for the others
+            return await asyncio.shield(fetch)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error("Failed to get production context", error=str(e), equipment_code=equipment_code)
             return {}
     
-    async def update_equipment_context(self, equipment_code: str, context_data: Dict):
-        """Update equipment context with production information."""
+    async def _fetch_production_context(self, equipment_code: str) -> Dict:
+        """Fetch production context through the batcher and cache the outcome."""
+        context = await self._context_batcher.get(equipment_code)
+        
+        if context:
+            self.context_cache[equipment_code] = context
+        else:
+            self._missing_contexts[equipment_code] = True
+        return context
+    
+    async def get_merged_context(self, equipment_code: str) -> Dict:
+        """Get the full context row (basic and production fields) for equipment."""
         try:
-            # Update context table
-            context_update = {
-                "equipment_code": equipment_code,
-                **context_data,
-                "updated_at": datetime.utcnow()
-            }
+            row = await execute_single_row(
+                "SELECT c.* FROM factory_telemetry.context c WHERE c.equipment_code = :equipment_code",
+                {"equipment_code": equipment_code}
+            )
+            
+            if row is None:
+                return {}
             
-            # This would typically call a database function
-            logger.info("Production context updated", equipment_code=equipment_code, updates=context_data)
+            return {**row._mapping, "equipment_code": equipment_code}
             
         except Exception as e:
-            logger.error("Failed to update equipment context", error=str(e), equipment_code=equipment_code)
+            logger.error("Failed to get merged context", error=str(e), equipment_code=equipment_code)
+            return {}
+    
+    async def update_equipment_context(self, equipment_code: str, context_data: Dict):
+        """Update equipment context with production information.
+        
+        Updates are merged per equipment (last writer wins per field) and written
+        once per CONTEXT_UPDATE_FLUSH_INTERVAL.
+        """
+        self._pending_updates.setdefault(equipment_code, {}).update(context_data)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending_updates())
+    
+    async def _flush_pending_updates(self):
+        """Write the updates merged over one flush interval, one write per equipment."""
+        await asyncio.sleep(CONTEXT_UPDATE_FLUSH_INTERVAL)
+        pending, self._pending_updates = self._pending_updates, {}
+        
+        updated_at = datetime.utcnow()
+        for equipment_code, context_data in pending.items():
+            try:
+                # Update context table
+                context_update = {
+                    "equipment_code": equipment_code,
+                    **context_data,
+                    "updated_at": updated_at
+                }
+                
+                # This would typically call a database function
+                logger.info("Production context updated", equipment_code=equipment_code, updates=context_data)
+                
+            except Exception as e:
+                logger.error("Failed to update equipment context", error=str(e), equipment_code=equipment_code)
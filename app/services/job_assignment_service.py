@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 from uuid import UUID
 import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import execute_query, execute_scalar, execute_update, get_db_session
 from app.models.production import (
@@ -427,10 +428,14 @@ class JobAssignmentService:
             logger.error("Failed to get user jobs", error=str(e), user_id=user_id)
             raise BusinessLogicError("Failed to get user jobs")
     
-    async def get_job_assignment(self, assignment_id: UUID) -> JobAssignmentResponse:
-        """Get a job assignment by ID."""
+    async def get_job_assignment(
+        self, 
+        assignment_id: UUID, 
+        session: Optional[AsyncSession] = None
+    ) -> JobAssignmentResponse:
+        """Get a job assignment by ID, optionally on the caller's database session."""
         try:
-            assignment = await self._get_job_assignment(assignment_id)
+            assignment = await self._get_job_assignment(assignment_id, session=session)
             return self._format_job_assignment_response(assignment)
             
         except NotFoundError:
@@ -534,7 +539,11 @@ class JobAssignmentService:
             logger.error("Failed to get job statistics", error=str(e))
             raise BusinessLogicError("Failed to get job statistics")
     
-    async def _get_job_assignment(self, assignment_id: UUID) -> Dict[str, Any]:
+    async def _get_job_assignment(
+        self, 
+        assignment_id: UUID, 
+        session: Optional[AsyncSession] = None
+    ) -> Dict[str, Any]:
         """Get job assignment details from database."""
         query = """
         SELECT ja.id, ja.schedule_id, ja.user_id, ja.assigned_at, ja.accepted_at,
@@ -543,7 +552,7 @@ class JobAssignmentService:
         WHERE ja.id = :assignment_id
         """
         
-        result = await execute_query(query, {"assignment_id": assignment_id})
+        result = await execute_query(query, {"assignment_id": assignment_id}, session=session)
         
         if not result:
             raise NotFoundError("Job assignment", str(assignment_id))
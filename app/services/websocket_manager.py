@@ -445,15 +445,41 @@ class WebSocketManager:
     # Message sending methods
     async def send_personal_message(self, message: dict, connection_id: str):
         """Send a message to a specific connection."""
+        if connection_id in self.connections:
+            await self.send_text(json.dumps(message), connection_id)
+    
+    async def send_text(self, text: str, connection_id: str):
+        """Send an already serialized message to a specific connection."""
         if connection_id in self.connections:
             websocket = self.connections[connection_id]
             try:
-                await websocket.send_text(json.dumps(message))
+                await websocket.send_text(text)
             except Exception as e:
                 logger.error("Failed to send personal message", 
                            error=str(e), connection_id=connection_id)
                 self.remove_connection(connection_id)
     
+    def get_downtime_recipients(self, line_id: str = None, equipment_code: str = None) -> Set[str]:
+        """Get connections that receive a downtime event for the given line and equipment."""
+        recipients = set()
+        
+        # Downtime-specific subscribers
+        if line_id:
+            recipients.update(self.downtime_subscriptions.get(line_id, ()))
+        if equipment_code:
+            recipients.update(self.downtime_subscriptions.get(equipment_code, ()))
+        for connection_id, subscriptions in self.subscriptions.items():
+            if any(sub.startswith("downtime:all:all") for sub in subscriptions):
+                recipients.add(connection_id)
+        
+        # General line and equipment subscribers
+        if line_id:
+            recipients.update(self.line_subscriptions.get(line_id, ()))
+        if equipment_code:
+            recipients.update(self.equipment_subscriptions.get(equipment_code, ()))
+        
+        return recipients
+    
     async def send_to_user(self, message: dict, user_id: str):
         """Send a message to all connections for a specific user."""
         if user_id in self.user_connections:
@@ -123,7 +123,7 @@ class ExternalServiceError(MS5Exception):
             message=f"{service}: {message}",
             error_code="EXTERNAL_SERVICE_ERROR",
             status_code=status.HTTP_502_BAD_GATEWAY,
-            details={"service": service, **details or {}}
+            details={"service": service, **(details or {})}
         )
 
 
@@ -160,7 +160,7 @@ class ProductionLineError(MS5Exception):
             message=f"Line {line_id}: {message}",
             error_code="PRODUCTION_LINE_ERROR",
             status_code=status.HTTP_400_BAD_REQUEST,
-            details={"line_id": line_id, **details or {}}
+            details={"line_id": line_id, **(details or {})}
         )
 
 
@@ -172,7 +172,7 @@ class JobAssignmentError(MS5Exception):
             message=f"Job {job_id}: {message}",
             error_code="JOB_ASSIGNMENT_ERROR",
             status_code=status.HTTP_400_BAD_REQUEST,
-            details={"job_id": job_id, **details or {}}
+            details={"job_id": job_id, **(details or {})}
         )
 
 
@@ -196,7 +196,7 @@ class AndonError(MS5Exception):
             message=f"Andon event {event_id}: {message}",
             error_code="ANDON_ERROR",
             status_code=status.HTTP_400_BAD_REQUEST,
-            details={"event_id": event_id, **details or {}}
+            details={"event_id": event_id, **(details or {})}
         )
 
 
@@ -208,7 +208,7 @@ class EquipmentError(MS5Exception):
             message=f"Equipment {equipment_code}: {message}",
             error_code="EQUIPMENT_ERROR",
             status_code=status.HTTP_400_BAD_REQUEST,
-            details={"equipment_code": equipment_code, **details or {}}
+            details={"equipment_code": equipment_code, **(details or {})}
         )
 
 
@@ -220,7 +220,7 @@ class ReportGenerationError(MS5Exception):
             message=f"{report_type} report: {message}",
             error_code="REPORT_GENERATION_ERROR",
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            details={"report_type": report_type, **details or {}}
+            details={"report_type": report_type, **(details or {})}
         )
 
 
@@ -0,0 +1,8 @@
+-- MS5.0 Floor Dashboard - Checklist template equipment index
+--
+-- Supports the `equipment_codes && :equipment_codes` overlap filter used by
+-- ChecklistService.list_checklist_templates and
+-- ChecklistService.get_checklist_template_for_equipment.
+
+CREATE INDEX IF NOT EXISTS idx_checklist_templates_equipment_codes_gin
+    ON factory_telemetry.checklist_templates USING GIN (equipment_codes);
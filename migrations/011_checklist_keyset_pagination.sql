@@ -0,0 +1,11 @@
+-- MS5.0 Floor Dashboard - Checklist keyset pagination indexes
+--
+-- Match the (sort column, id) ordering used by cursor-based paging in
+-- ChecklistService.list_checklist_templates and
+-- ChecklistService.list_checklist_completions.
+
+CREATE INDEX IF NOT EXISTS idx_checklist_templates_created_at_id
+    ON factory_telemetry.checklist_templates (created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_checklist_completions_completed_at_id
+    ON factory_telemetry.checklist_completions (completed_at DESC, id DESC);
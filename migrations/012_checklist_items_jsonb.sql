@@ -0,0 +1,24 @@
+-- MS5.0 Floor Dashboard - Checklist items as JSONB
+--
+-- Stores checklist_items as JSONB and enforces its shape in the database so
+-- ChecklistService only has to check item semantics. Also indexes the
+-- fields used by list_checklist_templates filters.
+
+ALTER TABLE factory_telemetry.checklist_templates
+    ALTER COLUMN checklist_items TYPE JSONB USING checklist_items::jsonb,
+    ALTER COLUMN checklist_items SET NOT NULL;
+
+-- Non-empty array whose elements are all objects (CASE guards the array-only functions)
+ALTER TABLE factory_telemetry.checklist_templates
+    ADD CONSTRAINT chk_checklist_items_shape CHECK (
+        CASE WHEN jsonb_typeof(checklist_items) = 'array' THEN
+            jsonb_array_length(checklist_items) > 0
+            AND NOT jsonb_path_exists(checklist_items, '$[*] ? (@.type() != "object")')
+        ELSE false END
+    );
+
+CREATE INDEX IF NOT EXISTS idx_checklist_templates_name
+    ON factory_telemetry.checklist_templates (name);
+
+CREATE INDEX IF NOT EXISTS idx_checklist_templates_item_count
+    ON factory_telemetry.checklist_templates (jsonb_array_length(checklist_items));
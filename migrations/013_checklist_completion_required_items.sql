@@ -0,0 +1,34 @@
+-- MS5.0 Floor Dashboard - Checklist completion required-item trigger
+--
+-- Rejects checklist completions whose responses omit a required item of the
+-- referenced template. Per-type response checks stay in ChecklistService.
+
+CREATE OR REPLACE FUNCTION factory_telemetry.check_checklist_completion_required_items()
+RETURNS TRIGGER AS $$
+DECLARE
+    missing_item TEXT;
+BEGIN
+    SELECT item->>'id' INTO missing_item
+    FROM factory_telemetry.checklist_templates t,
+         jsonb_array_elements(t.checklist_items) AS item
+    WHERE t.id = NEW.template_id
+      AND (item->>'required')::boolean
+      AND NOT (NEW.responses::jsonb ? (item->>'id'))
+    LIMIT 1;
+
+    IF missing_item IS NOT NULL THEN
+        RAISE EXCEPTION 'Required checklist item % not completed', missing_item
+            USING ERRCODE = 'check_violation';
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_checklist_completion_required_items
+    ON factory_telemetry.checklist_completions;
+
+CREATE TRIGGER trg_checklist_completion_required_items
+    BEFORE INSERT ON factory_telemetry.checklist_completions
+    FOR EACH ROW
+    EXECUTE FUNCTION factory_telemetry.check_checklist_completion_required_items();
@@ -0,0 +1,12 @@
+-- MS5.0 Floor Dashboard - Checklist template equipment count column
+--
+-- Stores the number of equipment codes per template so
+-- ChecklistService.get_checklist_template_for_equipment can order by an
+-- indexed column instead of computing array_length() for every row.
+
+ALTER TABLE factory_telemetry.checklist_templates
+    ADD COLUMN IF NOT EXISTS equipment_codes_len INTEGER
+    GENERATED ALWAYS AS (COALESCE(array_length(equipment_codes, 1), 0)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_checklist_templates_enabled_specificity
+    ON factory_telemetry.checklist_templates (enabled, equipment_codes_len DESC, created_at DESC);
@@ -0,0 +1,13 @@
+-- MS5.0 Floor Dashboard - Downtime event start_time indexes
+--
+-- DowntimeTracker.get_downtime_events and get_downtime_statistics filter on a
+-- half-open start_time range per line. The composite index covers the listing
+-- columns so most filters are answered from the index; the BRIN index keeps
+-- wide date-range statistics scans cheap on large, append-mostly tables.
+
+CREATE INDEX IF NOT EXISTS idx_downtime_events_line_start_time
+    ON factory_telemetry.downtime_events (line_id, start_time DESC)
+    INCLUDE (equipment_code, category, status, duration_seconds, reason_code);
+
+CREATE INDEX IF NOT EXISTS idx_downtime_events_start_time_brin
+    ON factory_telemetry.downtime_events USING BRIN (start_time);
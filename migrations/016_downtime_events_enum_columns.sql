@@ -0,0 +1,33 @@
+-- MS5.0 Floor Dashboard - Downtime event category/status as enums
+--
+-- category and status only ever hold a handful of values, so store them as
+-- 4-byte enum labels instead of repeated text; this shrinks the row, the WAL
+-- and the indexes that include them (see 015). reason_code stays text because
+-- operators can report free-form codes through the downtime API.
+
+DO $$
+BEGIN
+    CREATE TYPE factory_telemetry.downtime_category AS ENUM (
+        'planned', 'unplanned', 'changeover', 'maintenance', 'material'
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+DO $$
+BEGIN
+    CREATE TYPE factory_telemetry.downtime_status AS ENUM ('open', 'closed');
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- The text default cannot be cast automatically, so drop and restore it
+ALTER TABLE factory_telemetry.downtime_events
+    ALTER COLUMN status DROP DEFAULT;
+
+ALTER TABLE factory_telemetry.downtime_events
+    ALTER COLUMN category TYPE factory_telemetry.downtime_category
+        USING category::factory_telemetry.downtime_category,
+    ALTER COLUMN status TYPE factory_telemetry.downtime_status
+        USING status::factory_telemetry.downtime_status;
+
+ALTER TABLE factory_telemetry.downtime_events
+    ALTER COLUMN status SET DEFAULT 'open';
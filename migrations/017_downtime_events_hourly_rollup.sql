@@ -0,0 +1,110 @@
+-- MS5.0 Floor Dashboard - Hourly downtime event rollup
+--
+-- DowntimeTracker.get_downtime_statistics aggregates per reason, per day and
+-- per category. Rather than scanning raw downtime_events on every request, a
+-- trigger keeps one row per (line, equipment, reason, category, hour) up to
+-- date and the statistics query sums those rows instead.
+--
+-- duration_count tracks how many events in the bucket have a duration, so the
+-- average still ignores open events the way AVG(duration_seconds) did.
+
+CREATE TABLE IF NOT EXISTS factory_telemetry.downtime_events_hourly (
+    line_id UUID NOT NULL,
+    equipment_code TEXT NOT NULL,
+    reason_code TEXT NOT NULL,
+    category factory_telemetry.downtime_category NOT NULL,
+    hour_bucket TIMESTAMPTZ NOT NULL,
+    reason_description TEXT,
+    event_count INTEGER NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,
+    total_duration_seconds BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (line_id, hour_bucket, equipment_code, reason_code, category)
+);
+
+CREATE INDEX IF NOT EXISTS idx_downtime_events_hourly_hour_bucket
+    ON factory_telemetry.downtime_events_hourly (hour_bucket);
+
+CREATE OR REPLACE FUNCTION factory_telemetry.apply_downtime_event_hourly(
+    p_line_id UUID,
+    p_equipment_code TEXT,
+    p_reason_code TEXT,
+    p_reason_description TEXT,
+    p_category factory_telemetry.downtime_category,
+    p_start_time TIMESTAMPTZ,
+    p_duration_seconds INTEGER,
+    p_sign INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO factory_telemetry.downtime_events_hourly (
+        line_id, equipment_code, reason_code, category, hour_bucket,
+        reason_description, event_count, duration_count, total_duration_seconds
+    )
+    VALUES (
+        p_line_id, p_equipment_code, p_reason_code, p_category,
+        date_trunc('hour', p_start_time), p_reason_description, p_sign,
+        CASE WHEN p_duration_seconds IS NULL THEN 0 ELSE p_sign END,
+        COALESCE(p_duration_seconds, 0) * p_sign
+    )
+    ON CONFLICT (line_id, hour_bucket, equipment_code, reason_code, category) DO UPDATE SET
+        reason_description = COALESCE(EXCLUDED.reason_description, downtime_events_hourly.reason_description),
+        event_count = downtime_events_hourly.event_count + EXCLUDED.event_count,
+        duration_count = downtime_events_hourly.duration_count + EXCLUDED.duration_count,
+        total_duration_seconds = downtime_events_hourly.total_duration_seconds + EXCLUDED.total_duration_seconds;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION factory_telemetry.rollup_downtime_event_hourly()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Back out the old row's contribution before adding the new one
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM factory_telemetry.apply_downtime_event_hourly(
+            OLD.line_id, OLD.equipment_code, OLD.reason_code, NULL,
+            OLD.category, OLD.start_time, OLD.duration_seconds, -1
+        );
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM factory_telemetry.apply_downtime_event_hourly(
+            NEW.line_id, NEW.equipment_code, NEW.reason_code, NEW.reason_description,
+            NEW.category, NEW.start_time, NEW.duration_seconds, 1
+        );
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_downtime_events_hourly_rollup
+    ON factory_telemetry.downtime_events;
+
+-- Only the columns the rollup depends on fire the trigger, so the frequent
+-- fault_data/context_data updates on open events skip it
+CREATE TRIGGER trg_downtime_events_hourly_rollup
+    AFTER INSERT OR DELETE OR UPDATE OF
+        line_id, equipment_code, reason_code, reason_description,
+        category, start_time, duration_seconds
+    ON factory_telemetry.downtime_events
+    FOR EACH ROW
+    EXECUTE FUNCTION factory_telemetry.rollup_downtime_event_hourly();
+
+-- Backfill from existing events
+TRUNCATE factory_telemetry.downtime_events_hourly;
+
+INSERT INTO factory_telemetry.downtime_events_hourly (
+    line_id, equipment_code, reason_code, category, hour_bucket,
+    reason_description, event_count, duration_count, total_duration_seconds
+)
+SELECT
+    line_id,
+    equipment_code,
+    reason_code,
+    category,
+    date_trunc('hour', start_time),
+    MAX(reason_description),
+    COUNT(*),
+    COUNT(duration_seconds),
+    COALESCE(SUM(duration_seconds), 0)
+FROM factory_telemetry.downtime_events
+GROUP BY line_id, equipment_code, reason_code, category, date_trunc('hour', start_time);
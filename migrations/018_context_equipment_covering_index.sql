@@ -0,0 +1,15 @@
+-- MS5.0 Floor Dashboard - Production context covering index
+--
+-- EnhancedMetricTransformer looks up production context by equipment_code
+-- (one code, or a batch via ANY(:equipment_codes)) and reads the columns
+-- below. Including them lets a cache miss be answered by an index-only scan
+-- instead of a heap fetch per row.
+
+CREATE INDEX IF NOT EXISTS idx_context_equipment_covering
+    ON factory_telemetry.context (equipment_code)
+    INCLUDE (
+        current_job_id, production_schedule_id, production_line_id,
+        target_speed, current_product_type_id, shift_id, target_quantity,
+        actual_quantity, production_efficiency, quality_rate,
+        changeover_status, current_operator, current_shift
+    );
@@ -0,0 +1,148 @@
+"""
+Unit tests for bulk Andon event creation.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services import andon_service as andon_service_module
+from app.services.andon_service import AndonService
+
+
+def _created_row(priority: str) -> SimpleNamespace:
+    return SimpleNamespace(_mapping={
+        "id": uuid4(),
+        "line_id": uuid4(),
+        "equipment_code": "BP01.PACK.BAG1",
+        "event_type": "stop",
+        "priority": priority,
+        "description": "Fault detected",
+        "reported_by": None,
+        "reported_at": datetime(2024, 1, 1, 8, 0, 0),
+        "status": "open"
+    })
+
+
+def _andon_event(priority: str) -> dict:
+    return {
+        "line_id": uuid4(),
+        "equipment_code": "BP01.PACK.BAG1",
+        "event_type": "stop",
+        "priority": priority,
+        "description": "Fault detected"
+    }
+
+
+async def _noop(*args):
+    pass
+
+
+@pytest.mark.asyncio
+async def test_create_andon_events_casts_to_enum_columns(monkeypatch):
+    queries = []
+    
+    async def fake_execute_query(query, params):
+        queries.append(query)
+        return []
+    
+    monkeypatch.setattr(andon_service_module, "execute_query", fake_execute_query)
+    
+    await AndonService.create_andon_events([{
+        "line_id": uuid4(),
+        "equipment_code": "BP01.PACK.BAG1",
+        "event_type": "stop",
+        "priority": "high",
+        "description": "Fault detected"
+    }])
+    
+    assert "CAST(:event_types AS factory_telemetry.andon_event_type[])" in queries[0]
+    assert "CAST(:priorities AS factory_telemetry.andon_priority[])" in queries[0]
+    assert "text[]), CAST(:priorities" not in queries[0]
+
+
+@pytest.mark.asyncio
+async def test_create_andon_events_keeps_the_earliest_in_batch_duplicate(monkeypatch):
+    queries = []
+    
+    async def fake_execute_query(query, params):
+        queries.append(query)
+        return []
+    
+    monkeypatch.setattr(andon_service_module, "execute_query", fake_execute_query)
+    
+    await AndonService.create_andon_events([_andon_event("high"), _andon_event("low")])
+    
+    assert "WITH ORDINALITY AS e(line_id, equipment_code, event_type, priority, description, ord)" in queries[0]
+    assert "ORDER BY e.line_id, e.equipment_code, e.event_type, e.ord" in queries[0]
+
+
+@pytest.mark.asyncio
+async def test_create_andon_events_retries_row_by_row_after_batch_failure(monkeypatch):
+    """One event the enum rejects is dropped without losing the rest of the batch."""
+    calls = []
+    
+    async def fake_execute_query(query, params):
+        calls.append(params["event_types"])
+        if "upstream" in params["event_types"]:
+            raise RuntimeError('invalid input value for enum andon_event_type: "upstream"')
+        return [_created_row(priority) for priority in params["priorities"]]
+    
+    monkeypatch.setattr(andon_service_module, "execute_query", fake_execute_query)
+    monkeypatch.setattr(AndonService, "_start_escalation_process", staticmethod(_noop))
+    monkeypatch.setattr(AndonService, "_send_andon_notification", staticmethod(_noop))
+    
+    created = await AndonService.create_andon_events([
+        _andon_event("critical"),
+        {**_andon_event("low"), "event_type": "upstream"},
+        _andon_event("high")
+    ])
+    
+    assert calls == [["stop", "upstream", "stop"], ["stop"], ["upstream"], ["stop"]]
+    assert [event["priority"] for event in created] == ["critical", "high"]
+
+
+@pytest.mark.asyncio
+async def test_create_andon_events_single_event_failure_raises(monkeypatch):
+    async def fake_execute_query(query, params):
+        raise RuntimeError("connection lost")
+    
+    monkeypatch.setattr(andon_service_module, "execute_query", fake_execute_query)
+    
+    with pytest.raises(andon_service_module.BusinessLogicError):
+        await AndonService.create_andon_events([_andon_event("high")])
+
+
+@pytest.mark.asyncio
+async def test_create_andon_events_runs_follow_ups_concurrently(monkeypatch):
+    rows = [_created_row("high"), _created_row("low"), _created_row("critical")]
+    in_flight = 0
+    peak_in_flight = 0
+    
+    async def fake_execute_query(query, params):
+        return rows
+    
+    async def track_concurrency(*args):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+    
+    monkeypatch.setattr(andon_service_module, "execute_query", fake_execute_query)
+    monkeypatch.setattr(AndonService, "_start_escalation_process", staticmethod(track_concurrency))
+    monkeypatch.setattr(AndonService, "_send_andon_notification", staticmethod(track_concurrency))
+    
+    created = await AndonService.create_andon_events([{
+        "line_id": uuid4(),
+        "equipment_code": "BP01.PACK.BAG1",
+        "event_type": "stop",
+        "priority": "high",
+        "description": "Fault detected"
+    }])
+    
+    assert [event["id"] for event in created] == [row._mapping["id"] for row in rows]
+    assert peak_in_flight == 2 * len(rows)
@@ -0,0 +1,132 @@
+"""
+Unit tests for ChecklistService template caching.
+"""
+
+import asyncio
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.services import checklist_service as checklist_service_module
+from app.services.checklist_service import ChecklistService
+
+
+def _template_row(template_id, name: str = "Pre-start", equipment_codes=("BP01.PACK.BAG1",)) -> dict:
+    return {
+        "id": template_id,
+        "name": name,
+        "equipment_codes": list(equipment_codes),
+        "checklist_items": [{"id": "guard", "type": "checkbox", "required": True}],
+        "enabled": True,
+        "created_at": datetime(2024, 1, 1, 8, 0, 0)
+    }
+
+
+@pytest.fixture
+def lagging_replica(monkeypatch):
+    """A replica that still serves the pre-update template; cache fills must not use it."""
+    async def stale_execute_query_ro(query, params=None):
+        raise AssertionError("template cache filled from the read replica")
+    
+    monkeypatch.setattr(checklist_service_module, "execute_query_ro", stale_execute_query_ro)
+
+
+@pytest.mark.asyncio
+async def test_template_cache_refills_from_the_primary_after_a_write(monkeypatch, lagging_replica):
+    template_id = uuid4()
+    names = iter(["Pre-start", "Pre-start v2"])
+    
+    async def fake_execute_query(query, params=None):
+        return [_template_row(template_id, name=next(names))]
+    
+    monkeypatch.setattr(checklist_service_module, "execute_query", fake_execute_query)
+    service = ChecklistService()
+    
+    assert (await service.get_checklist_template(template_id)).name == "Pre-start"
+    service._invalidate_template_cache()
+    assert (await service.get_checklist_template(template_id)).name == "Pre-start v2"
+
+
+@pytest.mark.asyncio
+async def test_equipment_template_cache_fills_from_the_primary(monkeypatch, lagging_replica):
+    template_id = uuid4()
+    
+    async def fake_execute_query(query, params=None):
+        return [_template_row(template_id)]
+    
+    monkeypatch.setattr(checklist_service_module, "execute_query", fake_execute_query)
+    
+    template = await ChecklistService().get_checklist_template_for_equipment(["BP01.PACK.BAG1"])
+    
+    assert template.id == template_id
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_for_one_template_share_a_query(monkeypatch):
+    template_id = uuid4()
+    queries = []
+    
+    async def fake_execute_query(query, params=None):
+        queries.append(params)
+        await asyncio.sleep(0)
+        return [_template_row(template_id)]
+    
+    monkeypatch.setattr(checklist_service_module, "execute_query", fake_execute_query)
+    service = ChecklistService()
+    
+    templates = await asyncio.gather(*(service.get_checklist_template(template_id) for _ in range(5)))
+    
+    assert len(queries) == 1
+    assert {template.id for template in templates} == {template_id}
+
+
+@pytest.mark.asyncio
+async def test_slow_template_load_does_not_block_other_keys(monkeypatch):
+    slow_id, fast_id = uuid4(), uuid4()
+    release_slow = asyncio.Event()
+    
+    async def fake_execute_query(query, params=None):
+        if params["template_id"] == slow_id:
+            await release_slow.wait()
+        return [_template_row(params["template_id"])]
+    
+    monkeypatch.setattr(checklist_service_module, "execute_query", fake_execute_query)
+    service = ChecklistService()
+    
+    slow = asyncio.ensure_future(service.get_checklist_template(slow_id))
+    await asyncio.sleep(0)
+    
+    fast = await asyncio.wait_for(service.get_checklist_template(fast_id), timeout=1)
+    assert fast.id == fast_id
+    assert not slow.done()
+    
+    release_slow.set()
+    assert (await slow).id == slow_id
+
+
+@pytest.mark.asyncio
+async def test_misses_after_an_invalidation_do_not_join_an_older_load(monkeypatch):
+    template_id = uuid4()
+    release_first = asyncio.Event()
+    names = iter(["Pre-start", "Pre-start v2"])
+    
+    async def fake_execute_query(query, params=None):
+        name = next(names)
+        if name == "Pre-start":
+            await release_first.wait()
+        return [_template_row(template_id, name=name)]
+    
+    monkeypatch.setattr(checklist_service_module, "execute_query", fake_execute_query)
+    service = ChecklistService()
+    
+    before_write = asyncio.ensure_future(service.get_checklist_template(template_id))
+    await asyncio.sleep(0)
+    service._invalidate_template_cache()
+    
+    after_write = await asyncio.wait_for(service.get_checklist_template(template_id), timeout=1)
+    release_first.set()
+    
+    assert after_write.name == "Pre-start v2"
+    assert (await before_write).name == "Pre-start"
+    assert (await service.get_checklist_template(template_id)).name == "Pre-start v2"
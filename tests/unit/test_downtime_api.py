@@ -0,0 +1,75 @@
+"""
+Unit tests for the downtime detection endpoint.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.api.v1.downtime import detect_downtime_events
+from app.services import downtime_tracker as downtime_tracker_module
+
+
+@pytest.fixture
+def current_user():
+    return SimpleNamespace(user_id=uuid4(), has_permission=lambda permission: True)
+
+
+@pytest.fixture
+def stored_event_id(monkeypatch):
+    event_id = uuid4()
+    
+    async def fake_execute_query(query, params):
+        return [SimpleNamespace(ord=1, id=event_id)]
+    
+    async def fake_broadcast(payloads):
+        pass
+    
+    monkeypatch.setattr(downtime_tracker_module, "execute_query", fake_execute_query)
+    monkeypatch.setattr(downtime_tracker_module, "broadcast_downtime_events_bulk", fake_broadcast)
+    return event_id
+
+
+@pytest.mark.asyncio
+async def test_detect_returns_serializable_event_with_id(current_user, stored_event_id):
+    line_id = uuid4()
+    
+    response = await detect_downtime_events(
+        line_id=line_id,
+        equipment_code="BP01.PACK.BAG1",
+        current_status={"running": False, "speed": 0.0},
+        timestamp=None,
+        current_user=current_user,
+        db=None
+    )
+    
+    assert response["event_detected"] is True
+    event = response["event"]
+    assert event["id"] == stored_event_id
+    assert event["line_id"] == line_id
+    assert event["status"] == "open"
+    assert not any(key.startswith("_") for key in event)
+    
+    body = jsonable_encoder(response)
+    assert body["event"]["id"] == str(stored_event_id)
+    
+    # The endpoint's tracker is discarded; its broadcast loop must finish on its own
+    others = asyncio.all_tasks() - {asyncio.current_task()}
+    await asyncio.wait_for(asyncio.gather(*others), timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_detect_without_stop_returns_no_event(current_user, stored_event_id):
+    response = await detect_downtime_events(
+        line_id=uuid4(),
+        equipment_code="BP01.PACK.BAG1",
+        current_status={"running": True, "speed": 1.0},
+        timestamp=None,
+        current_user=current_user,
+        db=None
+    )
+    
+    assert response == {"event_detected": False, "event": None}
@@ -0,0 +1,259 @@
+"""
+Unit tests for DowntimeTracker batched event inserts.
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.services import downtime_tracker as downtime_tracker_module
+from app.services.downtime_tracker import DowntimeTracker
+from app.utils.exceptions import BusinessLogicError
+
+
+def _event(equipment_code: str, reason_code: str = "UNKNOWN") -> dict:
+    return {
+        "line_id": uuid4(),
+        "equipment_code": equipment_code,
+        "start_time": datetime(2024, 1, 1, 8, 0, 0),
+        "reason_code": reason_code,
+        "reason_description": "Equipment stopped",
+        "category": "unplanned",
+        "subcategory": None,
+        "reported_by": None,
+        "fault_data": {},
+        "context_data": {}
+    }
+
+
+def _patch_database(monkeypatch, fast_flush: bool = False):
+    """Patch out the insert and broadcast; inserted events get ids in batch order."""
+    async def fake_execute_query(query, params):
+        return [SimpleNamespace(ord=ordinal, id=uuid4()) for ordinal in range(1, len(params["line_ids"]) + 1)]
+    
+    async def fake_execute_update(query, params):
+        pass
+    
+    async def fake_broadcast(payloads):
+        pass
+    
+    monkeypatch.setattr(downtime_tracker_module, "execute_query", fake_execute_query)
+    monkeypatch.setattr(downtime_tracker_module, "execute_update", fake_execute_update)
+    monkeypatch.setattr(downtime_tracker_module, "broadcast_downtime_events_bulk", fake_broadcast)
+    if fast_flush:
+        monkeypatch.setattr(downtime_tracker_module, "ASYNC_INSERT_WAIT_TIME", 0)
+        monkeypatch.setattr(downtime_tracker_module, "DIRTY_EVENT_FLUSH_INTERVAL", 0)
+        monkeypatch.setattr(downtime_tracker_module, "BROADCAST_FLUSH_INTERVAL", 0)
+
+
+async def _flush_loops_finished(tracker: DowntimeTracker) -> None:
+    """Wait for every flush loop the tracker started to return on its own."""
+    tasks = [
+        task for task in (
+            tracker._insert_flush_task, tracker._update_flush_task, tracker._broadcast_flush_task
+        )
+        if task is not None
+    ]
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=2)
+
+
+def _pending(events):
+    loop = asyncio.get_running_loop()
+    return [(event, loop.create_future()) for event in events]
+
+
+@pytest.mark.asyncio
+async def test_flush_inserts_maps_ids_by_batch_position(monkeypatch):
+    """Two events for the same equipment get their own ids whatever order rows come back in."""
+    first_id, second_id, other_id = uuid4(), uuid4(), uuid4()
+    
+    async def fake_execute_query(query, params):
+        assert params["equipment_codes"] == ["BP01.PACK.BAG1", "BP01.PACK.BAG1", "BP01.PACK.BAG2"]
+        return [
+            SimpleNamespace(ord=3, id=other_id),
+            SimpleNamespace(ord=2, id=second_id),
+            SimpleNamespace(ord=1, id=first_id)
+        ]
+    
+    monkeypatch.setattr(downtime_tracker_module, "execute_query", fake_execute_query)
+    
+    batch = _pending([_event("BP01.PACK.BAG1"), _event("BP01.PACK.BAG1"), _event("BP01.PACK.BAG2")])
+    await DowntimeTracker()._flush_inserts(batch)
+    
+    assert [future.result() for _, future in batch] == [first_id, second_id, other_id]
+
+
+@pytest.mark.asyncio
+async def test_flush_inserts_rejects_rows_missing_from_result(monkeypatch):
+    event_id = uuid4()
+    
+    async def fake_execute_query(query, params):
+        return [SimpleNamespace(ord=1, id=event_id)]
+    
+    monkeypatch.setattr(downtime_tracker_module, "execute_query", fake_execute_query)
+    
+    batch = _pending([_event("BP01.PACK.BAG1"), _event("BP01.PACK.BAG2")])
+    await DowntimeTracker()._flush_inserts(batch)
+    
+    assert batch[0][1].result() == event_id
+    assert isinstance(batch[1][1].exception(), downtime_tracker_module.BusinessLogicError)
+
+
+@pytest.mark.asyncio
+async def test_flush_inserts_retries_row_by_row_after_batch_failure(monkeypatch):
+    """A single bad event fails on its own instead of taking the whole batch with it."""
+    good_ids = iter([uuid4(), uuid4()])
+    calls = []
+    
+    async def fake_execute_query(query, params):
+        calls.append(params["reason_codes"])
+        if "BAD" in params["reason_codes"]:
+            raise RuntimeError("invalid input value for enum")
+        return [SimpleNamespace(ord=1, id=next(good_ids))]
+    
+    monkeypatch.setattr(downtime_tracker_module, "execute_query", fake_execute_query)
+    
+    batch = _pending([
+        _event("BP01.PACK.BAG1"),
+        _event("BP01.PACK.BAG2", reason_code="BAD"),
+        _event("BP01.PACK.BAG3")
+    ])
+    await DowntimeTracker()._flush_inserts(batch)
+    
+    assert calls == [["UNKNOWN", "BAD", "UNKNOWN"], ["UNKNOWN"], ["BAD"], ["UNKNOWN"]]
+    assert batch[0][1].exception() is None
+    assert isinstance(batch[1][1].exception(), RuntimeError)
+    assert batch[2][1].exception() is None
+    assert batch[0][1].result() != batch[2][1].result()
+
+
+@pytest.mark.asyncio
+async def test_background_start_returns_public_event_and_keeps_persist_task(monkeypatch):
+    """Without wait_for_persist the event comes back before its id, and bookkeeping stays internal."""
+    event_id = uuid4()
+    
+    async def fake_execute_query(query, params):
+        return [SimpleNamespace(ord=1, id=event_id)]
+    
+    async def fake_broadcast(payloads):
+        pass
+    
+    monkeypatch.setattr(downtime_tracker_module, "execute_query", fake_execute_query)
+    monkeypatch.setattr(downtime_tracker_module, "broadcast_downtime_events_bulk", fake_broadcast)
+    
+    tracker = DowntimeTracker()
+    event = await tracker.detect_downtime_event(
+        uuid4(), "BP01.PACK.BAG1", {"running": False, "speed": 0.0}, datetime(2024, 1, 1, 8, 0, 0)
+    )
+    
+    assert event["id"] is None
+    assert not any(key.startswith("_") for key in event)
+    
+    tracked = tracker.active_events["BP01.PACK.BAG1"]
+    await tracked["_persist_task"]
+    assert tracked["id"] == event_id
+    
+    await _flush_loops_finished(tracker)
+
+
+@pytest.mark.asyncio
+async def test_per_request_trackers_leave_no_tasks_behind(monkeypatch):
+    """Flush loops return once idle, so throwaway trackers do not leak background tasks."""
+    _patch_database(monkeypatch, fast_flush=True)
+    stopped = {"running": False, "speed": 0.0, "fault_count": 0}
+    
+    trackers = []
+    for index in range(50):
+        tracker = DowntimeTracker()
+        equipment_code = f"BP01.PACK.BAG{index}"
+        await tracker.detect_downtime_event(
+            uuid4(), equipment_code, stopped, datetime(2024, 1, 1, 8, 0, 0), wait_for_persist=True
+        )
+        # A changed fault count marks the event dirty and starts the update loop too
+        await tracker.detect_downtime_event(
+            uuid4(), equipment_code, {**stopped, "fault_count": 1}, datetime(2024, 1, 1, 8, 0, 1)
+        )
+        trackers.append(tracker)
+    
+    for tracker in trackers:
+        await _flush_loops_finished(tracker)
+    
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+def test_extracted_defaults_are_fresh_per_call():
+    # chunk25-6: partial statuses must not share mutable default containers
+    tracker = DowntimeTracker()
+
+    first = tracker._extract_fault_data({"fault_count": 1})
+    second = tracker._extract_fault_data({})
+    first["fault_bits"].append(3)
+    assert second["fault_bits"] == []
+    assert first["fault_count"] == 1
+
+    context = tracker._extract_context_data({"speed": 1.5})
+    other = tracker._extract_context_data({})
+    context["environmental_conditions"]["humidity"] = 40
+    assert other["environmental_conditions"] == {}
+    assert context["speed"] == 1.5 and other["speed"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_closes_close_the_event_once(monkeypatch):
+    """chunk25-16: two running ticks racing on a still-persisting event close it exactly once."""
+    _patch_database(monkeypatch, fast_flush=True)
+    closes = []
+    
+    async def fake_execute_update(query, params):
+        closes.append(params["event_id"])
+    
+    monkeypatch.setattr(downtime_tracker_module, "execute_update", fake_execute_update)
+    
+    tracker = DowntimeTracker()
+    line_id = uuid4()
+    stopped = {"running": False, "speed": 0.0}
+    running = {"running": True, "speed": 1.0}
+    await tracker.detect_downtime_event(line_id, "BP01.PACK.BAG1", stopped, datetime(2024, 1, 1, 8, 0, 0))
+    
+    # Both closes start while the insert for the start is still queued
+    first, second = await asyncio.gather(
+        tracker.detect_downtime_event(line_id, "BP01.PACK.BAG1", running, datetime(2024, 1, 1, 8, 5, 0)),
+        tracker.detect_downtime_event(line_id, "BP01.PACK.BAG1", running, datetime(2024, 1, 1, 8, 5, 0)),
+    )
+    
+    assert len(closes) == 1
+    assert [event for event in (first, second) if event is not None] == [
+        {**(first or second), "status": "closed", "duration_seconds": 300}
+    ]
+    assert "BP01.PACK.BAG1" not in tracker.active_events
+    
+    await _flush_loops_finished(tracker)
+
+
+@pytest.mark.asyncio
+async def test_failed_close_keeps_the_event_open(monkeypatch):
+    """chunk25-16: a close whose update fails leaves the event active for the next tick."""
+    _patch_database(monkeypatch, fast_flush=True)
+    
+    async def failing_execute_update(query, params):
+        raise RuntimeError("connection reset")
+    
+    tracker = DowntimeTracker()
+    line_id = uuid4()
+    await tracker.detect_downtime_event(
+        line_id, "BP01.PACK.BAG1", {"running": False, "speed": 0.0},
+        datetime(2024, 1, 1, 8, 0, 0), wait_for_persist=True
+    )
+    monkeypatch.setattr(downtime_tracker_module, "execute_update", failing_execute_update)
+    
+    with pytest.raises(BusinessLogicError):
+        await tracker.detect_downtime_event(
+            line_id, "BP01.PACK.BAG1", {"running": True, "speed": 1.0}, datetime(2024, 1, 1, 8, 5, 0)
+        )
+    
+    assert tracker.active_events["BP01.PACK.BAG1"]["status"] == "open"
+    
+    await _flush_loops_finished(tracker)
@@ -0,0 +1,91 @@
+"""
+Unit tests for EnhancedMetricTransformer production context updates and its Andon emitter.
+"""
+
+from uuid import uuid4
+
+import pytest
+from cachetools import TTLCache
+
+from app.models.production import AndonEventType, AndonPriority
+from app.services import enhanced_metric_transformer as transformer_module
+from app.services.enhanced_metric_transformer import _ANDON_REASON_MAP, AndonEmitter, EnhancedMetricTransformer
+
+
+@pytest.fixture
+def transformer():
+    # Bypass the service wiring; only the production context cache is exercised
+    transformer = EnhancedMetricTransformer.__new__(EnhancedMetricTransformer)
+    transformer.production_context_cache = TTLCache(maxsize=16, ttl=300)
+    transformer.production_context_cache["BP01.PACK.BAG1"] = {"current_job_id": None}
+    return transformer
+
+
+def test_reason_map_only_produces_valid_andon_values():
+    for event_type, priority in _ANDON_REASON_MAP.values():
+        assert event_type in {value.value for value in AndonEventType}
+        assert priority in {value.value for value in AndonPriority}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("field, value", [("event_type", "upstream"), ("priority", "urgent")])
+async def test_emit_skips_events_the_enum_columns_reject(field, value):
+    emitter = AndonEmitter(andon_service=None)
+    
+    emitter.emit({
+        "line_id": uuid4(),
+        "equipment_code": "BP01.PACK.BAG1",
+        "event_type": "stop",
+        "priority": "low",
+        "description": "Upstream stop",
+        field: value
+    })
+    
+    assert emitter._queue.empty()
+    assert emitter._flush_task is None
+
+
+@pytest.mark.asyncio
+async def test_update_production_context_writes_the_row_before_notifying(monkeypatch, transformer):
+    statements = []
+    
+    async def fake_execute_update(query, params):
+        statements.append((query, params))
+        return 1
+    
+    monkeypatch.setattr(transformer_module, "execute_update", fake_execute_update)
+    job_id = uuid4()
+    
+    await transformer.update_production_context(
+        "BP01.PACK.BAG1", {"current_job_id": job_id, "not_a_column": 1}
+    )
+    
+    [(query, params)] = statements
+    assert query.index("UPDATE factory_telemetry.context") < query.index("pg_notify")
+    assert "SET current_job_id = :current_job_id" in query
+    assert "not_a_column" not in query
+    assert params["current_job_id"] == job_id
+    assert params["channel"] == transformer_module.CONTEXT_CHANGED_CHANNEL
+    assert "BP01.PACK.BAG1" not in transformer.production_context_cache
+
+
+@pytest.mark.asyncio
+async def test_update_production_context_keeps_the_cache_when_the_write_fails(monkeypatch, transformer):
+    async def failing_execute_update(query, params):
+        raise RuntimeError("connection lost")
+    
+    monkeypatch.setattr(transformer_module, "execute_update", failing_execute_update)
+    
+    await transformer.update_production_context("BP01.PACK.BAG1", {"current_job_id": uuid4()})
+    
+    assert transformer.production_context_cache["BP01.PACK.BAG1"] == {"current_job_id": None}
+
+
+@pytest.mark.asyncio
+async def test_update_production_context_without_known_fields_writes_nothing(monkeypatch, transformer):
+    async def unexpected_execute_update(query, params):
+        raise AssertionError("no statement expected")
+    
+    monkeypatch.setattr(transformer_module, "execute_update", unexpected_execute_update)
+    
+    await transformer.update_production_context("BP01.PACK.BAG1", {"not_a_column": 1})
@@ -0,0 +1,152 @@
+"""
+Unit tests for EnhancedTelemetryPoller production context writes.
+"""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.enhanced_telemetry_poller import _CONTEXT_UPDATE_KEYS, EnhancedTelemetryPoller
+
+
+def _metrics(**context) -> dict:
+    """Poll metrics as _add_production_metrics leaves them: every context key present."""
+    metrics = {"speed_real": 0.0, "running_status": False}
+    metrics.update(dict.fromkeys(_CONTEXT_UPDATE_KEYS))
+    metrics.update(context)
+    return metrics
+
+
+@pytest.fixture
+def poller():
+    # Bypass the PLC connection setup; only the context-update bookkeeping is exercised
+    poller = EnhancedTelemetryPoller.__new__(EnhancedTelemetryPoller)
+    poller._equipment_with_context = set()
+    poller._store_metrics = AsyncMock()
+    return poller
+
+
+async def _store(poller, equipment_code: str, metrics: dict) -> list:
+    context_updates = []
+    await poller._store_enhanced_metrics(
+        None, equipment_code, metrics, {}, datetime(2024, 1, 1, 8, 0, 0), context_updates
+    )
+    return context_updates
+
+
+@pytest.mark.asyncio
+async def test_metrics_without_context_values_skip_the_update(poller):
+    assert await _store(poller, "BP01.PACK.BAG1", _metrics()) == []
+
+
+@pytest.mark.asyncio
+async def test_metrics_with_a_context_value_are_queued(poller):
+    metrics = _metrics(current_job_id="0b0e5c8e-7c4d-4a43-9d52-1f0c7b1f6a11")
+    
+    assert await _store(poller, "BP01.PACK.BAG1", metrics) == [("BP01.PACK.BAG1", metrics)]
+
+
+@pytest.mark.asyncio
+async def test_context_row_is_cleared_once_when_context_goes_away(poller):
+    await _store(poller, "BP01.PACK.BAG1", _metrics(actual_quantity=120))
+    
+    cleared = _metrics()
+    assert await _store(poller, "BP01.PACK.BAG1", cleared) == [("BP01.PACK.BAG1", cleared)]
+    assert await _store(poller, "BP01.PACK.BAG1", _metrics()) == []
+
+
+def _worker_poller(production_max_size: int = 0) -> EnhancedTelemetryPoller:
+    # Only the queues and the shutdown flag the workers run on
+    poller = EnhancedTelemetryPoller.__new__(EnhancedTelemetryPoller)
+    poller.production_events_queue = asyncio.Queue(maxsize=production_max_size)
+    poller.andon_events_queue = asyncio.Queue()
+    poller._log_queue = asyncio.Queue()
+    poller._shutdown = asyncio.Event()
+    return poller
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_wakes_and_exits_on_shutdown():
+    """chunk27-2: a worker blocked on an empty queue exits once shutdown is signalled."""
+    poller = _worker_poller()
+    handled = []
+    
+    async def handler(item):
+        handled.append(item)
+    
+    worker = asyncio.create_task(poller._run_queue_worker(poller.andon_events_queue, handler, "failed"))
+    poller.andon_events_queue.put_nowait("first")
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    
+    poller._stop_queue_workers()
+    await asyncio.wait_for(worker, timeout=1)
+    
+    assert handled == ["first"]
+    assert poller.andon_events_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_worker_drains_items_queued_before_shutdown_and_drops_the_marker():
+    """chunk27-2: batches never contain the stop marker, and queued items are still handled."""
+    poller = _worker_poller()
+    batches = []
+    
+    async def handler(batch):
+        batches.append(batch)
+    
+    for item in range(3):
+        poller.production_events_queue.put_nowait(item)
+    poller._stop_queue_workers()
+    poller.production_events_queue.put_nowait(3)
+    
+    await asyncio.wait_for(
+        poller._run_queue_worker(poller.production_events_queue, handler, "failed", max_batch=10),
+        timeout=1
+    )
+    
+    assert batches == [[0, 1, 2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_worker_on_a_full_queue_exits_without_a_marker():
+    """chunk27-2: when the marker cannot be queued, the shutdown flag still stops the worker."""
+    poller = _worker_poller(production_max_size=2)
+    handled = []
+    
+    async def handler(item):
+        handled.append(item)
+    
+    poller.production_events_queue.put_nowait("a")
+    poller.production_events_queue.put_nowait("b")
+    poller._stop_queue_workers()
+    
+    await asyncio.wait_for(
+        poller._run_queue_worker(poller.production_events_queue, handler, "failed"), timeout=1
+    )
+    
+    assert handled == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_stale_marker_does_not_stop_a_restarted_worker():
+    """chunk27-2: a marker left from an earlier shutdown is skipped while running."""
+    poller = _worker_poller()
+    poller._stop_queue_workers()
+    poller._shutdown.clear()
+    handled = []
+    
+    async def handler(item):
+        handled.append(item)
+    
+    worker = asyncio.create_task(poller._run_queue_worker(poller._log_queue, handler, "failed"))
+    poller._log_queue.put_nowait("entry")
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert not worker.done()
+    
+    poller._stop_queue_workers()
+    await asyncio.wait_for(worker, timeout=1)
+    assert handled == ["entry"]